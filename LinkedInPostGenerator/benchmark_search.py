@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Benchmark the research-phase search tools offline, against the local
+corpus backend with injected latency and failures.
+
+    python benchmark_search.py --synthetic 20000 --latency-ms 300 --failure-rate 0.1
+    python benchmark_search.py --import-jsonl my_corpus.jsonl --topics 20
+"""
+
+import argparse
+import json
+import os
+import random
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+TOPICS = [
+    "AI agents", "large language models", "platform engineering", "quantum computing",
+    "edge computing", "cybersecurity", "developer productivity", "multimodal AI",
+    "cloud-native architecture", "AI safety", "vector databases", "green computing",
+]
+
+FILLER = (
+    "latest trends breakthrough innovations industry impact best practices future "
+    "predictions case studies expert insights adoption enterprise teams research "
+    "benchmark open source tooling costs productivity risk governance"
+).split()
+
+
+def synthetic_documents(count: int, seed: int = 42):
+    """Documents about TOPICS with random filler, shaped like search results."""
+    rng = random.Random(seed)
+    for i in range(count):
+        topic = rng.choice(TOPICS)
+        words = rng.sample(FILLER, 6)
+        yield {
+            "title": f"{topic.title()}: {' '.join(words[:3])}",
+            "body": f"{topic} {' '.join(words)} " + " ".join(rng.choices(FILLER, k=30)),
+            "href": f"https://example.com/{topic.replace(' ', '-')}/{i}",
+        }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Offline benchmark of multi_query_search")
+    parser.add_argument("--corpus", default="data/search_corpus.db", help="FTS5 corpus database")
+    parser.add_argument("--import-jsonl", help="index documents from this JSONL file first")
+    parser.add_argument("--synthetic", type=int, default=0, help="index this many synthetic documents first")
+    parser.add_argument("--topics", type=int, default=len(TOPICS))
+    parser.add_argument("--queries", type=int, default=5, help="queries per topic")
+    parser.add_argument("--workers", type=int, default=4)
+    parser.add_argument("--latency-ms", type=float, default=200.0)
+    parser.add_argument("--jitter-ms", type=float, default=100.0)
+    parser.add_argument("--failure-rate", type=float, default=0.05)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+
+    # Settings come from the environment; point them at the local backend
+    # and keep the cache out of the measurement.
+    os.environ.update({
+        "SEARCH_BACKEND": "local",
+        "SEARCH_CORPUS_PATH": args.corpus,
+        "SEARCH_MAX_WORKERS": str(args.workers),
+        "SEARCH_LATENCY_MS": str(args.latency_ms),
+        "SEARCH_LATENCY_JITTER_MS": str(args.jitter_ms),
+        "SEARCH_FAILURE_RATE": str(args.failure_rate),
+        "SEARCH_SEED": str(args.seed),
+        "SEARCH_CACHE_MODE": "off",
+    })
+    os.environ.setdefault("ANTHROPIC_API_KEY", "unused-by-search-benchmark")
+
+    from src.tools import get_search_backend, multi_query_search
+
+    backend = get_search_backend()
+    if args.import_jsonl:
+        print(f"Indexed {backend.import_jsonl(args.import_jsonl):,} documents from {args.import_jsonl}")
+    if args.synthetic:
+        print(f"Indexed {backend.add_documents(synthetic_documents(args.synthetic)):,} synthetic documents")
+    print(f"Corpus: {backend.count():,} documents, workers={args.workers}, "
+          f"latency={args.latency_ms}+/-{args.jitter_ms}ms, failure rate={args.failure_rate}\n")
+
+    latencies, statuses = [], {}
+    kept, collapsed = 0, {"url": 0, "near_duplicate": 0}
+    start = time.perf_counter()
+    for topic in (TOPICS * (args.topics // len(TOPICS) + 1))[:args.topics]:
+        t0 = time.perf_counter()
+        result = json.loads(multi_query_search.run(topic=topic, queries_per_topic=args.queries))
+        latencies.append(time.perf_counter() - t0)
+        statuses[result["status"]] = statuses.get(result["status"], 0) + 1
+        kept += len(result["results"])
+        for kind, count in result.get("duplicates_collapsed", {}).items():
+            collapsed[kind] += count
+    elapsed = time.perf_counter() - start
+
+    latencies.sort()
+    print(f"Topics:      {len(latencies)} in {elapsed:.2f}s "
+          f"({len(latencies) * args.queries / elapsed:.1f} queries/s)")
+    print(f"Per topic:   p50={statistics.median(latencies) * 1000:.0f}ms  "
+          f"max={latencies[-1] * 1000:.0f}ms")
+    print(f"Statuses:    {statuses}")
+    print(f"Results:     {kept} kept, {collapsed['url']} same-URL and "
+          f"{collapsed['near_duplicate']} near-duplicate results collapsed")
+
+
+if __name__ == "__main__":
+    main()
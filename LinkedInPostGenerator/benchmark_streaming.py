@@ -0,0 +1,80 @@
+#!/usr/bin/env python3
+"""
+Measure what rendering streamed tokens adds to each chunk, offline.
+
+Chunks are emitted on crewai's event bus exactly as crewai's LLM client
+emits them, from a client without a stream listener (the baseline: the bus
+and crewai's own console echo) and from one whose listener renders to the
+null sink and to the rich console. Console output goes to os.devnull.
+
+    python benchmark_streaming.py --chunks 20000 --token-interval-ms 15
+"""
+
+import argparse
+import contextlib
+import os
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+
+class FakeClient:
+    """Stands in for ClaudeLLM as the source of stream events."""
+
+    def __init__(self, stream_listener=None):
+        self.stream_listener = stream_listener
+
+
+def time_chunks(source, chunks: int, repeat: int) -> float:
+    """Best-of-`repeat` seconds per chunk to emit `chunks` chunk events."""
+    from src.streaming import LLMStreamChunkEvent, crewai_event_bus
+
+    events = [LLMStreamChunkEvent(chunk=f"tok{i % 10} ") for i in range(chunks)]
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        for event in events:
+            crewai_event_bus.emit(source, event)
+        best = min(best, time.perf_counter() - start)
+    return best / chunks
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Per-chunk cost of rendering streamed tokens")
+    parser.add_argument("--chunks", type=int, default=20000)
+    parser.add_argument("--repeat", type=int, default=5)
+    parser.add_argument("--token-interval-ms", type=float, default=15.0,
+                        help="typical gap between tokens from the model")
+    args = parser.parse_args()
+
+    os.environ.setdefault("ANTHROPIC_API_KEY", "unused-by-streaming-benchmark")
+
+    from src.streaming import DraftStreamer
+    from src.utils.console import RichSink, console
+    from src.utils.sinks import NullSink, set_output_sink
+
+    results = {}
+    with open(os.devnull, "w") as devnull, contextlib.redirect_stdout(devnull):
+        console.file = devnull
+        results["baseline"] = time_chunks(FakeClient(), args.chunks, args.repeat)
+        for name, sink in (("null sink", NullSink()), ("rich sink", RichSink())):
+            set_output_sink(sink)
+            streamer = DraftStreamer()
+            with streamer.streaming("Benchmark"):
+                results[name] = time_chunks(FakeClient(streamer), args.chunks, args.repeat)
+
+    gap = args.token_interval_ms / 1000
+    baseline = results["baseline"]
+    print(f"{args.chunks:,} chunks, best of {args.repeat}\n")
+    for name, per_chunk in results.items():
+        added = per_chunk - baseline
+        print(f"{name:<10} {per_chunk * 1e6:7.2f} us/chunk  "
+              f"added {added * 1e6:6.2f} us  ({added / gap:.3%} of a "
+              f"{args.token_interval_ms:g} ms token gap)")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,89 @@
+#!/usr/bin/env python3
+"""
+Compare the phased and single-crew pipeline modes side by side on the
+same topic: wall-clock time, refinement iterations and token usage per run.
+With --candidates N, the phased mode with N concurrent candidate drafts is
+compared as well.
+
+    python compare_pipeline_modes.py --topic "AI agents in 2026" --runs 2
+    python compare_pipeline_modes.py --candidates 3
+"""
+
+import argparse
+import statistics
+import sys
+import time
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent))
+
+from rich.table import Table
+
+from src.config import configure_settings
+from src.crew_orchestrator import LinkedInPostGenerator
+from src.utils import console, print_header, print_info, print_section
+
+MODES = {
+    "phased": {"pipeline_mode": "phased"},
+    "single_crew": {"pipeline_mode": "single_crew"},
+}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare pipeline modes")
+    parser.add_argument("--topic", default="Latest trends in AI agents and autonomous systems 2026")
+    parser.add_argument("--runs", type=int, default=1, help="runs per mode")
+    parser.add_argument("--iterations", type=int, default=None, help="refinement iterations")
+    parser.add_argument("--candidates", type=int, default=1,
+                        help="also run the phased mode with this many candidate drafts")
+    parser.add_argument("--keep-search-cache", action="store_true",
+                        help="let the second mode reuse cached search results")
+    args = parser.parse_args()
+
+    print_header()
+    # Searches are uncached by default so that both modes pay for research.
+    base = configure_settings(
+        max_iterations=args.iterations,
+        search_cache_mode=None if args.keep_search_cache else "off",
+        output_dir=Path("outputs") / "mode_comparison"
+    )
+
+    # The LLM cache would let later variants replay earlier ones' research.
+    variants = {name: {**overrides, "llm_cache_enabled": False} for name, overrides in MODES.items()}
+    if args.candidates > 1:
+        variants[f"phased x{args.candidates} drafts"] = {
+            "pipeline_mode": "phased", "candidate_drafts": args.candidates, "llm_cache_enabled": False
+        }
+
+    results = {name: [] for name in variants}
+    for run in range(1, args.runs + 1):
+        for name, overrides in variants.items():
+            print_section(f"[COMPARE] Run {run}/{args.runs}: {name}", ">")
+            generator = LinkedInPostGenerator(base.with_overrides(**overrides))
+            start = time.perf_counter()
+            result = generator.generate_post(args.topic)
+            results[name].append((time.perf_counter() - start, result["token_usage"],
+                                  result["refinement"]["iterations"]))
+
+    table = Table(title=f"Pipeline modes ({args.runs} run(s) each)")
+    for column in ("Mode", "Wall time (s)", "Iterations", "Prompt tokens", "Completion tokens",
+                   "Total tokens", "LLM requests"):
+        table.add_column(column, justify="right" if column != "Mode" else "left")
+    for mode, runs in results.items():
+        mean = lambda field: statistics.mean(usage.get(field, 0) for _, usage, _ in runs)
+        table.add_row(
+            mode,
+            f"{statistics.mean(elapsed for elapsed, _, _ in runs):.1f}",
+            f"{statistics.mean(iterations for _, _, iterations in runs):.1f}",
+            f"{mean('prompt_tokens'):,.0f}",
+            f"{mean('completion_tokens'):,.0f}",
+            f"{mean('total_tokens'):,.0f}",
+            f"{mean('successful_requests'):,.0f}",
+        )
+    console.print(table)
+    print_info("The phased mode may stop refining early; single_crew always runs every iteration.")
+
+
+if __name__ == "__main__":
+    main()
@@ -6,26 +6,54 @@ An autonomous multi-agent system that generates engaging LinkedIn posts
 about AI trends and software development topics.
 """
 
+import asyncio
 import click
 import sys
 from pathlib import Path
-from datetime import datetime
+from datetime import datetime, timedelta
+from typing import Optional
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent))
 
-from src.crew_orchestrator import LinkedInPostGenerator
-from src.config import get_settings
+# The generator pulls in crewai, langchain and the search backends, so the
+# commands that need it import it themselves; `examples`, `info` and `setup`
+# start without it. `python verify_setup.py` reports per-module import cost.
+from src.archive import PostArchive, archive_path
+from src.config import Settings, get_settings, configure_settings
+from src.telemetry import aggregate_runs, load_run_log, percentile
 from src.utils import (
+    OUTPUT_FORMATS,
+    RichSink,
     print_header,
     print_section,
     print_success,
     print_error,
     print_info,
+    print_phase_stats,
+    print_post_history,
+    print_final_output,
+    print_summary,
+    create_output_sink,
+    get_output_sink,
+    set_output_sink,
     console
 )
 
 
+def apply_output_format(settings: Settings) -> Settings:
+    """
+    Send all further output to the sink for `settings.output_format`.
+
+    crewai's verbose logging writes straight to the terminal, so it is
+    turned off for the structured and silent formats.
+    """
+    set_output_sink(create_output_sink(settings.output_format, settings.events_path))
+    if settings.output_format != "rich" and settings.verbose:
+        settings = configure_settings(verbose=False)
+    return settings
+
+
 @click.group()
 @click.version_option(version="1.0.0")
 def cli():
@@ -43,28 +71,78 @@ def cli():
 @click.option(
     '--topic',
     '-t',
-    prompt='Enter the topic for your LinkedIn post',
-    help='The topic to generate a LinkedIn post about'
+    default=None,
+    help='The topic to generate a LinkedIn post about (prompted for if omitted)'
+)
+@click.option(
+    '--resume',
+    'resume_run_id',
+    default=None,
+    metavar='RUN_ID',
+    help='Resume an interrupted run, skipping the phases it already completed'
 )
 @click.option(
     '--output-dir',
     '-o',
-    default='outputs',
-    help='Directory to save the generated post (default: outputs)'
+    default=None,
+    type=click.Path(file_okay=False),
+    help='Directory to save the generated post (default: OUTPUT_DIR or outputs)'
 )
 @click.option(
     '--iterations',
     '-i',
-    default=3,
+    default=None,
     type=int,
-    help='Maximum refinement iterations (default: 3)'
+    help='Maximum refinement iterations (default: MAX_ITERATIONS or 3)'
+)
+@click.option(
+    '--mode',
+    type=click.Choice(['phased', 'single_crew']),
+    default=None,
+    help='Pipeline mode: one crew per phase, or one crew of chained tasks '
+         '(default: PIPELINE_MODE or phased)'
+)
+@click.option(
+    '--candidates',
+    '-c',
+    default=None,
+    type=click.IntRange(min=1, max=5),
+    help='Candidate drafts (1-5) written concurrently, each from a different angle; '
+         'the best-scored one is refined (default: CANDIDATE_DRAFTS or 1)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    default=False,
+    help="Don't read or write the LLM response cache"
+)
+@click.option(
+    '--timeout',
+    default=None,
+    type=float,
+    help='Give up after this many seconds; the run can be resumed (default: GENERATION_TIMEOUT or none)'
+)
+@click.option(
+    '--stream/--no-stream',
+    default=None,
+    help='Show writer and editor output as it is generated (default: STREAM_OUTPUT or off)'
+)
+@click.option(
+    '--output-format',
+    type=click.Choice(OUTPUT_FORMATS),
+    default=None,
+    help='Progress output: rich console, one JSON event per line, or none '
+         '(default: OUTPUT_FORMAT or rich)'
 )
 @click.option(
     '--show-thinking/--no-thinking',
-    default=True,
-    help='Show agent thinking process (default: show)'
+    default=None,
+    help='Show agent thinking process (default: SHOW_THINKING or show)'
 )
-def generate(topic: str, output_dir: str, iterations: int, show_thinking: bool):
+def generate(topic: Optional[str], resume_run_id: Optional[str], output_dir: Optional[str], iterations: Optional[int],
+             mode: Optional[str], candidates: Optional[int], no_cache: bool, timeout: Optional[float],
+             stream: Optional[bool], output_format: Optional[str],
+             show_thinking: Optional[bool]):
     """
     Generate a LinkedIn post about AI and technology trends.
 
@@ -75,56 +153,375 @@ def generate(topic: str, output_dir: str, iterations: int, show_thinking: bool):
     - Critique its own work
     - Refine the post iteratively
 
+    Every phase is checkpointed, so an interrupted run can be continued with
+    --resume and the run ID printed at the start.
+
     Example:
         python main.py generate --topic "Latest trends in AI agents"
+        python main.py generate --resume 20260118_143022_1a2b3c4d
     """
-    try:
-        print_header()
+    if resume_run_id and (iterations is not None or mode is not None):
+        raise click.UsageError("--iterations and --mode can't be changed when resuming; "
+                               "the run continues with its own settings")
+    if not topic and not resume_run_id:
+        topic = click.prompt('Enter the topic for your LinkedIn post')
 
-        # Display configuration
-        print_section("[CONFIG] Configuration", ">")
-        print_info(f"Topic: {topic}")
-        print_info(f"Max Iterations: {iterations}")
-        print_info(f"Output Directory: {output_dir}")
-        print_info(f"Show Thinking: {show_thinking}")
-
-        # Validate environment
+    generator = None
+    try:
+        # Validate environment and apply command-line overrides
         try:
-            settings = get_settings()
+            settings = apply_output_format(configure_settings(
+                max_iterations=iterations,
+                output_dir=output_dir,
+                pipeline_mode=mode,
+                candidate_drafts=candidates,
+                llm_cache_enabled=False if no_cache else None,
+                stream_output=stream,
+                generation_timeout=timeout,
+                output_format=output_format,
+                show_thinking=show_thinking
+            ))
+            print_header()
             print_success("Configuration loaded successfully")
         except Exception as e:
+            print_header()
             print_error(f"Configuration error: {e}")
             print_info("Make sure you have a .env file with ANTHROPIC_API_KEY")
             print_info("Copy .env.example to .env and add your API key")
             return
 
-        # Override settings if provided
-        if iterations != 3:
-            settings.max_iterations = iterations
-        if output_dir != 'outputs':
-            settings.output_dir = Path(output_dir)
-        settings.show_thinking = show_thinking
+        # Display configuration
+        print_section("[CONFIG] Configuration", ">")
+        if resume_run_id:
+            print_info(f"Resuming Run: {resume_run_id}")
+        else:
+            print_info(f"Topic: {topic}")
+        print_info(f"Max Iterations: {settings.max_iterations}")
+        print_info(f"Output Directory: {settings.output_dir}")
+        print_info(f"Pipeline Mode: {settings.pipeline_mode}")
+        print_info(f"Candidate Drafts: {settings.candidate_drafts}")
+        print_info(f"LLM Cache: {settings.llm_cache_phases if settings.llm_cache_enabled else 'off'}")
+        print_info(f"Streaming: {'on' if settings.stream_output else 'off'}")
+        print_info(f"Show Thinking: {settings.show_thinking}")
 
         # Generate the post
-        generator = LinkedInPostGenerator()
-        result = generator.generate_post(topic)
+        from src.crew_orchestrator import LinkedInPostGenerator
+        generator = LinkedInPostGenerator(settings)
+        result = generator.generate_post(topic, resume_run_id=resume_run_id)
 
         # Success message
-        console.print("\n")
         print_success("✨ Post generation completed successfully!")
         print_info(f"📁 Saved to: {result['filename']}")
 
     except KeyboardInterrupt:
         print_error("\n\nGeneration cancelled by user")
+        if generator is not None and generator.run_id:
+            print_info(f"Resume with: python main.py generate --resume {generator.run_id}")
+        sys.exit(1)
+    except asyncio.TimeoutError:
+        print_error(f"Generation timed out after {settings.generation_timeout:g} seconds")
+        if generator is not None and generator.run_id:
+            print_info(f"Resume with: python main.py generate --resume {generator.run_id}")
         sys.exit(1)
     except Exception as e:
         print_error(f"An error occurred: {e}")
-        if show_thinking:
+        if generator is not None and generator.run_id:
+            print_info(f"Resume with: python main.py generate --resume {generator.run_id}")
+        if show_thinking is not False and isinstance(get_output_sink(), RichSink):
             import traceback
             console.print_exception()
         sys.exit(1)
 
 
+@cli.command()
+@click.option(
+    '--topics-file',
+    '-f',
+    required=True,
+    type=click.Path(exists=True, dir_okay=False),
+    help='File with one topic per line (blank lines and # comments are skipped)'
+)
+@click.option(
+    '--workers',
+    '-w',
+    default=None,
+    type=int,
+    help='Posts generated concurrently (default: BATCH_WORKERS or 3)'
+)
+@click.option(
+    '--output-dir',
+    '-o',
+    default=None,
+    type=click.Path(file_okay=False),
+    help='Directory to save the generated posts (default: OUTPUT_DIR or outputs)'
+)
+@click.option(
+    '--iterations',
+    '-i',
+    default=None,
+    type=int,
+    help='Maximum refinement iterations (default: MAX_ITERATIONS or 3)'
+)
+@click.option(
+    '--mode',
+    type=click.Choice(['phased', 'single_crew']),
+    default=None,
+    help='Pipeline mode (default: PIPELINE_MODE or phased)'
+)
+@click.option(
+    '--llm-rps',
+    default=None,
+    type=float,
+    help='LLM requests per second across all jobs (default: LLM_REQUESTS_PER_SECOND or unlimited)'
+)
+@click.option(
+    '--search-rps',
+    default=None,
+    type=float,
+    help='Search requests per second across all jobs (default: SEARCH_REQUESTS_PER_SECOND or unlimited)'
+)
+@click.option(
+    '--no-cache',
+    is_flag=True,
+    default=False,
+    help="Don't read or write the LLM response cache"
+)
+@click.option(
+    '--output-format',
+    type=click.Choice(OUTPUT_FORMATS),
+    default=None,
+    help='Progress output: rich console, one JSON event per line, or none '
+         '(default: OUTPUT_FORMAT or rich)'
+)
+def batch(topics_file: str, workers: Optional[int], output_dir: Optional[str],
+          iterations: Optional[int], mode: Optional[str], llm_rps: Optional[float],
+          search_rps: Optional[float], no_cache: bool, output_format: Optional[str]):
+    """
+    Generate posts for every topic in a file, several at a time.
+
+    Each post is saved as soon as its job finishes, and a line per job is
+    appended to batch_results.jsonl in the output directory.
+
+    Example:
+        python main.py batch --topics-file topics.txt --workers 4 --llm-rps 2
+    """
+    try:
+        settings = apply_output_format(configure_settings(
+            batch_workers=workers,
+            output_dir=output_dir,
+            max_iterations=iterations,
+            pipeline_mode=mode,
+            llm_requests_per_second=llm_rps,
+            search_requests_per_second=search_rps,
+            llm_cache_enabled=False if no_cache else None,
+            stream_output=False,
+            output_format=output_format,
+            verbose=False
+        ))
+        print_header()
+    except Exception as e:
+        print_header()
+        print_error(f"Configuration error: {e}")
+        print_info("Make sure you have a .env file with ANTHROPIC_API_KEY")
+        return
+
+    from src.batch import read_topics, run_batch
+    topics = read_topics(Path(topics_file))
+    if not topics:
+        print_error(f"No topics found in {topics_file}")
+        sys.exit(1)
+
+    print_section("[BATCH] Batch Generation", ">")
+    print_info(f"Topics: {len(topics)}")
+    print_info(f"Workers: {settings.batch_workers}")
+    print_info(f"Output Directory: {settings.output_dir}")
+    print_info(f"Rate limits: LLM {settings.llm_requests_per_second or 'unlimited'} req/s, "
+               f"search {settings.search_requests_per_second or 'unlimited'} req/s")
+
+    done = 0
+
+    def report(result):
+        nonlocal done
+        done += 1
+        if result["status"] == "success":
+            print_success(f"[{done}/{len(topics)}] {result['topic']} "
+                          f"({result['seconds']:.1f}s) -> {result['filename']}")
+        else:
+            print_error(f"[{done}/{len(topics)}] {result['topic']} "
+                        f"({result['seconds']:.1f}s): {result['error']}")
+
+    try:
+        summary = run_batch(topics, settings, on_result=report)
+    except KeyboardInterrupt:
+        print_error("\n\nBatch cancelled by user")
+        sys.exit(1)
+
+    lines = {
+        "Succeeded": summary["succeeded"],
+        "Failed": summary["failed"],
+        "Wall time": f"{summary['seconds']}s with {summary['workers']} workers",
+        "Throughput": f"{summary['posts_per_minute']} posts/minute",
+    }
+    if summary["latency_p50"] is not None:
+        lines["Per-post latency"] = (f"p50 {summary['latency_p50']}s, "
+                                     f"p95 {summary['latency_p95']}s, max {summary['latency_max']}s")
+    lines["Results"] = summary["results_file"]
+    print_summary("[SUMMARY] Batch Summary", lines)
+    if summary["failed"]:
+        sys.exit(1)
+
+
+@cli.command()
+@click.option(
+    '--log',
+    'log_path',
+    default=None,
+    type=click.Path(dir_okay=False),
+    help='Telemetry log to read (default: <OUTPUT_DIR>/telemetry.jsonl)'
+)
+@click.option(
+    '--last',
+    '-n',
+    default=None,
+    type=int,
+    help='Only aggregate the most recent N runs'
+)
+def stats(log_path: Optional[str], last: Optional[int]):
+    """
+    Show per-phase latency, token and cost percentiles across past runs.
+
+    Every generated post appends its per-phase telemetry to
+    telemetry.jsonl in the output directory.
+
+    Example:
+        python main.py stats --last 20
+    """
+    print_header()
+    if log_path is None:
+        try:
+            output_dir = get_settings().output_dir
+        except Exception:
+            output_dir = Path("outputs")
+        log_path = output_dir / "telemetry.jsonl"
+
+    try:
+        runs = load_run_log(Path(log_path), last)
+    except FileNotFoundError:
+        print_error(f"No telemetry log at {log_path}; generate a post first")
+        sys.exit(1)
+    if not runs:
+        print_info(f"No runs recorded in {log_path}")
+        return
+
+    print_section("[STATS] Phase Telemetry", ">")
+    print_phase_stats(aggregate_runs(runs), len(runs))
+    durations = sorted(run["duration_seconds"] for run in runs)
+    costs = [run["totals"]["cost_usd"] for run in runs]
+    console.print(f"  Run duration: p50 {percentile(durations, 0.5):.1f}s, "
+                  f"p95 {percentile(durations, 0.95):.1f}s, max {durations[-1]:.1f}s")
+    console.print(f"  Estimated cost: {sum(costs) / len(costs):.4f} USD per run, "
+                  f"{sum(costs):.4f} USD total")
+
+
+@cli.command()
+@click.option(
+    '--search',
+    '-s',
+    'text',
+    default=None,
+    help='Only posts whose topic or text contains all of these words'
+)
+@click.option(
+    '--topic',
+    default=None,
+    help='Only posts whose topic contains all of these words'
+)
+@click.option(
+    '--since',
+    default=None,
+    type=click.DateTime(formats=['%Y-%m-%d']),
+    help='Only posts generated on or after this date (YYYY-MM-DD)'
+)
+@click.option(
+    '--until',
+    default=None,
+    type=click.DateTime(formats=['%Y-%m-%d']),
+    help='Only posts generated on or before this date (YYYY-MM-DD)'
+)
+@click.option(
+    '--min-score',
+    default=None,
+    type=float,
+    help='Only posts whose final critic score is at least this'
+)
+@click.option(
+    '--limit',
+    '-n',
+    default=20,
+    type=int,
+    help='Maximum number of posts to list'
+)
+@click.option(
+    '--show',
+    'run_id',
+    default=None,
+    metavar='RUN_ID',
+    help='Print one archived post with its metadata'
+)
+@click.option(
+    '--import-dir',
+    default=None,
+    type=click.Path(exists=True, file_okay=False),
+    help='First archive the post files saved in this directory'
+)
+def history(text: Optional[str], topic: Optional[str], since: Optional[datetime],
+            until: Optional[datetime], min_score: Optional[float], limit: int,
+            run_id: Optional[str], import_dir: Optional[str]):
+    """
+    Search the archive of generated posts.
+
+    Every generated post is stored in archive.db in the output directory,
+    with its metadata and a full-text index. Posts saved as files before the
+    archive existed can be added with --import-dir.
+
+    Example:
+        python main.py history --search "agents" --min-score 8
+        python main.py history --show 20260118_143022_1a2b3c4d
+    """
+    print_header()
+    try:
+        path = archive_path(get_settings())
+    except Exception:
+        path = Path("outputs") / "archive.db"
+    archive = PostArchive(path)
+
+    if import_dir:
+        imported = archive.import_directory(Path(import_dir))
+        print_success(f"Archived {imported} post file(s) from {import_dir}")
+
+    if run_id:
+        post = archive.get(run_id)
+        if post is None:
+            print_error(f"No archived post with run ID {run_id} in {path}")
+            sys.exit(1)
+        print_final_output(post["post"], post["metadata"])
+        return
+
+    posts = archive.search(
+        text=text,
+        topic=topic,
+        since=since,
+        until=until + timedelta(days=1) if until else None,
+        min_score=min_score,
+        limit=limit
+    )
+    if not posts:
+        print_info(f"No archived posts match in {path}")
+        return
+    print_section("[HISTORY] Archived Posts", ">")
+    print_post_history(posts)
+
+
 @cli.command()
 def examples():
     """Show example topics and use cases."""
@@ -169,6 +566,9 @@ def examples():
 
     console.print("\n[bold green]Usage:[/bold green]")
     console.print('  python main.py generate --topic "Your chosen topic"')
+    console.print('  python main.py batch --topics-file topics.txt --workers 4')
+    console.print('  python main.py stats')
+    console.print('  python main.py history --search "agents"')
 
 
 @cli.command()
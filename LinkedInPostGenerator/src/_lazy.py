@@ -0,0 +1,35 @@
+"""Lazy package exports (PEP 562), so importing a package stays cheap."""
+
+import importlib
+from typing import Any, Callable, Dict, List, Tuple
+
+
+def lazy_exports(package: str, namespace: Dict[str, Any],
+                 exports: Dict[str, str]) -> Tuple[Callable[[str], Any], Callable[[], List[str]]]:
+    """
+    Module-level `__getattr__` and `__dir__` for `package`, whose globals
+    are `namespace`. `exports` maps each exported name to the relative
+    submodule defining it, which is imported on first access; all of that
+    submodule's exports are then bound in `namespace`, so later lookups
+    skip the hook.
+
+    Importing a submodule binds its own name on the package, so an export
+    named like a submodule would resolve to the module or to the export
+    depending on import order; that is rejected up front.
+    """
+    clashes = sorted(name for name in exports if f".{name}" in exports.values())
+    if clashes:
+        raise ValueError(f"{package} exports {clashes}, which are also submodule names")
+
+    def __getattr__(name: str) -> Any:
+        module = exports.get(name)
+        if module is None:
+            raise AttributeError(f"module {package!r} has no attribute {name!r}")
+        loaded = importlib.import_module(module, package)
+        namespace.update({n: getattr(loaded, n) for n, m in exports.items() if m == module})
+        return namespace[name]
+
+    def __dir__() -> List[str]:
+        return sorted(set(namespace) | set(exports))
+
+    return __getattr__, __dir__
@@ -1,13 +1,40 @@
 """Agent system for LinkedIn Post Generator."""
 
-from .agent_definitions import (
-    create_research_agent,
-    create_analyst_agent,
-    create_writer_agent,
-    create_critic_agent,
-    create_editor_agent,
-    create_llm
-)
+from typing import TYPE_CHECKING
+
+from .._lazy import lazy_exports
+
+# Submodule defining each exported name. They pull in crewai and langchain,
+# so they are only imported on first attribute access; importing the
+# package itself stays cheap.
+_EXPORTS = {
+    "create_research_agent": ".agent_definitions",
+    "create_analyst_agent": ".agent_definitions",
+    "create_writer_agent": ".agent_definitions",
+    "create_critic_agent": ".agent_definitions",
+    "create_editor_agent": ".agent_definitions",
+    "create_llm": ".agent_definitions",
+    "get_llm": ".agent_definitions",
+    "get_llm_rate_limiter": ".agent_definitions",
+    "AgentRegistry": ".registry",
+    "AGENT_FACTORIES": ".registry",
+}
+
+if TYPE_CHECKING:
+    from .agent_definitions import (
+        create_research_agent,
+        create_analyst_agent,
+        create_writer_agent,
+        create_critic_agent,
+        create_editor_agent,
+        create_llm,
+        get_llm,
+        get_llm_rate_limiter
+    )
+    from .registry import AgentRegistry, AGENT_FACTORIES
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
 
 __all__ = [
     "create_research_agent",
@@ -16,4 +43,8 @@ __all__ = [
     "create_critic_agent",
     "create_editor_agent",
     "create_llm",
+    "get_llm",
+    "get_llm_rate_limiter",
+    "AgentRegistry",
+    "AGENT_FACTORIES",
 ]
@@ -1,24 +1,110 @@
 """Agent definitions for the LinkedIn Post Generator system."""
 
-from crewai import Agent
-from langchain_anthropic import ChatAnthropic
-from typing import List
-from ..tools.web_search import web_search, multi_query_search
-from ..config import get_settings
-
-
-def create_llm():
-    """Create and configure the Claude LLM instance."""
-    settings = get_settings()
-    return ChatAnthropic(
-        model=settings.model_name,
-        anthropic_api_key=settings.anthropic_api_key,
-        temperature=0.7,
-        max_tokens=4096
+import threading
+from crewai import LLM, Agent
+from langchain_core.rate_limiters import InMemoryRateLimiter
+from typing import Any, Dict, Optional, Tuple
+from ..tools import web_search, multi_query_search
+from ..config import Settings, get_settings
+
+
+class ClaudeLLM(LLM):
+    """
+    crewai's own LLM client, with a shared rate limiter and the listener
+    that streamed tokens are reported to.
+
+    crewai rebuilds any other client type (such as a LangChain chat model)
+    as a plain LLM and drops its rate limiter, streaming and callback
+    settings, so extras have to live on crewai's class. Every request waits
+    for `rate_limiter`, if set. With `stream=True`, crewai emits each chunk
+    on its event bus with this client as the source; see src/streaming.py
+    for the handlers that forward it to `stream_listener`.
+    """
+
+    def __init__(self, *args: Any, rate_limiter: Optional[InMemoryRateLimiter] = None,
+                 stream_listener: Optional[Any] = None, **kwargs: Any):
+        super().__init__(*args, **kwargs)
+        self.rate_limiter = rate_limiter
+        self.stream_listener = stream_listener
+
+    def call(self, *args: Any, **kwargs: Any) -> Any:
+        if self.rate_limiter is not None:
+            self.rate_limiter.acquire()
+        return super().call(*args, **kwargs)
+
+
+def create_llm(settings: Optional[Settings] = None, temperature: float = 0.7,
+               max_tokens: int = 4096, stream_listener: Optional[Any] = None) -> ClaudeLLM:
+    """
+    Create and configure a new Claude LLM instance.
+
+    With a `stream_listener`, the response is streamed and each chunk is
+    passed to the listener's `on_token` as it arrives.
+    """
+    settings = settings or get_settings()
+    return ClaudeLLM(
+        model=f"anthropic/{settings.model_name}",
+        api_key=settings.anthropic_api_key,
+        temperature=temperature,
+        max_tokens=max_tokens,
+        stream=stream_listener is not None,
+        rate_limiter=get_llm_rate_limiter(settings),
+        stream_listener=stream_listener
     )
 
 
-def create_research_agent() -> Agent:
+_llm_rate_limiters: Dict[float, InMemoryRateLimiter] = {}
+_llm_rate_limiters_lock = threading.Lock()
+
+
+def get_llm_rate_limiter(settings: Optional[Settings] = None) -> Optional[InMemoryRateLimiter]:
+    """
+    Process-wide limiter for LLM requests, or None if unlimited.
+
+    Every client built for the same `llm_requests_per_second` shares one
+    token bucket, so concurrent jobs stay under the provider limit together.
+    """
+    settings = settings or get_settings()
+    rate = settings.llm_requests_per_second
+    if not rate:
+        return None
+    with _llm_rate_limiters_lock:
+        limiter = _llm_rate_limiters.get(rate)
+        if limiter is None:
+            limiter = InMemoryRateLimiter(
+                requests_per_second=rate,
+                check_every_n_seconds=0.05,
+                max_bucket_size=max(1.0, rate)
+            )
+            _llm_rate_limiters[rate] = limiter
+        return limiter
+
+
+_llm_clients: Dict[Tuple, ClaudeLLM] = {}
+_llm_clients_lock = threading.Lock()
+
+
+def get_llm(settings: Optional[Settings] = None, temperature: float = 0.7,
+            max_tokens: int = 4096) -> ClaudeLLM:
+    """
+    Shared Claude LLM instance for this process.
+
+    Clients are reused per (model, API key, temperature, max_tokens), so
+    agents built at different times share one HTTP connection pool.
+    """
+    settings = settings or get_settings()
+    key = (settings.model_name, settings.anthropic_api_key, temperature, max_tokens,
+           settings.llm_requests_per_second)
+    with _llm_clients_lock:
+        llm = _llm_clients.get(key)
+        if llm is None:
+            llm = create_llm(settings, temperature, max_tokens)
+            _llm_clients[key] = llm
+        return llm
+
+
+def create_research_agent(llm: Optional[LLM] = None,
+                          settings: Optional[Settings] = None) -> Agent:
     """
     Create the Research Agent responsible for gathering information.
 
@@ -40,14 +126,15 @@ def create_research_agent() -> Agent:
             "search from multiple angles to ensure comprehensive coverage."
         ),
         tools=[web_search, multi_query_search],
-        llm=create_llm(),
-        verbose=True,
+        llm=llm or get_llm(settings),
+        verbose=(settings or get_settings()).verbose,
         allow_delegation=False,
         max_iter=15
     )
 
 
-def create_analyst_agent() -> Agent:
+def create_analyst_agent(llm: Optional[LLM] = None,
+                         settings: Optional[Settings] = None) -> Agent:
     """
     Create the Analyst Agent responsible for synthesizing research.
 
@@ -69,14 +156,15 @@ def create_analyst_agent() -> Agent:
             "complex technical topics into engaging narratives."
         ),
         tools=[],
-        llm=create_llm(),
-        verbose=True,
+        llm=llm or get_llm(settings),
+        verbose=(settings or get_settings()).verbose,
         allow_delegation=False,
         max_iter=10
     )
 
 
-def create_writer_agent() -> Agent:
+def create_writer_agent(llm: Optional[LLM] = None,
+                        settings: Optional[Settings] = None) -> Agent:
     """
     Create the Writer Agent responsible for drafting LinkedIn posts.
 
@@ -99,14 +187,15 @@ def create_writer_agent() -> Agent:
             "thought-provoking question."
         ),
         tools=[],
-        llm=create_llm(),
-        verbose=True,
+        llm=llm or get_llm(settings),
+        verbose=(settings or get_settings()).verbose,
         allow_delegation=False,
         max_iter=10
     )
 
 
-def create_critic_agent() -> Agent:
+def create_critic_agent(llm: Optional[LLM] = None,
+                        settings: Optional[Settings] = None) -> Agent:
     """
     Create the Critic Agent responsible for evaluating content quality.
 
@@ -129,14 +218,15 @@ def create_critic_agent() -> Agent:
             "specific, actionable feedback that helps improve content quality."
         ),
         tools=[],
-        llm=create_llm(),
-        verbose=True,
+        llm=llm or get_llm(settings),
+        verbose=(settings or get_settings()).verbose,
         allow_delegation=False,
         max_iter=10
     )
 
 
-def create_editor_agent() -> Agent:
+def create_editor_agent(llm: Optional[LLM] = None,
+                        settings: Optional[Settings] = None) -> Agent:
     """
     Create the Editor Agent responsible for refining content.
 
@@ -157,8 +247,8 @@ def create_editor_agent() -> Agent:
             "what's working. Your edits always elevate the content."
         ),
         tools=[],
-        llm=create_llm(),
-        verbose=True,
+        llm=llm or get_llm(settings),
+        verbose=(settings or get_settings()).verbose,
         allow_delegation=False,
         max_iter=10
     )
@@ -0,0 +1,95 @@
+"""Registry that builds each agent once and reuses it across phases."""
+
+import threading
+from crewai import Agent
+from typing import Any, Callable, Dict, Optional
+
+from .agent_definitions import (
+    create_research_agent,
+    create_analyst_agent,
+    create_writer_agent,
+    create_critic_agent,
+    create_editor_agent,
+    create_llm,
+    get_llm,
+)
+from ..config import Settings, get_settings
+
+
+AGENT_FACTORIES: Dict[str, Callable[..., Agent]] = {
+    "research": create_research_agent,
+    "analyst": create_analyst_agent,
+    "writer": create_writer_agent,
+    "critic": create_critic_agent,
+    "editor": create_editor_agent,
+}
+
+# Agents whose output is shown to the user as it is generated
+STREAMED_AGENTS = ("writer", "editor")
+
+
+class AgentRegistry:
+    """
+    Builds each agent on first use and returns the same instance afterwards.
+
+    All agents share the process-wide LLM client for the registry's
+    settings, so refinement iterations reuse both the agent objects and the
+    underlying HTTP connection pool. Agents are not safe to run from two
+    crews at once, so concurrent jobs should each use their own registry.
+
+    With a `stream_listener`, the STREAMED_AGENTS get a private streaming
+    client that reports each token to the listener.
+    """
+
+    def __init__(self, settings: Optional[Settings] = None,
+                 stream_listener: Optional[Any] = None):
+        self.settings = settings or get_settings()
+        self.stream_listener = stream_listener
+        self._streaming_llm = None
+        self._agents: Dict[str, Agent] = {}
+        self._lock = threading.Lock()
+
+    @property
+    def llm(self):
+        return get_llm(self.settings)
+
+    def _llm_for(self, name: str):
+        if self.stream_listener is None or name not in STREAMED_AGENTS:
+            return self.llm
+        if self._streaming_llm is None:
+            self._streaming_llm = create_llm(self.settings,
+                                             stream_listener=self.stream_listener)
+        return self._streaming_llm
+
+    def get(self, name: str) -> Agent:
+        """Return the agent registered under `name`, building it if needed."""
+        with self._lock:
+            agent = self._agents.get(name)
+            if agent is None:
+                try:
+                    factory = AGENT_FACTORIES[name]
+                except KeyError:
+                    raise ValueError(
+                        f"Unknown agent {name!r}, expected one of {sorted(AGENT_FACTORIES)}"
+                    ) from None
+                agent = factory(llm=self._llm_for(name), settings=self.settings)
+                self._agents[name] = agent
+            return agent
+
+    def build(self, name: str) -> Agent:
+        """
+        A fresh, uncached agent on the shared non-streaming client, for
+        running several crews with the same role at once.
+        """
+        try:
+            factory = AGENT_FACTORIES[name]
+        except KeyError:
+            raise ValueError(
+                f"Unknown agent {name!r}, expected one of {sorted(AGENT_FACTORIES)}"
+            ) from None
+        return factory(llm=self.llm, settings=self.settings)
+
+    def clear(self):
+        """Forget built agents; the next get() builds fresh ones."""
+        with self._lock:
+            self._agents.clear()
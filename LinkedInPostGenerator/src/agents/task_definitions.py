@@ -3,6 +3,8 @@
 from crewai import Task
 from typing import List
 
+from ..critique import SCORE_INSTRUCTIONS
+
 
 def create_research_task(agent, topic: str) -> Task:
     """
@@ -155,6 +157,7 @@ def create_critique_task(agent, writing_task: Task) -> Task:
             "- Specific weaknesses to address\n"
             "- Concrete suggestions for improvement\n"
             "- Priority ranking of suggested changes"
+            + SCORE_INSTRUCTIONS
         ),
         expected_output=(
             "A detailed critique with:\n"
@@ -162,7 +165,8 @@ def create_critique_task(agent, writing_task: Task) -> Task:
             "- What works well (to preserve in revision)\n"
             "- What needs improvement (specific issues)\n"
             "- Actionable recommendations (prioritized)\n"
-            "- Whether the post is ready or needs revision"
+            "- Whether the post is ready or needs revision\n"
+            "- A closing JSON block with the overall and per-criterion scores"
         ),
         agent=agent,
         context=[writing_task]
@@ -0,0 +1,259 @@
+"""SQLite archive of generated posts, searchable by text, topic, date and score."""
+
+import json
+import re
+import sqlite3
+import threading
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import Settings, get_settings
+from .tools.dedupe import simhash
+
+_TOKEN = re.compile(r"\w+", re.UNICODE)
+
+SIMHASH_BITS = 64
+
+# Columns returned by search(); the full metadata is only read by get()
+_SUMMARY_COLUMNS = ("run_id", "topic", "created_at", "filename", "model", "pipeline_mode",
+                    "iterations", "final_score", "duration_seconds", "total_tokens", "cost_usd")
+
+
+def _fts_terms(text: str) -> List[str]:
+    return [f'"{term}"' for term in dict.fromkeys(_TOKEN.findall(text.lower()))]
+
+
+def _final_score(metadata: Dict[str, Any]) -> Optional[float]:
+    # The score of the saved post, which after a plateau or budget stop is
+    # the best draft rather than the last one critiqued. Posts saved before
+    # it was recorded fall back to the last critic score.
+    if "Final Score" in metadata:
+        return metadata["Final Score"]
+    scores = [s for s in metadata.get("Critic Scores") or [] if s is not None]
+    return scores[-1] if scores else None
+
+
+def _created_at(metadata: Dict[str, Any]) -> str:
+    try:
+        return datetime.strptime(metadata["Generated At"], "%Y-%m-%d %H:%M:%S").isoformat()
+    except (KeyError, TypeError, ValueError):
+        return datetime.now().isoformat(timespec="seconds")
+
+
+def _duration(metadata: Dict[str, Any]) -> Optional[float]:
+    # Saved as e.g. "42.1 seconds"
+    try:
+        return float(str(metadata["Duration"]).split()[0])
+    except (KeyError, IndexError, ValueError):
+        return None
+
+
+class PostArchive:
+    """
+    Every generated post with its metadata, one row per run ID.
+
+    Metadata that is useful to filter on (date, critic score, model,
+    iterations, tokens, cost) gets its own column; the post text and topic
+    are indexed with FTS5, and each post's SimHash is stored for
+    near-duplicate checks. Rows are written in one transaction, so a reader
+    never sees a post without its search index entry.
+    """
+
+    def __init__(self, path: Path):
+        self.path = Path(path)
+        self._lock = threading.Lock()
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Shared by concurrent batch jobs; access is serialized by self._lock.
+            self._conn = sqlite3.connect(str(self.path), timeout=30, check_same_thread=False)
+            self._conn.row_factory = sqlite3.Row
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS posts (
+                    run_id TEXT PRIMARY KEY,
+                    topic TEXT NOT NULL,
+                    created_at TEXT NOT NULL,
+                    filename TEXT,
+                    model TEXT,
+                    pipeline_mode TEXT,
+                    iterations INTEGER,
+                    final_score REAL,
+                    duration_seconds REAL,
+                    total_tokens INTEGER,
+                    cost_usd REAL,
+                    simhash TEXT,
+                    post TEXT NOT NULL,
+                    metadata TEXT NOT NULL
+                )
+            """)
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_created ON posts (created_at)")
+            self._conn.execute("CREATE INDEX IF NOT EXISTS idx_posts_score ON posts (final_score)")
+            self._conn.execute(
+                "CREATE VIRTUAL TABLE IF NOT EXISTS posts_fts USING fts5("
+                "topic, post, run_id UNINDEXED, tokenize = 'porter unicode61')"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def add(self, run_id: str, topic: str, post: str, metadata: Dict[str, Any],
+            filename: Optional[str] = None):
+        """Store (or replace) the post of `run_id`."""
+        signature = simhash(post, SIMHASH_BITS)
+        row = (
+            run_id, topic, _created_at(metadata), filename,
+            metadata.get("Model"), metadata.get("Pipeline Mode"), metadata.get("Iterations"),
+            _final_score(metadata), _duration(metadata), metadata.get("Total Tokens"),
+            metadata.get("Estimated Cost (USD)"),
+            None if signature is None else format(signature, f"0{SIMHASH_BITS // 4}x"),
+            post, json.dumps(metadata, default=str),
+        )
+        with self._lock:
+            conn = self._connection()
+            with conn:
+                conn.execute(f"INSERT OR REPLACE INTO posts VALUES ({', '.join('?' * len(row))})", row)
+                conn.execute("DELETE FROM posts_fts WHERE run_id = ?", (run_id,))
+                conn.execute("INSERT INTO posts_fts (topic, post, run_id) VALUES (?, ?, ?)",
+                             (topic, post, run_id))
+
+    def get(self, run_id: str) -> Optional[Dict[str, Any]]:
+        """The archived post of `run_id` with its full metadata, or None."""
+        with self._lock:
+            row = self._connection().execute(
+                f"SELECT {', '.join(_SUMMARY_COLUMNS)}, post, metadata FROM posts WHERE run_id = ?",
+                (run_id,)
+            ).fetchone()
+        if row is None:
+            return None
+        record = dict(row)
+        record["metadata"] = json.loads(record["metadata"])
+        return record
+
+    def search(self, text: Optional[str] = None, topic: Optional[str] = None,
+               since: Optional[datetime] = None, until: Optional[datetime] = None,
+               min_score: Optional[float] = None, limit: int = 20) -> List[Dict[str, Any]]:
+        """
+        Archived posts matching every given filter: all words of `text` in
+        the topic or post, all words of `topic` in the topic, created in
+        [since, until), and a final critic score of at least `min_score`.
+        Text matches are ordered by relevance, everything else newest first.
+        """
+        match = []
+        if text:
+            match.extend(_fts_terms(text))
+        if topic:
+            match.extend(f"topic : {term}" for term in _fts_terms(topic))
+        conditions, params = [], []
+        if match:
+            conditions.append("posts_fts MATCH ?")
+            params.append(" AND ".join(match))
+        if since is not None:
+            conditions.append("p.created_at >= ?")
+            params.append(since.isoformat())
+        if until is not None:
+            conditions.append("p.created_at < ?")
+            params.append(until.isoformat())
+        if min_score is not None:
+            conditions.append("p.final_score >= ?")
+            params.append(min_score)
+
+        columns = ", ".join(f"p.{c}" for c in _SUMMARY_COLUMNS)
+        if match:
+            sql = (f"SELECT {columns} FROM posts_fts JOIN posts p ON p.run_id = posts_fts.run_id "
+                   f"WHERE {' AND '.join(conditions)} ORDER BY bm25(posts_fts, 2.0, 1.0) LIMIT ?")
+        else:
+            where = f"WHERE {' AND '.join(conditions)} " if conditions else ""
+            sql = f"SELECT {columns} FROM posts p {where}ORDER BY p.created_at DESC LIMIT ?"
+        with self._lock:
+            rows = self._connection().execute(sql, (*params, limit)).fetchall()
+        return [dict(row) for row in rows]
+
+    def similar_posts(self, post: str, max_distance: int = 10,
+                      exclude_run_id: Optional[str] = None) -> List[Dict[str, Any]]:
+        """
+        Archived posts whose SimHash is within `max_distance` bits of
+        `post`'s, closest first.
+
+        On a 64-bit SimHash of a typical post, rewording about 5% of it moves
+        the signature some 10 bits, while unrelated posts sit 20 or more bits
+        apart. Signatures are compared in a single pass over the archive,
+        which takes milliseconds even for thousands of posts.
+        """
+        signature = simhash(post, SIMHASH_BITS)
+        if signature is None:
+            return []
+        with self._lock:
+            rows = self._connection().execute(
+                "SELECT run_id, topic, created_at, final_score, filename, simhash FROM posts "
+                "WHERE simhash IS NOT NULL"
+            ).fetchall()
+        similar = []
+        for row in rows:
+            if row["run_id"] == exclude_run_id:
+                continue
+            distance = bin(signature ^ int(row["simhash"], 16)).count("1")
+            if distance <= max_distance:
+                record = dict(row)
+                del record["simhash"]
+                record["distance"] = distance
+                similar.append(record)
+        return sorted(similar, key=lambda r: r["distance"])
+
+    def count(self) -> int:
+        with self._lock:
+            return self._connection().execute("SELECT COUNT(*) FROM posts").fetchone()[0]
+
+    def import_file(self, path: Path) -> Optional[str]:
+        """
+        Archive a post file saved by the generator (post text followed by
+        its JSON metadata). Returns the run ID, or None if the file is not
+        in that format. Files from before run IDs existed are archived as
+        `file_<name>`.
+        """
+        content = Path(path).read_text(encoding="utf-8")
+        rule = "=" * 70
+        parts = content.split(f"{rule}\nMETADATA\n{rule}\n")
+        head = f"{rule}\nLINKEDIN POST\n{rule}\n"
+        if len(parts) != 2 or not parts[0].startswith(head):
+            return None
+        post = parts[0][len(head):].strip()
+        try:
+            metadata = json.loads(parts[1])
+        except ValueError:
+            return None
+        run_id = metadata.get("Run ID") or f"file_{Path(path).stem}"
+        self.add(run_id, metadata.get("Topic", ""), post, metadata, str(path))
+        return run_id
+
+    def import_directory(self, directory: Path) -> int:
+        """Archive every post file in `directory`; returns how many were imported."""
+        return sum(self.import_file(path) is not None
+                   for path in sorted(Path(directory).glob("linkedin_post_*.txt")))
+
+
+_archives: Dict[Path, PostArchive] = {}
+_archives_lock = threading.Lock()
+
+
+def archive_path(settings: Optional[Settings] = None) -> Path:
+    settings = settings or get_settings()
+    return Path(settings.archive_path or Path(settings.output_dir) / "archive.db")
+
+
+def get_post_archive(settings: Optional[Settings] = None) -> PostArchive:
+    """Process-wide archive for the configured path, shared by concurrent generators."""
+    path = archive_path(settings)
+    with _archives_lock:
+        archive = _archives.get(path)
+        if archive is None:
+            archive = _archives[path] = PostArchive(path)
+        return archive
@@ -0,0 +1,131 @@
+"""Batch generation of LinkedIn posts for a list of topics."""
+
+import json
+import queue
+import statistics
+import threading
+import time
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from .config import Settings, get_settings
+from .crew_orchestrator import LinkedInPostGenerator
+from .telemetry import percentile
+
+
+def read_topics(path: Path) -> List[str]:
+    """One topic per line; blank lines and lines starting with '#' are skipped."""
+    with open(path, encoding="utf-8") as f:
+        return [line.strip() for line in f if line.strip() and not line.lstrip().startswith("#")]
+
+
+def _run_job(topic: str, settings: Settings) -> Dict[str, Any]:
+    # Agents are not safe to share between concurrent crews, so each job
+    # gets its own generator; LLM clients, rate limiters and the search
+    # cache are process-wide and shared.
+    start = time.perf_counter()
+    try:
+        result = LinkedInPostGenerator(settings).generate_post(topic)
+        return {
+            "topic": topic,
+            "status": "success",
+            "filename": result["filename"],
+            "run_id": result["run_id"],
+            "seconds": round(time.perf_counter() - start, 2),
+            "tokens": result["token_usage"].get("total_tokens", 0),
+        }
+    except Exception as e:
+        return {
+            "topic": topic,
+            "status": "error",
+            "error": str(e),
+            "seconds": round(time.perf_counter() - start, 2),
+        }
+
+
+def run_batch(
+    topics: List[str],
+    settings: Optional[Settings] = None,
+    workers: Optional[int] = None,
+    on_result: Optional[Callable[[Dict[str, Any]], None]] = None
+) -> Dict[str, Any]:
+    """
+    Generate one post per topic with up to `workers` jobs at a time.
+
+    Each finished job is appended to `batch_results.jsonl` in the output
+    directory as soon as it completes, and passed to `on_result`. A failing
+    job is recorded and does not stop the batch.
+
+    Jobs run on daemon threads. On Ctrl-C, the KeyboardInterrupt is raised
+    right away; every job that hasn't finished is recorded with status
+    "abandoned" (and whether it had started), and jobs still running are
+    left to the process's exit rather than waited for.
+
+    Returns:
+        Summary with per-job results, posts per minute and latency percentiles
+    """
+    settings = settings or get_settings()
+    workers = max(1, min(workers or settings.batch_workers, len(topics) or 1))
+    output_dir = Path(settings.output_dir)
+    output_dir.mkdir(parents=True, exist_ok=True)
+    log_path = output_dir / "batch_results.jsonl"
+
+    def log(result: Dict[str, Any]):
+        with open(log_path, "a", encoding="utf-8") as f:
+            f.write(json.dumps(result) + "\n")
+
+    jobs = queue.Queue()
+    for index in range(len(topics)):
+        jobs.put(index)
+    finished = queue.Queue()
+    started = set()
+    stop = threading.Event()
+
+    def worker():
+        while not stop.is_set():
+            try:
+                index = jobs.get_nowait()
+            except queue.Empty:
+                return
+            started.add(index)
+            finished.put((index, _run_job(topics[index], settings)))
+
+    results = []
+    done = set()
+    start = time.perf_counter()
+    for n in range(workers):
+        threading.Thread(target=worker, name=f"batch-{n}", daemon=True).start()
+    try:
+        while len(done) < len(topics):
+            try:
+                # A timeout keeps the wait interruptible by Ctrl-C on Windows.
+                index, result = finished.get(timeout=1.0)
+            except queue.Empty:
+                continue
+            done.add(index)
+            results.append(result)
+            log(result)
+            if on_result is not None:
+                on_result(result)
+    except KeyboardInterrupt:
+        stop.set()
+        for index, topic in enumerate(topics):
+            if index not in done:
+                log({"topic": topic, "status": "abandoned", "started": index in started})
+        raise
+    elapsed = time.perf_counter() - start
+
+    succeeded = [r for r in results if r["status"] == "success"]
+    latencies = sorted(r["seconds"] for r in succeeded)
+    return {
+        "results": results,
+        "workers": workers,
+        "succeeded": len(succeeded),
+        "failed": len(results) - len(succeeded),
+        "seconds": round(elapsed, 1),
+        "posts_per_minute": round(len(succeeded) / elapsed * 60, 2) if elapsed else 0.0,
+        "latency_p50": round(statistics.median(latencies), 1) if latencies else None,
+        "latency_p95": round(percentile(latencies, 0.95), 1) if latencies else None,
+        "latency_max": latencies[-1] if latencies else None,
+        "results_file": str(log_path),
+    }
@@ -0,0 +1,94 @@
+"""Per-phase checkpoints so interrupted post generation runs can resume."""
+
+import json
+import os
+import re
+import uuid
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Optional
+
+
+# Run IDs as made by RunCheckpoint.create, e.g. 20260118_143022_1a2b3c4d
+RUN_ID_PATTERN = re.compile(r"\d{8}_\d{6}_[0-9a-f]{8}")
+
+
+def _write_json_atomic(path: Path, data: Dict[str, Any]):
+    """Write JSON via a temporary file and rename, so readers never see a partial file."""
+    tmp = path.with_name(f".{path.name}.{os.getpid()}.tmp")
+    with open(tmp, "w", encoding="utf-8") as f:
+        json.dump(data, f, indent=2)
+        f.flush()
+        os.fsync(f.fileno())
+    os.replace(tmp, path)
+
+
+class RunCheckpoint:
+    """
+    Checkpoints for one generation run, stored as JSON files in
+    `<root>/<run_id>/`: `run.json` describes the run and each finished
+    phase (research, analysis, writing, critique_1, editing_1, ...) gets
+    its own file with the phase output, wall time and tokens spent.
+    """
+
+    def __init__(self, run_dir: Path):
+        self.run_dir = Path(run_dir)
+        self.run_id = self.run_dir.name
+        with open(self.run_dir / "run.json", encoding="utf-8") as f:
+            self.info = json.load(f)
+
+    @classmethod
+    def create(cls, root: Path, topic: str, settings_summary: Dict[str, Any]) -> "RunCheckpoint":
+        """Start a new run with a unique id."""
+        run_id = f"{datetime.now():%Y%m%d_%H%M%S}_{uuid.uuid4().hex[:8]}"
+        run_dir = Path(root) / run_id
+        run_dir.mkdir(parents=True)
+        _write_json_atomic(run_dir / "run.json", {
+            "run_id": run_id,
+            "topic": topic,
+            "started_at": datetime.now().isoformat(timespec="seconds"),
+            "settings": settings_summary,
+            "status": "running",
+        })
+        return cls(run_dir)
+
+    @classmethod
+    def open(cls, root: Path, run_id: str) -> "RunCheckpoint":
+        """
+        Open an existing run; raises ValueError for a malformed run ID (which
+        could point outside `root`) and FileNotFoundError if there is no run.
+        """
+        if not RUN_ID_PATTERN.fullmatch(run_id):
+            raise ValueError(f"Invalid run ID '{run_id}', expected e.g. 20260118_143022_1a2b3c4d")
+        run_dir = Path(root) / run_id
+        if not (run_dir / "run.json").exists():
+            raise FileNotFoundError(f"No run '{run_id}' in {root}")
+        return cls(run_dir)
+
+    @property
+    def topic(self) -> str:
+        return self.info["topic"]
+
+    def _phase_path(self, phase: str) -> Path:
+        return self.run_dir / f"{phase}.json"
+
+    def load(self, phase: str) -> Optional[Dict[str, Any]]:
+        """The saved checkpoint for `phase`, or None if it hasn't completed."""
+        try:
+            with open(self._phase_path(phase), encoding="utf-8") as f:
+                return json.load(f)
+        except (OSError, ValueError):
+            return None
+
+    def save(self, phase: str, output: Any, seconds: float, token_usage: Dict[str, int]):
+        _write_json_atomic(self._phase_path(phase), {
+            "phase": phase,
+            "output": output,
+            "seconds": round(seconds, 2),
+            "token_usage": token_usage,
+            "completed_at": datetime.now().isoformat(timespec="seconds"),
+        })
+
+    def mark_complete(self, filename: str, metadata: Dict[str, Any]):
+        self.info.update({"status": "complete", "filename": filename, "metadata": metadata})
+        _write_json_atomic(self.run_dir / "run.json", self.info)
@@ -0,0 +1,184 @@
+"""Token-budgeted compaction of phase outputs before they go into the next prompt."""
+
+import math
+import re
+from collections import Counter
+from dataclasses import dataclass
+from typing import Dict, List, Set
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+_TOKEN_PIECE = re.compile(r"\w+|[^\w\s]", re.UNICODE)
+_SENTENCE_END = re.compile(r"(?<=[.!?])\s+(?=[A-Z0-9\"'(\[])")
+_BLOCK_SPLIT = re.compile(r"\n\s*\n|\n(?=\s*(?:[-*•]|\d+[.)])\s)")
+
+STOPWORDS = frozenset(
+    "a an and are as at be by for from has have in is it its of on or that the this "
+    "to was were will with what whats new latest trends".split()
+)
+
+
+def estimate_tokens(text: str) -> int:
+    """
+    Rough token count without a model tokenizer: one token per
+    punctuation mark and per short word, long words count ~4 chars per token.
+    """
+    return sum(max(1, math.ceil(len(piece) / 4)) if len(piece) > 6 else 1
+               for piece in _TOKEN_PIECE.findall(text))
+
+
+def _normalize(text: str) -> str:
+    return " ".join(_WORD.findall(text.lower()))
+
+
+def _terms(text: str) -> List[str]:
+    return [w for w in _WORD.findall(text.lower()) if w not in STOPWORDS and len(w) > 1]
+
+
+def _shingles(text: str, size: int = 3) -> Set[str]:
+    words = _normalize(text).split()
+    if len(words) <= size:
+        return {" ".join(words)}
+    return {" ".join(words[i:i + size]) for i in range(len(words) - size + 1)}
+
+
+@dataclass
+class CompactionResult:
+    """Compacted text plus before/after sizes for reporting."""
+
+    text: str
+    tokens_before: int
+    tokens_after: int
+    passages_before: int
+    passages_kept: int
+    duplicates_removed: int
+
+    def summary(self) -> str:
+        saved = 1 - self.tokens_after / self.tokens_before if self.tokens_before else 0
+        return (f"{self.tokens_before:,} -> {self.tokens_after:,} tokens ({saved:.0%} smaller), "
+                f"{self.passages_kept}/{self.passages_before} passages kept, "
+                f"{self.duplicates_removed} duplicates removed")
+
+
+def _split_passages(text: str) -> List[str]:
+    return [block.strip() for block in _BLOCK_SPLIT.split(text) if block and block.strip()]
+
+
+def _dedupe(passages: List[str], similarity: float):
+    """Drop repeated sentences, then passages that mostly repeat an earlier one."""
+    seen_sentences: Set[str] = set()
+    kept: List[str] = []
+    kept_shingles: List[Set[str]] = []
+    removed = 0
+    for passage in passages:
+        sentences = []
+        for sentence in _SENTENCE_END.split(passage):
+            key = _normalize(sentence)
+            if len(key) > 20 and key in seen_sentences:
+                removed += 1
+                continue
+            seen_sentences.add(key)
+            sentences.append(sentence)
+        if not sentences:
+            continue
+        passage = " ".join(sentences)
+        shingles = _shingles(passage)
+        if any(len(shingles & other) / len(shingles | other) >= similarity for other in kept_shingles):
+            removed += 1
+            continue
+        kept.append(passage)
+        kept_shingles.append(shingles)
+    return kept, removed
+
+
+def _rank(passages: List[str], topic: str) -> List[float]:
+    """TF-IDF-weighted overlap with the topic, plus a bonus for figures and sources."""
+    topic_terms = set(_terms(topic))
+    passage_terms = [Counter(_terms(p)) for p in passages]
+    df = Counter(term for terms in passage_terms for term in terms)
+    n = len(passages)
+    scores = []
+    for passage, terms in zip(passages, passage_terms):
+        length = sum(terms.values()) or 1
+        relevance = sum(
+            (1 + math.log(count)) * math.log(1 + n / df[term])
+            for term, count in terms.items() if term in topic_terms
+        )
+        evidence = 0.5 * bool(re.search(r"\d", passage)) + 0.5 * bool(re.search(r"https?://", passage))
+        # Mild length normalization so long passages don't win on volume alone.
+        scores.append((relevance + evidence) / math.sqrt(length / 50 + 1))
+    return scores
+
+
+def _truncate_words(text: str, token_budget: int) -> str:
+    words, used = [], 0
+    for word in text.split():
+        cost = estimate_tokens(word)
+        if used + cost > token_budget:
+            break
+        words.append(word)
+        used += cost
+    return " ".join(words)
+
+
+def _trim(passage: str, token_budget: int, truncate: bool) -> str:
+    """
+    The sentences of `passage` that fit in `token_budget`, in order. If none
+    does and `truncate` is set, the passage's leading words instead.
+    """
+    kept, used = [], 0
+    for sentence in _SENTENCE_END.split(passage):
+        cost = estimate_tokens(sentence)
+        if used + cost <= token_budget:
+            kept.append(sentence)
+            used += cost
+    if kept:
+        return " ".join(kept)
+    return _truncate_words(passage, token_budget) if truncate else ""
+
+
+def compact(text: str, topic: str, token_budget: int, similarity: float = 0.8) -> CompactionResult:
+    """
+    Deduplicate `text`, rank its passages by relevance to `topic`, and keep
+    the best ones that fit in `token_budget`, in their original order.
+
+    Budget left over after whole passages is filled with sentences from the
+    best-ranked passages that didn't fit, so a passage larger than the whole
+    budget (one long paragraph, or long bullets under a heading) is cut
+    down rather than dropped; the top-ranked one is truncated mid-sentence
+    if not even a sentence fits.
+    """
+    tokens_before = estimate_tokens(text)
+    passages = _split_passages(text)
+    unique, removed = _dedupe(passages, similarity)
+
+    if sum(estimate_tokens(p) for p in unique) <= token_budget:
+        selected = unique
+    else:
+        scores = _rank(unique, topic)
+        order = sorted(range(len(unique)), key=lambda i: (-scores[i], i))
+        chosen: Dict[int, str] = {}
+        skipped: List[int] = []
+        used = 0
+        for i in order:
+            cost = estimate_tokens(unique[i])
+            if used + cost <= token_budget:
+                chosen[i] = unique[i]
+                used += cost
+            else:
+                skipped.append(i)
+        for rank, i in enumerate(skipped):
+            trimmed = _trim(unique[i], token_budget - used, truncate=rank == 0)
+            if trimmed:
+                chosen[i] = trimmed
+                used += estimate_tokens(trimmed)
+        selected = [chosen[i] for i in sorted(chosen)]
+
+    compacted = "\n\n".join(selected)
+    return CompactionResult(
+        text=compacted,
+        tokens_before=tokens_before,
+        tokens_after=estimate_tokens(compacted),
+        passages_before=len(passages),
+        passages_kept=len(selected),
+        duplicates_removed=removed,
+    )
@@ -1,5 +1,5 @@
 """Configuration module."""
 
-from .settings import Settings, get_settings
+from .settings import Settings, get_settings, configure_settings
 
-__all__ = ["Settings", "get_settings"]
+__all__ = ["Settings", "get_settings", "configure_settings"]
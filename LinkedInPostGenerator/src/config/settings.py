@@ -1,8 +1,9 @@
 """Configuration management for the LinkedIn Post Generator Agent."""
 
-import os
+import threading
 from pathlib import Path
-from typing import Optional
+from typing import Any, Literal, Optional
+from pydantic import Field
 from pydantic_settings import BaseSettings, SettingsConfigDict
 
 
@@ -16,26 +17,137 @@ class Settings(BaseSettings):
     # Agent Configuration
     max_iterations: int = 3
     search_queries_count: int = 5
+    # Refinement stops at this critic score, after this many critiques
+    # without improvement, or once a token/time budget (None = no limit)
+    # is spent
+    critic_score_threshold: float = 9.0
+    critic_plateau_patience: int = 1
+    refinement_token_budget: Optional[int] = None
+    refinement_time_budget: Optional[float] = None
+    # Drafts written concurrently (each from a different angle) and scored
+    # in one batched critique; the best one goes into refinement. There are
+    # five angles, so at most five candidates
+    candidate_drafts: int = Field(1, ge=1, le=5)
+    # "phased": one crew per phase; "single_crew": one crew of chained tasks
+    pipeline_mode: Literal["phased", "single_crew"] = "phased"
+    # Whole-run timeout in seconds (None = no limit), and whether to warm
+    # the search cache for the topic while the research agent starts up.
+    # Prefetching pays off only if the agent searches the topic with the
+    # default arguments; otherwise it adds search traffic, so it is opt-in
+    generation_timeout: Optional[float] = None
+    search_prefetch: bool = False
+    # Research and analysis are deduplicated, ranked against the topic and
+    # trimmed to these (estimated) token budgets before the next phase
+    compaction_enabled: bool = True
+    research_token_budget: int = 2500
+    analysis_token_budget: int = 1500
+
+    # Search Configuration (backends: duckduckgo, local)
+    search_backend: str = "duckduckgo"
+    search_max_workers: int = 4
+    search_timeout: float = 10.0
+
+    # Local search backend: SQLite FTS5 corpus plus injected faults
+    search_corpus_path: Path = Path("data/search_corpus.db")
+    search_latency_ms: float = 0.0
+    search_latency_jitter_ms: float = 0.0
+    search_failure_rate: float = 0.0
+    search_seed: Optional[int] = None
+
+    # Search Cache (modes: read_through, refresh, offline, off)
+    search_cache_mode: str = "read_through"
+    search_cache_ttl: int = 86400
+    search_cache_max_entries: int = 5000
+    search_cache_path: Path = Path(".cache/search_cache.db")
+
+    # LLM response cache; phases: research, analysis, writing, critique,
+    # editing, pipeline (the whole single-crew run). Cached research is
+    # replayed for at most this many seconds (None = no limit), since the
+    # news it summarizes goes stale
+    llm_cache_enabled: bool = True
+    llm_cache_phases: str = "research,analysis"
+    llm_cache_research_max_age: Optional[float] = 86400
+    llm_cache_max_mb: float = 200.0
+    llm_cache_dir: Path = Path(".cache/llm")
+
+    # Prices (USD per million tokens) used to estimate per-phase cost
+    llm_input_cost_per_mtok: float = 3.0
+    llm_output_cost_per_mtok: float = 15.0
+
+    # Rate limits shared by all concurrent jobs (None = unlimited)
+    llm_requests_per_second: Optional[float] = None
+    search_requests_per_second: Optional[float] = None
+
+    # Batch Generation
+    batch_workers: int = 3
 
     # Output Settings
     verbose: bool = True
     show_thinking: bool = True
+    # Render writer/editor output token by token as it is generated
+    stream_output: bool = False
+    # "rich" (interactive console), "jsonl" (one JSON event per line, to
+    # events_path or stdout) or "null" (no progress output at all)
+    output_format: Literal["rich", "jsonl", "null"] = "rich"
+    events_path: Optional[Path] = None
 
     # Paths
     output_dir: Path = Path("outputs")
 
+    # Post archive (SQLite + FTS5, default <output_dir>/archive.db). New
+    # posts within this many SimHash bits of an archived post are flagged
+    # as near duplicates
+    archive_enabled: bool = True
+    archive_path: Optional[Path] = None
+    archive_duplicate_distance: int = 10
+
     model_config = SettingsConfigDict(
         env_file=".env",
         env_file_encoding="utf-8",
         case_sensitive=False
     )
 
-    def __init__(self, **kwargs):
-        super().__init__(**kwargs)
-        # Create output directory if it doesn't exist
-        self.output_dir.mkdir(parents=True, exist_ok=True)
+    def with_overrides(self, **overrides: Any) -> "Settings":
+        """
+        Return a validated copy with `overrides` applied.
+
+        None values are ignored, so unset CLI options can be passed through
+        as-is. The environment and .env file are not re-read.
+        """
+        overrides = {k: v for k, v in overrides.items() if v is not None}
+        if not overrides:
+            return self
+        return type(self).model_validate({**self.model_dump(), **overrides})
+
+
+_settings: Optional[Settings] = None
+_settings_lock = threading.Lock()
 
 
 def get_settings() -> Settings:
-    """Get application settings singleton."""
-    return Settings()
+    """
+    Get the application settings singleton.
+
+    The environment and .env file are read once per process; later calls
+    return the same instance, so this is cheap to call in hot paths.
+    """
+    global _settings
+    if _settings is None:
+        with _settings_lock:
+            if _settings is None:
+                _settings = Settings()
+    return _settings
+
+
+def configure_settings(**overrides: Any) -> Settings:
+    """
+    Apply `overrides` to the process-wide settings and return them.
+
+    Call this once at startup (e.g. from the CLI) before building the
+    generator; code that calls get_settings() afterwards sees the overrides.
+    """
+    global _settings
+    settings = get_settings().with_overrides(**overrides)
+    with _settings_lock:
+        _settings = settings
+    return settings
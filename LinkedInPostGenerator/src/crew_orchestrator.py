@@ -1,34 +1,102 @@
 """Main crew orchestrator for the LinkedIn Post Generator."""
 
+from concurrent.futures import Executor, Future
 from crewai import Crew, Process, Task
 from datetime import datetime
 from pathlib import Path
-from typing import Optional, Dict, Any
+from typing import Optional, Dict, Any, List, Tuple
+import asyncio
+import contextvars
+import functools
 import json
-
-from .agents import (
-    create_research_agent,
-    create_analyst_agent,
-    create_writer_agent,
-    create_critic_agent,
-    create_editor_agent,
+import threading
+import time
+
+from .agents import AgentRegistry
+from .archive import get_post_archive
+from .agents.task_definitions import (
+    create_research_task,
+    create_analysis_task,
+    create_writing_task,
+    create_critique_task,
+    create_editing_task,
+)
+from .config import Settings, get_settings
+from .checkpoints import RunCheckpoint
+from .compaction import compact, estimate_tokens
+from .critique import (
+    SCORE_INSTRUCTIONS,
+    CritiqueScore,
+    candidate_feedback,
+    candidate_score_instructions,
+    parse_candidate_scores,
+    parse_critique,
 )
-from .config import get_settings
+from .llm_cache import LLMResponseCache, crew_cache_key
+from .streaming import DraftStreamer
+from .telemetry import RunTelemetry, append_run_log
+from .tools import prefetch_topic_search
 from .utils import (
     print_section,
     print_step,
     print_agent_action,
     print_success,
     print_error,
+    print_warning,
     print_post_draft,
     print_critique,
     print_workflow_tree,
     print_iteration_summary,
     save_output,
     print_final_output,
-    console
+    bind_event_context
 )
 
+# Settings saved in a run's run.json (key -> Settings field); a resumed run
+# continues with these, whatever the current configuration says
+RUN_SETTINGS = {
+    "model": "model_name",
+    "max_iterations": "max_iterations",
+    "pipeline_mode": "pipeline_mode",
+}
+
+# Openings for candidate drafts, one per draft (CANDIDATE_DRAFTS is at most
+# their number, so no two candidates share an angle)
+DRAFT_ANGLES = (
+    "a surprising statistic or data point from the analysis",
+    "a bold, contrarian take on the conventional wisdom",
+    "a short, concrete scenario the reader will recognize",
+    "a practical question the reader is facing right now",
+    "a clear prediction about what happens next",
+)
+
+
+class _DaemonThreadExecutor(Executor):
+    """
+    Runs each submitted call on a new daemon thread.
+
+    Used for phases by `generate_post`. Unlike a
+    ThreadPoolExecutor, nothing waits for its threads: neither closing the
+    loop nor interpreter exit, so a timed-out or interrupted run returns
+    (and the process can exit) while the running phase is still going.
+    """
+
+    def submit(self, fn, *args, **kwargs):
+        future: Future = Future()
+
+        def run():
+            if not future.set_running_or_notify_cancel():
+                return
+            try:
+                result = fn(*args, **kwargs)
+            except BaseException as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        threading.Thread(target=run, name="phase", daemon=True).start()
+        return future
+
 
 class LinkedInPostGenerator:
     """
@@ -39,45 +107,175 @@ class LinkedInPostGenerator:
     about AI and technology trends.
     """
 
-    def __init__(self):
-        """Initialize the post generator with settings."""
-        self.settings = get_settings()
+    def __init__(self, settings: Optional[Settings] = None):
+        """
+        Initialize the post generator.
+
+        Args:
+            settings: Settings to use instead of the process-wide ones,
+                e.g. `get_settings().with_overrides(max_iterations=5)`
+        """
+        self.settings = settings or get_settings()
         self.output_dir = Path(self.settings.output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
-
-    def generate_post(self, topic: str) -> Dict[str, Any]:
+        # Agents and their LLM client are built once and reused by every phase
+        # and refinement iteration. When streaming, the writer and editor use
+        # a streaming client whose tokens go to the output sink as they arrive.
+        self.streamer = DraftStreamer() if self.settings.stream_output else None
+        self.last_streamed = False
+        self._executor: Optional[Executor] = None
+        self.agents = AgentRegistry(
+            self.settings,
+            stream_listener=self.streamer
+        )
+        self.llm_cache = LLMResponseCache.from_settings(self.settings)
+        self.token_usage: Dict[str, int] = {}
+        self._usage_lock = threading.Lock()
+        self.runs_dir = self.output_dir / "runs"
+        self.checkpoint: Optional[RunCheckpoint] = None
+        self.resume_stats: Dict[str, Any] = {}
+        self.refinement: Dict[str, Any] = {}
+        self.prompt_sizes: Dict[str, Dict[str, int]] = {}
+        self.candidates: Dict[str, Any] = {}
+        self.telemetry = self._new_telemetry()
+        self.telemetry_log = self.output_dir / "telemetry.jsonl"
+        self.archive = get_post_archive(self.settings) if self.settings.archive_enabled else None
+
+    def _new_telemetry(self) -> RunTelemetry:
+        return RunTelemetry(self.settings.llm_input_cost_per_mtok,
+                            self.settings.llm_output_cost_per_mtok)
+
+    @property
+    def run_id(self) -> Optional[str]:
+        """Id of the current (or last) run, usable with `resume_run_id`."""
+        return self.checkpoint.run_id if self.checkpoint else None
+
+    def generate_post(self, topic: Optional[str] = None,
+                      resume_run_id: Optional[str] = None,
+                      timeout: Optional[float] = None) -> Dict[str, Any]:
         """
         Generate a LinkedIn post on the given topic.
 
+        Blocking wrapper around `agenerate_post`; call that instead from
+        code that already runs an event loop.
+
+        Unlike asyncio.run(), this does not wait for the phase thread still
+        running after a timeout or Ctrl-C: the error is raised right away,
+        and the phase finishes in the background only while the process
+        keeps running.
+
         Args:
-            topic: The topic to generate a post about
+            topic: The topic to generate a post about (optional when resuming)
+            resume_run_id: Resume this run, skipping the phases it already completed
+            timeout: Give up after this many seconds (default: generation_timeout)
 
         Returns:
             Dictionary containing the final post and metadata
         """
-        start_time = datetime.now()
+        loop = asyncio.new_event_loop()
+        self._executor = _DaemonThreadExecutor()
+        try:
+            return loop.run_until_complete(self.agenerate_post(topic, resume_run_id, timeout))
+        finally:
+            self._executor = None
+            try:
+                pending = asyncio.all_tasks(loop)
+                for task in pending:
+                    task.cancel()
+                if pending:
+                    loop.run_until_complete(asyncio.gather(*pending, return_exceptions=True))
+                loop.run_until_complete(loop.shutdown_asyncgens())
+            finally:
+                loop.close()
+
+    async def agenerate_post(self, topic: Optional[str] = None,
+                             resume_run_id: Optional[str] = None,
+                             timeout: Optional[float] = None) -> Dict[str, Any]:
+        """
+        Generate a LinkedIn post without blocking the event loop.
 
-        print_section("🚀 Starting Autonomous Post Generation", "🚀")
-        print_agent_action("System", f"Topic: {topic}")
-        print_agent_action("System", f"Max Iterations: {self.settings.max_iterations}")
+        Every completed phase is checkpointed under `<output_dir>/runs/<run_id>/`.
+        Crews are blocking, so each phase runs in a worker thread; independent
+        work (e.g. warming the search cache during research) runs alongside.
 
-        # Phase 1: Research
-        print_workflow_tree("research")
-        print_step(1, 5, "Research Phase")
-        research_result = self._run_research_phase(topic)
+        Cancelling the task, or exceeding `timeout` (asyncio.TimeoutError),
+        stops the run at the current phase: that phase's thread can't be
+        interrupted, so it finishes and is checkpointed in the background,
+        and the run can later be continued with `resume_run_id=self.run_id`.
 
-        # Phase 2: Analysis
-        print_workflow_tree("analysis")
-        print_step(2, 5, "Analysis Phase")
-        analysis_result = self._run_analysis_phase(topic, research_result)
+        Args:
+            topic: The topic to generate a post about (optional when resuming)
+            resume_run_id: Resume this run, skipping the phases it already completed
+            timeout: Give up after this many seconds (default: generation_timeout)
 
-        # Phase 3: Initial Writing
-        print_workflow_tree("writing")
-        print_step(3, 5, "Writing Phase")
-        initial_draft = self._run_writing_phase(topic, analysis_result)
+        Returns:
+            Dictionary containing the final post and metadata
+        """
+        timeout = timeout if timeout is not None else self.settings.generation_timeout
+        if timeout is None:
+            return await self._agenerate(topic, resume_run_id)
+        return await asyncio.wait_for(self._agenerate(topic, resume_run_id), timeout)
 
-        # Phase 4 & 5: Iterative Critique and Refinement
-        final_post = self._run_refinement_loop(initial_draft)
+    def _restore_run_settings(self):
+        """
+        Switch to the model, pipeline mode and iteration limit the resumed
+        run was started with, so its checkpoints are continued by the same
+        pipeline. Agents are rebuilt if the model changes.
+        """
+        saved = self.checkpoint.info.get("settings", {})
+        restored = {
+            field: saved[key] for key, field in RUN_SETTINGS.items()
+            if key in saved and saved[key] != getattr(self.settings, field)
+        }
+        if not restored:
+            return
+        model_changed = "model_name" in restored
+        self.settings = self.settings.with_overrides(**restored)
+        if model_changed:
+            self.agents = AgentRegistry(self.settings, stream_listener=self.streamer)
+        print_agent_action("System", "Using the run's settings: "
+                           + ", ".join(f"{field}={value}" for field, value in restored.items()))
+
+    async def _agenerate(self, topic: Optional[str], resume_run_id: Optional[str]) -> Dict[str, Any]:
+        start_time = datetime.now()
+
+        if resume_run_id:
+            self.checkpoint = RunCheckpoint.open(self.runs_dir, resume_run_id)
+            if topic and topic != self.checkpoint.topic:
+                raise ValueError(
+                    f"Run {resume_run_id} is for topic '{self.checkpoint.topic}', not '{topic}'"
+                )
+            topic = self.checkpoint.topic
+            self._restore_run_settings()
+        else:
+            if not topic:
+                raise ValueError("A topic is required unless resuming a run")
+            self.checkpoint = RunCheckpoint.create(self.runs_dir, topic, {
+                key: getattr(self.settings, field) for key, field in RUN_SETTINGS.items()
+            })
+        # Tags every structured output event of this run (jsonl format)
+        bind_event_context(run_id=self.run_id)
+
+        print_section("🚀 Starting Autonomous Post Generation", "🚀")
+        print_agent_action("System", f"Topic: {topic}")
+        print_agent_action("System", f"Max Iterations: {self.settings.max_iterations}")
+        print_agent_action("System", f"Run ID: {self.run_id}"
+                           + (" (resumed)" if resume_run_id else ""))
+        if self.archive is not None and not resume_run_id:
+            self._report_archived_topic(topic)
+
+        self.token_usage = {}
+        self.llm_cache.reset_stats()
+        self.resume_stats = {"phases": 0, "seconds": 0.0, "tokens": 0}
+        self.prompt_sizes = {}
+        self.candidates = {}
+        self.telemetry = self._new_telemetry()
+        self.refinement = {"iterations": 0, "scores": [], "criteria": {}, "stop_reason": "max_iterations",
+                           "final_score": None}
+        if self.settings.pipeline_mode == "single_crew":
+            final_post = await self._in_thread(self._run_single_crew_pipeline, topic)
+        else:
+            final_post = await self._run_phased_pipeline(topic)
 
         # Finalization
         print_workflow_tree("final")
@@ -88,14 +286,54 @@ class LinkedInPostGenerator:
             "Topic": topic,
             "Generated At": end_time.strftime("%Y-%m-%d %H:%M:%S"),
             "Duration": f"{duration:.1f} seconds",
-            "Iterations": self.settings.max_iterations,
-            "Model": self.settings.model_name
+            "Iterations": self.refinement["iterations"],
+            "Max Iterations": self.settings.max_iterations,
+            "Critic Scores": list(self.refinement["scores"]),
+            # Score of the post as saved; None if it is an edit the critic never saw
+            "Final Score": self.refinement["final_score"],
+            "Final Criteria Scores": dict(self.refinement["criteria"]),
+            "Stop Reason": self.refinement["stop_reason"],
+            "Model": self.settings.model_name,
+            "Pipeline Mode": self.settings.pipeline_mode,
+            "Total Tokens": self.token_usage.get("total_tokens", 0),
+            "LLM Cache Hits": self.llm_cache.stats["hits"],
+            "Tokens Saved By Cache": self.llm_cache.stats["tokens_saved"],
+            "Prompt Sizes": dict(self.prompt_sizes),
+            "Estimated Cost (USD)": self.telemetry.totals()["cost_usd"],
+            "Phase Telemetry": self.telemetry.by_phase(),
+            "Run ID": self.run_id
         }
-
-        # Save output
-        timestamp = end_time.strftime("%Y%m%d_%H%M%S")
-        filename = self.output_dir / f"linkedin_post_{timestamp}.txt"
+        if self.candidates:
+            metadata["Candidate Scores"] = self.candidates["scores"]
+            metadata["Selected Candidate"] = self.candidates["selected"]
+        if resume_run_id:
+            metadata["Resumed Phases"] = self.resume_stats["phases"]
+            metadata["Time Saved By Resume"] = f"{self.resume_stats['seconds']:.1f} seconds"
+            metadata["Tokens Saved By Resume"] = self.resume_stats["tokens"]
+
+        if self.archive is not None:
+            similar = self.archive.similar_posts(final_post, self.settings.archive_duplicate_distance,
+                                                 exclude_run_id=self.run_id)
+            if similar:
+                metadata["Similar Posts"] = [post["run_id"] for post in similar]
+                print_warning(f"Post is a near duplicate of {len(similar)} archived post(s), "
+                              f"closest: {similar[0]['run_id']} ({similar[0]['topic']})")
+
+        # Save output; the run ID makes the name unique, and a resumed run
+        # replaces its own file
+        filename = self.output_dir / f"linkedin_post_{self.run_id}.txt"
         self._save_post_with_metadata(final_post, metadata, filename)
+        if self.archive is not None:
+            self.archive.add(self.run_id, topic, final_post, metadata, str(filename))
+        self.checkpoint.mark_complete(str(filename), metadata)
+        append_run_log(self.telemetry_log, {
+            "run_id": self.run_id,
+            "topic": topic,
+            "model": self.settings.model_name,
+            "pipeline_mode": self.settings.pipeline_mode,
+            "resumed": bool(resume_run_id),
+            "duration_seconds": round(duration, 2),
+        }, self.telemetry)
 
         # Display final output
         print_final_output(final_post, metadata)
@@ -103,14 +341,267 @@ class LinkedInPostGenerator:
         return {
             "post": final_post,
             "metadata": metadata,
-            "filename": str(filename)
+            "filename": str(filename),
+            "token_usage": dict(self.token_usage),
+            "run_id": self.run_id,
+            "refinement": dict(self.refinement)
         }
 
+    def _checkpointed(self, phase: str, run, *args):
+        """
+        Return `run(*args)`, or the checkpointed output if this run already
+        completed `phase`. New outputs are checkpointed with their wall time
+        and token usage, which resumed runs report as saved. Either way the
+        phase gets a telemetry record ("critique_2" is critique, iteration 2).
+        """
+        name, _, iteration = phase.partition("_")
+        with self.telemetry.phase(name, int(iteration) if iteration else None) as record:
+            saved = self.checkpoint.load(phase)
+            if saved is not None:
+                print_agent_action("System", f"Resuming from checkpoint: {phase}")
+                record.resumed = True
+                self.resume_stats["phases"] += 1
+                self.resume_stats["seconds"] += saved["seconds"]
+                self.resume_stats["tokens"] += saved["token_usage"].get("total_tokens", 0)
+                return saved["output"]
+
+            start = time.perf_counter()
+            output = run(*args)
+            # Taken from the phase's own record, since candidate drafts run
+            # concurrently and share the run totals.
+            usage = {
+                "prompt_tokens": record.prompt_tokens,
+                "completion_tokens": record.completion_tokens,
+                "total_tokens": record.prompt_tokens + record.completion_tokens,
+                "successful_requests": record.llm_calls,
+            }
+            self.checkpoint.save(phase, output, time.perf_counter() - start, usage)
+            return output
+
+    async def _in_thread(self, func, *args):
+        """
+        Run blocking `func(*args)` in a worker thread, keeping context
+        variables. Uses the loop's default executor unless `generate_post`
+        set one for the run.
+        """
+        loop = asyncio.get_running_loop()
+        call = functools.partial(contextvars.copy_context().run, func, *args)
+        return await loop.run_in_executor(self._executor, call)
+
+    def _prefetch_search(self, topic: str):
+        try:
+            prefetch_topic_search(topic)
+        except Exception as e:
+            # The research agent's own search will report the problem.
+            print_agent_action("System", f"Search prefetch failed: {e}")
+
+    def _run_research_with_prefetch(self, topic: str) -> str:
+        """
+        Run the research phase while the topic's searches are prefetched on
+        a background thread. Called inside the research telemetry phase, so
+        the prefetch's searches are recorded there; the agent's identical
+        searches then hit the cache or join the prefetch's request.
+
+        The prefetch is joined before the phase returns, so it never runs on
+        into later phases; its wait is bounded by the search timeout.
+        """
+        if not self.settings.search_prefetch:
+            return self._run_research_phase(topic)
+        prefetch = threading.Thread(
+            target=contextvars.copy_context().run, args=(self._prefetch_search, topic),
+            name="search-prefetch", daemon=True
+        )
+        prefetch.start()
+        try:
+            return self._run_research_phase(topic)
+        finally:
+            prefetch.join()
+
+    async def _run_phased_pipeline(self, topic: str) -> str:
+        """Run each phase as its own crew, passing results along in the prompts."""
+        # Phase 1: Research. The research agent spends its first LLM call
+        # planning, so the topic's searches are prefetched into the search
+        # cache meanwhile.
+        print_workflow_tree("research")
+        print_step(1, 5, "Research Phase")
+        research_result = await self._in_thread(
+            self._checkpointed, "research", self._run_research_with_prefetch, topic
+        )
+
+        # Phase 2: Analysis
+        print_workflow_tree("analysis")
+        print_step(2, 5, "Analysis Phase")
+        research_context = self._compact_for("analysis", research_result, topic,
+                                             self.settings.research_token_budget)
+        analysis_result = await self._in_thread(self._checkpointed, "analysis",
+                                                self._run_analysis_phase, topic, research_context)
+
+        # Phase 3: Initial Writing
+        print_workflow_tree("writing")
+        print_step(3, 5, "Writing Phase")
+        analysis_context = self._compact_for("writing", analysis_result, topic,
+                                             self.settings.analysis_token_budget)
+        first_critique = None
+        if self.settings.candidate_drafts > 1:
+            initial_draft, first_critique = await self._run_candidate_drafts(topic, analysis_context)
+        else:
+            initial_draft = await self._in_thread(self._checkpointed, "writing",
+                                                  self._run_writing_phase, topic, analysis_context)
+
+        # Phase 4 & 5: Iterative Critique and Refinement
+        return await self._run_refinement_loop(initial_draft, first_critique)
+
+    async def _run_candidate_drafts(self, topic: str,
+                                    analysis_result: str) -> Tuple[str, Tuple[str, CritiqueScore]]:
+        """
+        Write `candidate_drafts` drafts concurrently, each opening from a
+        different angle, and have the critic score them all in one call.
+
+        Returns the best-scored draft and the critic's feedback and score
+        for it, which serve as the first refinement critique.
+        """
+        count = self.settings.candidate_drafts
+        angles = list(DRAFT_ANGLES[:count])
+        print_agent_action("Writer Agent", f"Drafting {count} candidate posts concurrently...")
+        drafts: List[str] = list(await asyncio.gather(*(
+            self._in_thread(self._checkpointed, f"candidate_{number}",
+                            self._run_writing_phase, topic, analysis_result, angle)
+            for number, angle in enumerate(angles, 1)
+        )))
+        for number, (draft, angle) in enumerate(zip(drafts, angles), 1):
+            print_post_draft(draft, f"Candidate {number}: {angle}")
+
+        print_agent_action("Critic Agent", f"Scoring {count} candidates in one pass...")
+        critique = await self._in_thread(self._checkpointed, "selection",
+                                         self._run_selection_phase, drafts)
+        scores = parse_candidate_scores(critique, count)
+        # Unscored candidates rank last; ties go to the earlier candidate.
+        best = max(range(count), key=lambda i: (scores[i].overall is not None,
+                                                scores[i].overall or 0, -i))
+        self.candidates = {"scores": [score.overall for score in scores], "selected": best + 1}
+        print_success(f"Selected candidate {best + 1} ({angles[best]})")
+        return drafts[best], (candidate_feedback(critique, best + 1), scores[best])
+
+    def _compact_for(self, phase: str, text: str, topic: str, token_budget: int) -> str:
+        """
+        Compact the previous phase's output before it is pasted into the
+        `phase` prompt, and record the estimated size before and after.
+        """
+        if not self.settings.compaction_enabled:
+            tokens = estimate_tokens(text)
+            self.prompt_sizes[phase] = {"before": tokens, "after": tokens}
+            return text
+
+        result = compact(text, topic, token_budget)
+        self.prompt_sizes[phase] = {"before": result.tokens_before, "after": result.tokens_after}
+        print_agent_action("System", f"Compacted {phase} input: {result.summary()}")
+        return result.text
+
+    def _run_single_crew_pipeline(self, topic: str) -> str:
+        """
+        Run every phase in one crew built from the context-chained task
+        definitions.
+
+        crewai hands each task the outputs of its context tasks, so results
+        are not pasted into the next prompt by hand and the crew is set up
+        once. The crew runs a fixed `max_iterations` critique/edit rounds;
+        it cannot stop early on a good critique the way the phased loop does.
+        """
+        print_workflow_tree("research")
+        print_agent_action("System", "Running research -> analysis -> writing -> "
+                           f"{self.settings.max_iterations}x critique/edit as one crew...")
+
+        research_task = create_research_task(self.agents.get("research"), topic)
+        analysis_task = create_analysis_task(self.agents.get("analyst"), research_task)
+        writing_task = create_writing_task(self.agents.get("writer"), analysis_task)
+        tasks = [research_task, analysis_task, writing_task]
+
+        draft_task = writing_task
+        for iteration in range(1, self.settings.max_iterations + 1):
+            critique_task = create_critique_task(self.agents.get("critic"), draft_task)
+            editing_task = create_editing_task(self.agents.get("editor"), draft_task,
+                                               critique_task, iteration)
+            tasks.extend([critique_task, editing_task])
+            draft_task = editing_task
+
+        agents = list({id(task.agent): task.agent for task in tasks}.values())
+        crew = Crew(
+            agents=agents,
+            tasks=tasks,
+            process=Process.sequential,
+            verbose=self.settings.verbose
+        )
+
+        # The crew runs as a whole, so it is checkpointed as one phase.
+        outputs = self._checkpointed(
+            "pipeline",
+            lambda: [str(output) for output in self._kickoff(crew, "pipeline").tasks_output]
+        )
+
+        print_success("Research, analysis and writing completed")
+        print_post_draft(outputs[2], "Initial Draft")
+        self.refinement = {"iterations": self.settings.max_iterations, "scores": [],
+                           "criteria": {}, "stop_reason": "max_iterations",
+                           "final_score": None}
+        for iteration in range(1, self.settings.max_iterations + 1):
+            critique = outputs[1 + 2 * iteration]
+            score = parse_critique(critique)
+            self.refinement["scores"].append(score.overall)
+            self.refinement["criteria"] = score.criteria
+            print_critique(critique)
+            print_post_draft(outputs[2 + 2 * iteration], f"Draft after Iteration {iteration}")
+
+        print_success("Refinement loop completed")
+        return outputs[-1]
+
+    def _kickoff(self, crew: Crew, phase: str):
+        """
+        Run a crew and add its token usage to this generation's totals.
+
+        For phases the LLM cache applies to, an identical earlier crew
+        (same model, agents and task prompts) is replayed from the cache.
+        """
+        key = None
+        if self.llm_cache.applies_to(phase):
+            key = crew_cache_key(crew, self.agents.llm)
+            cached = self.llm_cache.get(key)
+            if cached is not None:
+                print_agent_action("System", f"Reusing cached {phase} result")
+                self.telemetry.record_llm({}, cache_hit=True)
+                return cached
+
+        result = crew.kickoff()
+        usage = getattr(result, "token_usage", None)
+        phase_usage = {}
+        if usage is not None:
+            with self._usage_lock:
+                for field in ("prompt_tokens", "completion_tokens", "total_tokens", "successful_requests"):
+                    phase_usage[field] = getattr(usage, field, 0) or 0
+                    self.token_usage[field] = self.token_usage.get(field, 0) + phase_usage[field]
+        self.telemetry.record_llm(phase_usage)
+        if key is not None:
+            self.llm_cache.put(key, phase, result, phase_usage)
+        return result
+
+    def _kickoff_streamed(self, crew: Crew, phase: str, title: str):
+        """
+        Like _kickoff, rendering the agent's tokens under `title` as they
+        arrive when streaming is enabled. Sets `last_streamed` so callers
+        know whether the output was already shown.
+        """
+        self.last_streamed = False
+        if self.streamer is None:
+            return self._kickoff(crew, phase)
+        with self.streamer.streaming(title):
+            result = self._kickoff(crew, phase)
+        self.last_streamed = self.streamer.tokens > 0
+        return result
+
     def _run_research_phase(self, topic: str) -> str:
         """Run the research phase with the research agent."""
         print_agent_action("Research Agent", "Initiating multi-query web search...")
 
-        research_agent = create_research_agent()
+        research_agent = self.agents.get("research")
 
         research_task = Task(
             description=(
@@ -146,7 +637,7 @@ class LinkedInPostGenerator:
             verbose=self.settings.verbose
         )
 
-        result = crew.kickoff()
+        result = self._kickoff(crew, "research")
         print_success("Research phase completed")
 
         return str(result)
@@ -155,7 +646,7 @@ class LinkedInPostGenerator:
         """Run the analysis phase with the analyst agent."""
         print_agent_action("Analyst Agent", "Synthesizing research findings...")
 
-        analyst_agent = create_analyst_agent()
+        analyst_agent = self.agents.get("analyst")
 
         analysis_task = Task(
             description=(
@@ -190,21 +681,33 @@ class LinkedInPostGenerator:
             verbose=self.settings.verbose
         )
 
-        result = crew.kickoff()
+        result = self._kickoff(crew, "analysis")
         print_success("Analysis phase completed")
 
         return str(result)
 
-    def _run_writing_phase(self, topic: str, analysis_result: str) -> str:
-        """Run the writing phase with the writer agent."""
-        print_agent_action("Writer Agent", "Crafting LinkedIn post draft...")
+    def _run_writing_phase(self, topic: str, analysis_result: str,
+                           angle: Optional[str] = None) -> str:
+        """
+        Run the writing phase with the writer agent.
 
-        writer_agent = create_writer_agent()
+        With `angle`, write one of several concurrent candidate drafts: the
+        post opens with that angle, and a dedicated writer agent is used
+        without streaming or printing the draft.
+        """
+        if angle is None:
+            print_agent_action("Writer Agent", "Crafting LinkedIn post draft...")
+            writer_agent = self.agents.get("writer")
+        else:
+            writer_agent = self.agents.build("writer")
 
         writing_task = Task(
             description=(
                 f"Write an engaging LinkedIn post about '{topic}' based on this analysis.\n\n"
                 f"Analysis:\n{analysis_result}\n\n"
+                + (f"Angle: open the post with {angle}, and build the post around it.\n\n"
+                   if angle else "")
+                +
                 "LinkedIn Post Requirements:\n"
                 "1. Hook: Start with a compelling first line that grabs attention\n"
                 "2. Structure: Use short paragraphs (2-3 lines each) for readability\n"
@@ -239,54 +742,120 @@ class LinkedInPostGenerator:
             verbose=self.settings.verbose
         )
 
-        result = crew.kickoff()
+        if angle is not None:
+            return str(self._kickoff(crew, "writing"))
+
+        result = self._kickoff_streamed(crew, "writing", "Initial Draft")
         draft = str(result)
 
         print_success("Initial draft completed")
-        print_post_draft(draft, "Initial Draft")
+        if not self.last_streamed:
+            print_post_draft(draft, "Initial Draft")
 
         return draft
 
-    def _run_refinement_loop(self, initial_draft: str) -> str:
+    async def _run_refinement_loop(self, initial_draft: str,
+                                   first_critique: Optional[Tuple[str, CritiqueScore]] = None) -> str:
         """
         Run the iterative critique and refinement loop.
 
+        The loop stops early when the critic's score reaches
+        `critic_score_threshold` (or it marks the post ready to publish),
+        when the score hasn't improved for `critic_plateau_patience`
+        critiques, or when the refinement token/time budget is spent. On a
+        plateau or budget stop, the best-scored draft is returned.
+
         Args:
             initial_draft: The initial post draft
+            first_critique: Critique text and score to use for iteration 1
+                instead of calling the critic (from candidate selection)
 
         Returns:
             The final refined post
         """
+        settings = self.settings
         current_draft = initial_draft
-
-        for iteration in range(1, self.settings.max_iterations + 1):
-            print_step(4 + iteration, 5 + self.settings.max_iterations,
+        best_draft, best_score = initial_draft, None
+        stalled = 0
+        loop_start = time.perf_counter()
+        tokens_start = self.token_usage.get("total_tokens", 0)
+        self.refinement = {"iterations": 0, "scores": [], "criteria": {}, "stop_reason": "max_iterations",
+                           "final_score": None}
+
+        for iteration in range(1, settings.max_iterations + 1):
+            print_step(4 + iteration, 5 + settings.max_iterations,
                       f"Refinement Iteration {iteration}")
-            print_iteration_summary(iteration, self.settings.max_iterations)
+            print_iteration_summary(iteration, settings.max_iterations)
+            self.refinement["iterations"] = iteration
 
             # Critique phase
-            print_agent_action("Critic Agent", "Evaluating post quality...")
-            critique = self._run_critique_phase(current_draft)
+            if iteration == 1 and first_critique is not None:
+                critique, score = first_critique
+            else:
+                print_agent_action("Critic Agent", "Evaluating post quality...")
+                critique = await self._in_thread(self._checkpointed, f"critique_{iteration}",
+                                                 self._run_critique_phase, current_draft)
+                score = parse_critique(critique)
 
             print_critique(critique)
 
+            self.refinement["scores"].append(score.overall)
+            self.refinement["criteria"] = score.criteria
+            if score.overall is None:
+                print_agent_action("System", "No score found in critique")
+            else:
+                print_agent_action("System", f"Critic score: {score.overall:g}/10 ({score.source})")
+                if best_score is None or score.overall > best_score:
+                    best_draft, best_score, stalled = current_draft, score.overall, 0
+                else:
+                    stalled += 1
+
             # Check if we should stop refining
-            if "ready to publish" in critique.lower() or "score: 9" in critique.lower() or "score: 10" in critique.lower():
+            if score.ready_to_publish or (
+                score.overall is not None and score.overall >= settings.critic_score_threshold
+            ):
+                self.refinement["stop_reason"] = "threshold"
+                self.refinement["final_score"] = score.overall
                 print_success(f"Post quality threshold met at iteration {iteration}!")
                 break
+            if stalled >= settings.critic_plateau_patience:
+                self.refinement["stop_reason"] = "plateau"
+                self.refinement["final_score"] = best_score
+                print_success(f"Score stopped improving at iteration {iteration}; keeping the best draft")
+                current_draft = best_draft
+                break
+            spent_tokens = self.token_usage.get("total_tokens", 0) - tokens_start
+            if (settings.refinement_token_budget is not None
+                    and spent_tokens >= settings.refinement_token_budget) or (
+                    settings.refinement_time_budget is not None
+                    and time.perf_counter() - loop_start >= settings.refinement_time_budget):
+                self.refinement["stop_reason"] = "budget"
+                # Without any critic score there is no best draft to go
+                # back to, so the latest edit is kept
+                if best_score is None:
+                    print_success(f"Refinement budget spent at iteration {iteration}")
+                else:
+                    print_success(f"Refinement budget spent at iteration {iteration}; keeping the best draft")
+                    current_draft = best_draft
+                    self.refinement["final_score"] = best_score
+                break
 
             # Editing phase
             print_agent_action("Editor Agent", "Refining based on feedback...")
-            current_draft = self._run_editing_phase(current_draft, critique, iteration)
+            self.last_streamed = False
+            current_draft = await self._in_thread(self._checkpointed, f"editing_{iteration}",
+                                                  self._run_editing_phase, current_draft,
+                                                  critique, iteration)
 
-            print_post_draft(current_draft, f"Draft after Iteration {iteration}")
+            if not self.last_streamed:
+                print_post_draft(current_draft, f"Draft after Iteration {iteration}")
 
         print_success("Refinement loop completed")
         return current_draft
 
     def _run_critique_phase(self, draft: str) -> str:
         """Run the critique phase with the critic agent."""
-        critic_agent = create_critic_agent()
+        critic_agent = self.agents.get("critic")
 
         critique_task = Task(
             description=(
@@ -309,6 +878,7 @@ class LinkedInPostGenerator:
                 "- Specific weaknesses to address\n"
                 "- Concrete suggestions for improvement\n"
                 "- Priority ranking of suggested changes"
+                + SCORE_INSTRUCTIONS
             ),
             expected_output=(
                 "A detailed critique with:\n"
@@ -316,7 +886,8 @@ class LinkedInPostGenerator:
                 "- What works well (to preserve in revision)\n"
                 "- What needs improvement (specific issues)\n"
                 "- Actionable recommendations (prioritized)\n"
-                "- Whether the post is ready or needs revision"
+                "- Whether the post is ready or needs revision\n"
+                "- A closing JSON block with the overall and per-criterion scores"
             ),
             agent=critic_agent
         )
@@ -328,12 +899,52 @@ class LinkedInPostGenerator:
             verbose=self.settings.verbose
         )
 
-        result = crew.kickoff()
+        result = self._kickoff(crew, "critique")
+        return str(result)
+
+    def _run_selection_phase(self, drafts: List[str]) -> str:
+        """Have the critic score every candidate draft in a single critique."""
+        critic_agent = self.agents.get("critic")
+        candidates = "\n\n".join(
+            f"Candidate {number}:\n{draft}" for number, draft in enumerate(drafts, 1)
+        )
+
+        selection_task = Task(
+            description=(
+                f"Critically evaluate these {len(drafts)} candidate LinkedIn post drafts "
+                "against quality standards, so the strongest one can be refined.\n\n"
+                f"{candidates}\n\n"
+                "Evaluate each candidate on hook effectiveness, value delivery, clarity, "
+                "accuracy, structure, engagement, LinkedIn optimization, authenticity, "
+                "length and hashtags.\n\n"
+                "For each candidate provide:\n"
+                "- Overall assessment (scale 1-10 with justification)\n"
+                "- Specific strengths to preserve\n"
+                "- Specific weaknesses to address\n"
+                "- Concrete, prioritized suggestions for improvement"
+                + candidate_score_instructions(len(drafts))
+            ),
+            expected_output=(
+                "A critique of every candidate, each under its own '### Candidate N' "
+                "heading, with scores, strengths, weaknesses and prioritized "
+                "recommendations, followed by a JSON block with every candidate's scores"
+            ),
+            agent=critic_agent
+        )
+
+        crew = Crew(
+            agents=[critic_agent],
+            tasks=[selection_task],
+            process=Process.sequential,
+            verbose=self.settings.verbose
+        )
+
+        result = self._kickoff(crew, "critique")
         return str(result)
 
     def _run_editing_phase(self, draft: str, critique: str, iteration: int) -> str:
         """Run the editing phase with the editor agent."""
-        editor_agent = create_editor_agent()
+        editor_agent = self.agents.get("editor")
 
         editing_task = Task(
             description=(
@@ -373,9 +984,19 @@ class LinkedInPostGenerator:
             verbose=self.settings.verbose
         )
 
-        result = crew.kickoff()
+        result = self._kickoff_streamed(crew, "editing", f"Draft after Iteration {iteration}")
         return str(result)
 
+    def _report_archived_topic(self, topic: str):
+        """Point out archived posts on the same topic before spending tokens on another."""
+        earlier = self.archive.search(topic=topic, limit=3)
+        if not earlier:
+            return
+        print_warning("The archive already has posts on this topic: " + ", ".join(
+            post["run_id"] + (f" (score {post['final_score']:g})" if post["final_score"] is not None else "")
+            for post in earlier
+        ))
+
     def _save_post_with_metadata(self, post: str, metadata: Dict[str, Any], filename: Path):
         """Save the post along with metadata."""
         content = f"""{'='*70}
@@ -0,0 +1,176 @@
+"""Machine-readable scores from the critic's output."""
+
+import json
+import re
+from dataclasses import dataclass, field
+from typing import Dict, List, Optional
+
+CRITERIA = (
+    "hook",
+    "value",
+    "clarity",
+    "accuracy",
+    "structure",
+    "engagement",
+    "linkedin_optimization",
+    "authenticity",
+    "length",
+    "hashtags",
+)
+
+# Appended to the critic's task so every critique ends with a parsable score.
+SCORE_INSTRUCTIONS = (
+    "\n\nEnd your critique with a JSON block in exactly this format "
+    "(scores are numbers from 1 to 10):\n"
+    "```json\n"
+    "{\"overall\": 7, \"criteria\": {"
+    + ", ".join(f"\"{name}\": 7" for name in CRITERIA)
+    + "}, \"ready_to_publish\": false}\n"
+    "```"
+)
+
+_JSON_BLOCK = re.compile(r"```(?:json)?\s*(\{.*?\})\s*```", re.DOTALL)
+_JSON_OBJECT = re.compile(r"\{[^{}]*\"overall\"[^{}]*(?:\{[^{}]*\}[^{}]*)?\}", re.DOTALL)
+# "### Candidate 2", "**Candidate 2 - bold take**" in batched critiques
+_CANDIDATE_HEADING = re.compile(r"^#*\s*\**\s*Candidate\s+(\d+)\b.*$", re.IGNORECASE | re.MULTILINE)
+
+# Free-text fallbacks: "Score: 9", "Score - 9", "Overall score: 8.5/10",
+# "9/10", "9 out of 10", also with the number in bold ("**8**/10"). The
+# first pattern that matches wins.
+_SCORE_PATTERNS = [
+    re.compile(r"overall[^0-9\n]{0,40}?(\d+(?:\.\d+)?)\**\s*(?:/|out of)\s*10", re.IGNORECASE),
+    re.compile(r"score\s*(?:[:=\-–—]|is)?\s*\**\s*(\d+(?:\.\d+)?)(?:\**\s*(?:/|out of)\s*10)?", re.IGNORECASE),
+    re.compile(r"(\d+(?:\.\d+)?)\**\s*(?:/|out of)\s*10\b", re.IGNORECASE),
+]
+
+
+@dataclass
+class CritiqueScore:
+    """Overall score (1-10, None if none was found) and per-criterion ratings."""
+
+    overall: Optional[float] = None
+    criteria: Dict[str, float] = field(default_factory=dict)
+    ready_to_publish: bool = False
+    source: str = "none"   # "json", "text" or "none"
+
+
+def _valid(value) -> Optional[float]:
+    try:
+        score = float(value)
+    except (TypeError, ValueError):
+        return None
+    return score if 0 <= score <= 10 else None
+
+
+def _score_from_dict(data: dict) -> Optional[CritiqueScore]:
+    overall = _valid(data.get("overall", data.get("score")))
+    if overall is None:
+        return None
+    criteria = {}
+    if isinstance(data.get("criteria"), dict):
+        for name, value in data["criteria"].items():
+            score = _valid(value)
+            if score is not None:
+                criteria[str(name)] = score
+    return CritiqueScore(overall, criteria, bool(data.get("ready_to_publish", False)), "json")
+
+
+def _json_candidates(text: str) -> List[dict]:
+    """JSON objects found in the text, last first."""
+    objects = []
+    for raw in reversed(_JSON_BLOCK.findall(text) or _JSON_OBJECT.findall(text)):
+        try:
+            data = json.loads(raw)
+        except ValueError:
+            continue
+        if isinstance(data, dict):
+            objects.append(data)
+    return objects
+
+
+def _from_json(text: str) -> Optional[CritiqueScore]:
+    for data in _json_candidates(text):
+        score = _score_from_dict(data)
+        if score is not None:
+            return score
+    return None
+
+
+def parse_critique(text: str) -> CritiqueScore:
+    """
+    Extract the critic's score: the JSON block requested by
+    SCORE_INSTRUCTIONS if present, otherwise the first recognizable
+    free-text score.
+    """
+    parsed = _from_json(text)
+    if parsed is not None:
+        return parsed
+    for pattern in _SCORE_PATTERNS:
+        for match in pattern.finditer(text):
+            score = _valid(match.group(1))
+            if score is not None:
+                return CritiqueScore(overall=score, source="text")
+    return CritiqueScore()
+
+
+def candidate_score_instructions(count: int) -> str:
+    """Instructions for scoring `count` candidate drafts in one critique."""
+    example = ", ".join(
+        f"{{\"candidate\": {n}, \"overall\": 7, \"criteria\": {{\"hook\": 7, \"value\": 7}}, "
+        f"\"ready_to_publish\": false}}"
+        for n in range(1, min(count, 2) + 1)
+    )
+    return (
+        f"\n\nStart the critique of each candidate with a heading line "
+        f"'### Candidate <number>'. Score every criterion ({', '.join(CRITERIA)}) "
+        "for every candidate, then end with a JSON block in exactly this format "
+        "(scores are numbers from 1 to 10, one entry per candidate):\n"
+        "```json\n"
+        f"{{\"candidates\": [{example}{', ...' if count > 2 else ''}]}}\n"
+        "```"
+    )
+
+
+def _candidate_sections(text: str) -> Dict[int, str]:
+    sections = {}
+    matches = list(_CANDIDATE_HEADING.finditer(text))
+    for i, match in enumerate(matches):
+        end = matches[i + 1].start() if i + 1 < len(matches) else len(text)
+        section = _JSON_BLOCK.sub("", text[match.start():end]).strip()
+        sections.setdefault(int(match.group(1)), section)
+    return sections
+
+
+def parse_candidate_scores(text: str, count: int) -> List[CritiqueScore]:
+    """
+    Scores for candidates 1..count from a batched critique: the JSON block
+    requested by candidate_score_instructions if present, otherwise each
+    candidate's section parsed on its own.
+    """
+    scores = [CritiqueScore() for _ in range(count)]
+    for data in _json_candidates(text):
+        entries = data.get("candidates")
+        if not isinstance(entries, list):
+            continue
+        for position, entry in enumerate(entries, 1):
+            if not isinstance(entry, dict):
+                continue
+            try:
+                number = int(entry.get("candidate", position))
+            except (TypeError, ValueError):
+                number = position
+            score = _score_from_dict(entry)
+            if score is not None and 1 <= number <= count:
+                scores[number - 1] = score
+        if any(score.overall is not None for score in scores):
+            return scores
+
+    for number, section in _candidate_sections(text).items():
+        if 1 <= number <= count:
+            scores[number - 1] = parse_critique(section)
+    return scores
+
+
+def candidate_feedback(text: str, number: int) -> str:
+    """The part of a batched critique about candidate `number` (all of it if not found)."""
+    return _candidate_sections(text).get(number, text)
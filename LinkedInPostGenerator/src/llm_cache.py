@@ -0,0 +1,178 @@
+"""Content-addressed on-disk cache for crew (LLM) results."""
+
+import hashlib
+import json
+import os
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, List, Optional
+
+from .config import Settings, get_settings
+
+PHASES = ("research", "analysis", "writing", "critique", "editing", "pipeline")
+
+
+class CachedCrewOutput:
+    """
+    Stand-in for a CrewOutput replayed from the cache.
+
+    Supports what the orchestrator reads from a real result: str(),
+    `raw`, `tasks_output` and `token_usage` (None, nothing was spent).
+    """
+
+    token_usage = None
+
+    def __init__(self, raw: str, tasks_output: List[str]):
+        self.raw = raw
+        self.tasks_output = tasks_output
+
+    def __str__(self) -> str:
+        return self.raw
+
+
+def crew_cache_key(crew, llm) -> str:
+    """
+    Hash of everything that determines a crew's LLM output: model and
+    sampling parameters, each agent's system prompt (role, goal, backstory)
+    and each task's prompt.
+    """
+    payload = {
+        "model": getattr(llm, "model", None),
+        "temperature": getattr(llm, "temperature", None),
+        "max_tokens": getattr(llm, "max_tokens", None),
+        "tasks": [
+            {
+                "role": task.agent.role,
+                "goal": task.agent.goal,
+                "backstory": task.agent.backstory,
+                "description": task.description,
+                "expected_output": task.expected_output,
+            }
+            for task in crew.tasks
+        ],
+    }
+    return hashlib.sha256(json.dumps(payload, sort_keys=True).encode("utf-8")).hexdigest()
+
+
+class LLMResponseCache:
+    """
+    Crew results stored as one JSON file per content hash under `directory`.
+
+    Only phases listed in `phases` are cached, and entries of a phase in
+    `max_ages` are only replayed for that many seconds. Once the files exceed
+    `max_bytes`, the least recently used entries are deleted; hits refresh
+    an entry's modification time. Writes go to a temporary file first, so a
+    crash never leaves a truncated entry behind.
+    """
+
+    def __init__(self, directory: Path, phases, max_bytes: int, enabled: bool = True,
+                 max_ages: Optional[Dict[str, float]] = None):
+        self.directory = Path(directory)
+        self.phases = frozenset(phases)
+        self.max_ages = dict(max_ages or {})
+        self.max_bytes = max_bytes
+        self.enabled = enabled
+        self.stats = {"hits": 0, "misses": 0, "evictions": 0, "tokens_saved": 0}
+        self._lock = threading.Lock()
+        self._total_bytes: Optional[int] = None
+
+    @classmethod
+    def from_settings(cls, settings: Optional[Settings] = None) -> "LLMResponseCache":
+        settings = settings or get_settings()
+        phases = [p.strip() for p in settings.llm_cache_phases.split(",") if p.strip()]
+        unknown = set(phases) - set(PHASES)
+        if unknown:
+            raise ValueError(f"Unknown LLM cache phases {sorted(unknown)}, expected some of {PHASES}")
+        return cls(
+            settings.llm_cache_dir,
+            phases,
+            max_bytes=int(settings.llm_cache_max_mb * 1024 * 1024),
+            enabled=settings.llm_cache_enabled,
+            max_ages={"research": settings.llm_cache_research_max_age}
+            if settings.llm_cache_research_max_age is not None else None
+        )
+
+    def reset_stats(self):
+        self.stats = dict.fromkeys(self.stats, 0)
+
+    def applies_to(self, phase: str) -> bool:
+        return self.enabled and phase in self.phases
+
+    def _path(self, key: str) -> Path:
+        return self.directory / key[:2] / f"{key}.json"
+
+    def _entries(self):
+        return [p for p in self.directory.glob("*/*.json") if p.is_file()]
+
+    def get(self, key: str) -> Optional[CachedCrewOutput]:
+        path = self._path(key)
+        try:
+            with open(path, encoding="utf-8") as f:
+                entry = json.load(f)
+        except (OSError, ValueError):
+            self.stats["misses"] += 1
+            return None
+        max_age = self.max_ages.get(entry.get("phase"))
+        # Entries written before created_at was recorded count as expired
+        if max_age is not None and time.time() - entry.get("created_at", 0) > max_age:
+            self.stats["misses"] += 1
+            return None
+        try:
+            os.utime(path)
+        except OSError:
+            pass
+        self.stats["hits"] += 1
+        self.stats["tokens_saved"] += entry.get("token_usage", {}).get("total_tokens", 0)
+        return CachedCrewOutput(entry["raw"], entry["tasks_output"])
+
+    def put(self, key: str, phase: str, result, token_usage: Dict[str, Any]):
+        entry = {
+            "phase": phase,
+            "created_at": time.time(),
+            "raw": str(result),
+            "tasks_output": [str(output) for output in getattr(result, "tasks_output", [])],
+            "token_usage": token_usage,
+        }
+        data = json.dumps(entry).encode("utf-8")
+        path = self._path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        tmp = path.with_suffix(f".{os.getpid()}.{threading.get_ident()}.tmp")
+        with open(tmp, "wb") as f:
+            f.write(data)
+        os.replace(tmp, path)
+
+        with self._lock:
+            if self._total_bytes is None:
+                self._total_bytes = sum(p.stat().st_size for p in self._entries())
+            else:
+                self._total_bytes += len(data)
+            if self._total_bytes > self.max_bytes:
+                self._evict()
+
+    def _evict(self):
+        entries = []
+        for p in self._entries():
+            try:
+                st = p.stat()
+            except OSError:
+                continue
+            entries.append((st.st_mtime, st.st_size, p))
+        entries.sort()
+        total = sum(size for _, size, _ in entries)
+        for _, size, p in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                p.unlink()
+            except OSError:
+                continue
+            total -= size
+            self.stats["evictions"] += 1
+        self._total_bytes = total
+
+    def clear(self):
+        with self._lock:
+            for p in self._entries():
+                p.unlink()
+            self._total_bytes = 0
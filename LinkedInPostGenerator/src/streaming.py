@@ -0,0 +1,82 @@
+"""Streams writer and editor tokens to the output sink as they are generated."""
+
+import time
+from contextlib import contextmanager
+from typing import Any, Iterator, Optional
+
+try:
+    from crewai.events import LLMCallStartedEvent, LLMStreamChunkEvent, crewai_event_bus
+except ImportError:  # older crewai releases
+    from crewai.utilities.events import LLMCallStartedEvent, LLMStreamChunkEvent, crewai_event_bus
+
+from .telemetry import record_first_token
+from .utils import get_output_sink, print_agent_action
+
+
+@crewai_event_bus.on(LLMCallStartedEvent)
+def _on_llm_call_started(source: Any, event: Any):
+    listener = getattr(source, "stream_listener", None)
+    if listener is not None:
+        listener.on_call_start()
+
+
+@crewai_event_bus.on(LLMStreamChunkEvent)
+def _on_llm_stream_chunk(source: Any, event: Any):
+    """
+    Forward a chunk to the stream listener of the client that streamed it.
+
+    Handlers run in the thread making the call, and the source is the
+    client that streamed the chunk, so concurrent jobs never see each
+    other's tokens. crewai's own console listener still prints every chunk
+    to stdout as well.
+    """
+    listener = getattr(source, "stream_listener", None)
+    if listener is not None:
+        listener.on_token(event.chunk)
+
+
+class DraftStreamer:
+    """
+    Stream listener of the LLM client used by the writer and editor agents
+    (see `create_llm`).
+
+    Tokens are only rendered inside `streaming()`, i.e. while the
+    orchestrator runs a writing or editing crew; the time from the first
+    request to the first token is reported to the phase's telemetry.
+    """
+
+    def __init__(self):
+        self.tokens = 0
+        self._stream: Optional[Any] = None
+        self._title: Optional[str] = None
+        self._phase_start: Optional[float] = None
+
+    @contextmanager
+    def streaming(self, title: str) -> Iterator["DraftStreamer"]:
+        """Render tokens under `title` until the block exits."""
+        self.tokens = 0
+        self._title = title
+        self._phase_start = None
+        try:
+            yield self
+        finally:
+            if self._stream is not None:
+                self._stream.close()
+                self._stream = None
+            self._title = None
+
+    def on_call_start(self):
+        if self._title is not None and self._phase_start is None:
+            self._phase_start = time.perf_counter()
+
+    def on_token(self, token: str):
+        if self._title is None or not token:
+            return
+        if self._stream is None:
+            first_token = time.perf_counter() - (self._phase_start or time.perf_counter())
+            record_first_token(first_token)
+            print_agent_action("System", f"First token after {first_token:.2f}s")
+            self._stream = get_output_sink().token_stream(self._title)
+            self._stream.open()
+        self.tokens += 1
+        self._stream.write(token)
@@ -0,0 +1,196 @@
+"""Per-phase latency, token and cost telemetry for generation runs."""
+
+import json
+import math
+import threading
+import time
+from contextlib import contextmanager
+from contextvars import ContextVar
+from dataclasses import asdict, dataclass
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, Iterator, List, Optional
+
+
+@dataclass
+class PhaseRecord:
+    """What one phase (or one refinement iteration of a phase) cost."""
+
+    phase: str
+    iteration: Optional[int] = None
+    seconds: float = 0.0
+    prompt_tokens: int = 0
+    completion_tokens: int = 0
+    llm_calls: int = 0
+    llm_cache_hits: int = 0
+    search_calls: int = 0
+    search_cache_hits: int = 0
+    cost_usd: float = 0.0
+    first_token_seconds: Optional[float] = None   # streamed phases only
+    resumed: bool = False
+
+    @property
+    def key(self) -> str:
+        return self.phase if self.iteration is None else f"{self.phase}_{self.iteration}"
+
+    def to_dict(self) -> Dict[str, Any]:
+        data = asdict(self)
+        data["seconds"] = round(self.seconds, 3)
+        data["cost_usd"] = round(self.cost_usd, 6)
+        return data
+
+
+# The phase being run in this context. Search tools called by the phase's
+# agents run in the same thread (or in a copied context), so they can
+# attribute their calls to it without any reference to the generator.
+_current_phase: ContextVar[Optional[PhaseRecord]] = ContextVar("current_phase", default=None)
+# Search threads of one phase update its record concurrently
+_record_lock = threading.Lock()
+
+
+def record_search(cache_hit: bool):
+    """Count one search tool call against the current phase, if any."""
+    record = _current_phase.get()
+    if record is None:
+        return
+    with _record_lock:
+        record.search_calls += 1
+        record.search_cache_hits += int(cache_hit)
+
+
+def record_first_token(seconds: float):
+    """Time to first streamed token of the current phase; later calls are ignored."""
+    record = _current_phase.get()
+    if record is None:
+        return
+    with _record_lock:
+        if record.first_token_seconds is None:
+            record.first_token_seconds = round(seconds, 3)
+
+
+class RunTelemetry:
+    """
+    Collects a PhaseRecord per phase of one run. Costs use the per-million
+    token prices passed in (input and output), so they are estimates.
+    """
+
+    def __init__(self, input_cost_per_mtok: float = 0.0, output_cost_per_mtok: float = 0.0):
+        self.input_cost_per_mtok = input_cost_per_mtok
+        self.output_cost_per_mtok = output_cost_per_mtok
+        self.records: List[PhaseRecord] = []
+
+    @contextmanager
+    def phase(self, name: str, iteration: Optional[int] = None) -> Iterator[PhaseRecord]:
+        """Time a phase and make it the target of record_llm()/record_search()."""
+        record = PhaseRecord(name, iteration)
+        self.records.append(record)
+        token = _current_phase.set(record)
+        start = time.perf_counter()
+        try:
+            yield record
+        finally:
+            record.seconds = time.perf_counter() - start
+            _current_phase.reset(token)
+
+    def record_llm(self, usage: Dict[str, int], cache_hit: bool = False):
+        """Add one crew kickoff's token usage to the current phase."""
+        record = _current_phase.get()
+        if record is None:
+            return
+        with _record_lock:
+            if cache_hit:
+                record.llm_cache_hits += 1
+                return
+            prompt = usage.get("prompt_tokens", 0)
+            completion = usage.get("completion_tokens", 0)
+            record.prompt_tokens += prompt
+            record.completion_tokens += completion
+            record.llm_calls += usage.get("successful_requests", 0)
+            record.cost_usd += (prompt * self.input_cost_per_mtok
+                                + completion * self.output_cost_per_mtok) / 1_000_000
+
+    def by_phase(self) -> Dict[str, Dict[str, Any]]:
+        """Records keyed by phase (and iteration), for the saved metadata."""
+        result = {}
+        for record in self.records:
+            data = record.to_dict()
+            del data["phase"], data["iteration"]
+            result[record.key] = data
+        return result
+
+    def totals(self) -> Dict[str, Any]:
+        return {
+            "seconds": round(sum(r.seconds for r in self.records), 3),
+            "prompt_tokens": sum(r.prompt_tokens for r in self.records),
+            "completion_tokens": sum(r.completion_tokens for r in self.records),
+            "llm_calls": sum(r.llm_calls for r in self.records),
+            "search_calls": sum(r.search_calls for r in self.records),
+            "cost_usd": round(sum(r.cost_usd for r in self.records), 6),
+        }
+
+
+_log_lock = threading.Lock()
+
+
+def append_run_log(path: Path, run: Dict[str, Any], telemetry: RunTelemetry):
+    """Append one JSON line describing a finished run and its phases."""
+    line = json.dumps({
+        **run,
+        "completed_at": datetime.now().isoformat(timespec="seconds"),
+        "totals": telemetry.totals(),
+        "phases": [r.to_dict() for r in telemetry.records],
+    })
+    path.parent.mkdir(parents=True, exist_ok=True)
+    with _log_lock, open(path, "a", encoding="utf-8") as f:
+        f.write(line + "\n")
+
+
+def load_run_log(path: Path, last: Optional[int] = None) -> List[Dict[str, Any]]:
+    """Runs from a telemetry log, oldest first; unreadable lines are skipped."""
+    runs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            try:
+                runs.append(json.loads(line))
+            except ValueError:
+                continue
+    return runs[-last:] if last else runs
+
+
+def percentile(sorted_values: List[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
+
+
+def aggregate_runs(runs: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """
+    Per-phase statistics across runs. Iterations of critique and editing
+    are pooled under their phase name; phases replayed from a checkpoint
+    are left out since they cost nothing.
+    """
+    pooled: Dict[str, List[Dict[str, Any]]] = {}
+    for run in runs:
+        for record in run.get("phases", []):
+            if not record.get("resumed"):
+                pooled.setdefault(record["phase"], []).append(record)
+
+    stats = {}
+    for phase, records in pooled.items():
+        seconds = sorted(r["seconds"] for r in records)
+        first_token = sorted(r["first_token_seconds"] for r in records
+                             if r.get("first_token_seconds") is not None)
+        n = len(records)
+        stats[phase] = {
+            "count": n,
+            "p50_seconds": percentile(seconds, 0.5),
+            "p95_seconds": percentile(seconds, 0.95),
+            "max_seconds": seconds[-1],
+            "p50_first_token_seconds": percentile(first_token, 0.5) if first_token else None,
+            "mean_prompt_tokens": sum(r["prompt_tokens"] for r in records) / n,
+            "mean_completion_tokens": sum(r["completion_tokens"] for r in records) / n,
+            "mean_llm_calls": sum(r["llm_calls"] for r in records) / n,
+            "mean_search_calls": sum(r["search_calls"] for r in records) / n,
+            "llm_cache_hit_rate": sum(r["llm_cache_hits"] > 0 for r in records) / n,
+            "mean_cost_usd": sum(r.get("cost_usd", 0.0) for r in records) / n,
+        }
+    return stats
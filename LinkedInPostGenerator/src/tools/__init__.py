@@ -1,5 +1,71 @@
 """Custom tools for the LinkedIn Post Generator."""
 
-from .web_search import web_search, multi_query_search
+from typing import TYPE_CHECKING
 
-__all__ = ["web_search", "multi_query_search"]
+from .._lazy import lazy_exports
+
+# Submodule defining each exported name. The search tools pull in crewai,
+# langchain and duckduckgo_search, so submodules are only imported on first
+# attribute access; e.g. `from src.tools.dedupe import simhash` stays
+# stdlib-only.
+#
+# The search tools used to live in `web_search.py`. There is deliberately no
+# shim under that name: importing a `src.tools.web_search` submodule binds
+# the module over the `web_search` tool on this package (which the eager
+# `from .web_search import web_search` used to undo right away), so agents
+# built afterwards would get the module as a tool. Import the tools from
+# `src.tools` or `src.tools.search_tools`.
+_EXPORTS = {
+    "web_search": ".search_tools",
+    "multi_query_search": ".search_tools",
+    "prefetch_topic_search": ".search_tools",
+    "SearchBackend": ".search_backends",
+    "SearchBackendError": ".search_backends",
+    "DuckDuckGoBackend": ".search_backends",
+    "LocalCorpusBackend": ".search_backends",
+    "create_search_backend": ".search_backends",
+    "get_search_backend": ".search_backends",
+    "get_search_rate_limiter": ".search_backends",
+    "SearchCache": ".search_cache",
+    "SearchCacheMiss": ".search_cache",
+    "get_search_cache": ".search_cache",
+    "NearDuplicateIndex": ".dedupe",
+    "canonicalize_url": ".dedupe",
+    "simhash": ".dedupe",
+}
+
+if TYPE_CHECKING:
+    from .search_tools import web_search, multi_query_search, prefetch_topic_search
+    from .search_backends import (
+        SearchBackend,
+        SearchBackendError,
+        DuckDuckGoBackend,
+        LocalCorpusBackend,
+        create_search_backend,
+        get_search_backend,
+        get_search_rate_limiter,
+    )
+    from .search_cache import SearchCache, SearchCacheMiss, get_search_cache
+    from .dedupe import NearDuplicateIndex, canonicalize_url, simhash
+
+
+__getattr__, __dir__ = lazy_exports(__name__, globals(), _EXPORTS)
+
+__all__ = [
+    "web_search",
+    "multi_query_search",
+    "prefetch_topic_search",
+    "SearchBackend",
+    "SearchBackendError",
+    "DuckDuckGoBackend",
+    "LocalCorpusBackend",
+    "create_search_backend",
+    "get_search_backend",
+    "get_search_rate_limiter",
+    "SearchCache",
+    "SearchCacheMiss",
+    "get_search_cache",
+    "NearDuplicateIndex",
+    "canonicalize_url",
+    "simhash",
+]
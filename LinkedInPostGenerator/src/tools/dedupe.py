@@ -0,0 +1,107 @@
+"""URL canonicalization and near-duplicate detection for search results."""
+
+import hashlib
+import re
+from typing import Dict, List, Optional
+from urllib.parse import parse_qsl, urlencode, urlsplit, urlunsplit
+
+# Query parameters that only track where a click came from. Generic names
+# such as source, ref, share, feature or si are kept, because on some sites
+# they select the content (a branch's ref, a feed's source).
+TRACKING_PARAMS = frozenset({
+    "fbclid", "gclid", "dclid", "msclkid", "yclid", "igshid", "mc_cid", "mc_eid",
+    "ref_src", "ref_url", "referrer", "spm", "cmpid", "_ga", "_gl", "trk", "trkinfo",
+})
+TRACKING_PREFIXES = ("utm_", "pk_", "hsa_", "oly_")
+HOST_PREFIXES = ("www.", "m.", "mobile.", "amp.")
+
+_WORD = re.compile(r"\w+", re.UNICODE)
+
+
+def canonicalize_url(url: str) -> str:
+    """
+    Normalize a URL so tracking variants and mirrors of one page compare equal:
+    https scheme, lowercase host without www./m./amp. or default port,
+    tracking parameters dropped, remaining parameters sorted, no fragment
+    and no trailing slash.
+    """
+    try:
+        parts = urlsplit(url.strip())
+    except ValueError:
+        return url
+    if not parts.netloc:
+        return url
+
+    scheme = "https" if parts.scheme in ("http", "https", "") else parts.scheme.lower()
+    host = (parts.hostname or "").rstrip(".")
+    for prefix in HOST_PREFIXES:
+        if host.startswith(prefix):
+            host = host[len(prefix):]
+            break
+    port = parts.port if parts.port not in (None, 80, 443) else None
+    netloc = f"{host}:{port}" if port else host
+
+    query = sorted(
+        (k, v) for k, v in parse_qsl(parts.query, keep_blank_values=True)
+        if k.lower() not in TRACKING_PARAMS and not k.lower().startswith(TRACKING_PREFIXES)
+    )
+    path = re.sub(r"/{2,}", "/", parts.path)
+    if path.endswith("/amp"):
+        path = path[:-4]
+    path = path.rstrip("/")
+    return urlunsplit((scheme, netloc, path, urlencode(query), ""))
+
+
+def simhash(text: str, bits: int = 64) -> Optional[int]:
+    """
+    SimHash of the word 2-shingles in `text`; None when the text is too
+    short to compare meaningfully.
+    """
+    words = _WORD.findall(text.lower())
+    if len(words) < 4:
+        return None
+    shingles = {f"{a} {b}" for a, b in zip(words, words[1:])}
+    digests = [
+        format(int.from_bytes(hashlib.blake2b(s.encode(), digest_size=bits // 8).digest(), "big"),
+               f"0{bits}b")
+        for s in shingles
+    ]
+    # Bit i of the signature is set when most shingle hashes have it set;
+    # columns are counted on the binary strings, which is much faster than
+    # shifting every hash bit by bit.
+    half = len(digests) / 2
+    ones = [column.count("1") for column in zip(*digests)]
+    return int("".join("1" if count > half else "0" for count in ones), 2)
+
+
+class NearDuplicateIndex:
+    """
+    SimHash signatures bucketed by LSH bands. With `bands` > `max_distance`,
+    any two signatures within `max_distance` bits share at least one band
+    (pigeonhole), so lookups only compare against the few signatures in
+    matching buckets and a whole result set is processed in linear time.
+    """
+
+    def __init__(self, bits: int = 64, bands: int = 4, max_distance: int = 3):
+        if bands <= max_distance:
+            raise ValueError("bands must exceed max_distance for the LSH guarantee")
+        self.bits = bits
+        self.band_bits = bits // bands
+        self.bands = bands
+        self.max_distance = max_distance
+        self._buckets: List[Dict[int, List[int]]] = [{} for _ in range(bands)]
+
+    def _keys(self, signature: int):
+        mask = (1 << self.band_bits) - 1
+        return [(signature >> (band * self.band_bits)) & mask for band in range(self.bands)]
+
+    def add_if_new(self, signature: int) -> bool:
+        """Index `signature` and return True, or return False if a near duplicate is indexed."""
+        keys = self._keys(signature)
+        for band, key in enumerate(keys):
+            for other in self._buckets[band].get(key, ()):
+                if bin(signature ^ other).count("1") <= self.max_distance:
+                    return False
+        for band, key in enumerate(keys):
+            self._buckets[band].setdefault(key, []).append(signature)
+        return True
@@ -0,0 +1,194 @@
+"""Search backends used by the web search tools."""
+
+import json
+import random
+import re
+import sqlite3
+import threading
+import time
+from pathlib import Path
+from typing import Any, Dict, Iterable, List, Optional
+
+from langchain_core.rate_limiters import InMemoryRateLimiter
+
+from ..config import get_settings
+
+SEARCH_BACKENDS = ("duckduckgo", "local")
+
+_TOKEN = re.compile(r"[a-z0-9]+")
+
+
+class SearchBackendError(RuntimeError):
+    """Raised when a backend fails to answer a query."""
+
+
+class SearchBackend:
+    """
+    Text search interface.
+
+    Results use the DuckDuckGo shape the tools already consume:
+    dicts with "title", "href" and "body".
+    """
+
+    name = "base"
+
+    def text(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        raise NotImplementedError
+
+
+class DuckDuckGoBackend(SearchBackend):
+    """Live web search through one shared DDGS session."""
+
+    name = "duckduckgo"
+
+    def __init__(self, timeout: float = 10.0, region: str = "wt-wt", safesearch: str = "moderate"):
+        # Imported here so the local backend works without the package.
+        from duckduckgo_search import DDGS
+
+        self.ddgs = DDGS(timeout=timeout)
+        self.region = region
+        self.safesearch = safesearch
+
+    def text(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        return list(self.ddgs.text(
+            keywords=query,
+            max_results=max_results,
+            region=self.region,
+            safesearch=self.safesearch
+        ))
+
+
+class LocalCorpusBackend(SearchBackend):
+    """
+    Offline stand-in for web search: BM25-ranked results from a SQLite FTS5
+    index over document titles and snippets.
+
+    `latency_ms` (+/- `latency_jitter_ms`) is slept before every query and
+    `failure_rate` of queries raise SearchBackendError, so research-phase
+    throughput and failure handling can be measured reproducibly.
+    """
+
+    name = "local"
+
+    def __init__(
+        self,
+        path: Path,
+        latency_ms: float = 0.0,
+        latency_jitter_ms: float = 0.0,
+        failure_rate: float = 0.0,
+        seed: Optional[int] = None
+    ):
+        self.path = Path(path)
+        self.latency_ms = latency_ms
+        self.latency_jitter_ms = latency_jitter_ms
+        self.failure_rate = failure_rate
+        self._rng = random.Random(seed)
+        self._lock = threading.Lock()
+        self.path.parent.mkdir(parents=True, exist_ok=True)
+        # Queries come from the search worker threads; access is serialized by self._lock.
+        self.conn = sqlite3.connect(str(self.path), check_same_thread=False)
+        self.conn.execute(
+            "CREATE VIRTUAL TABLE IF NOT EXISTS documents USING fts5("
+            "title, body, href UNINDEXED, tokenize = 'porter unicode61')"
+        )
+        self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    def add_documents(self, documents: Iterable[Dict[str, Any]]) -> int:
+        """Index documents with "title", "href"/"url" and "body"/"snippet" keys."""
+        rows = [
+            (d.get("title", ""), d.get("body", d.get("snippet", "")), d.get("href", d.get("url", "")))
+            for d in documents
+        ]
+        with self._lock:
+            self.conn.executemany("INSERT INTO documents (title, body, href) VALUES (?, ?, ?)", rows)
+            self.conn.commit()
+        return len(rows)
+
+    def import_jsonl(self, path: Path) -> int:
+        """Index one document per line of a JSONL file."""
+        with open(path, encoding="utf-8") as f:
+            return self.add_documents(json.loads(line) for line in f if line.strip())
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM documents").fetchone()[0]
+
+    def _inject_faults(self):
+        with self._lock:
+            delay = self.latency_ms + self._rng.uniform(-1, 1) * self.latency_jitter_ms
+            fail = self._rng.random() < self.failure_rate
+        if delay > 0:
+            time.sleep(delay / 1000)
+        if fail:
+            raise SearchBackendError("Injected search failure")
+
+    def text(self, query: str, max_results: int) -> List[Dict[str, Any]]:
+        self._inject_faults()
+        terms = _TOKEN.findall(query.lower())
+        if not terms:
+            return []
+        match = " OR ".join(f'"{t}"' for t in dict.fromkeys(terms))
+        with self._lock:
+            rows = self.conn.execute(
+                "SELECT title, href, body FROM documents WHERE documents MATCH ? "
+                "ORDER BY bm25(documents, 2.0, 1.0) LIMIT ?",
+                (match, max_results)
+            ).fetchall()
+        return [{"title": title, "href": href, "body": body} for title, href, body in rows]
+
+
+def create_search_backend(settings) -> SearchBackend:
+    """Build the backend selected by `settings.search_backend`."""
+    if settings.search_backend == "duckduckgo":
+        return DuckDuckGoBackend(timeout=settings.search_timeout)
+    if settings.search_backend == "local":
+        return LocalCorpusBackend(
+            settings.search_corpus_path,
+            latency_ms=settings.search_latency_ms,
+            latency_jitter_ms=settings.search_latency_jitter_ms,
+            failure_rate=settings.search_failure_rate,
+            seed=settings.search_seed
+        )
+    raise ValueError(
+        f"Unknown search backend {settings.search_backend!r}, expected one of {SEARCH_BACKENDS}"
+    )
+
+
+_search_backend: Optional[SearchBackend] = None
+_search_backend_lock = threading.Lock()
+
+
+def get_search_backend() -> SearchBackend:
+    """Process-wide search backend configured from settings."""
+    global _search_backend
+    with _search_backend_lock:
+        if _search_backend is None:
+            _search_backend = create_search_backend(get_settings())
+        return _search_backend
+
+
+_search_rate_limiter: Optional[InMemoryRateLimiter] = None
+_search_rate_limiter_lock = threading.Lock()
+
+
+def get_search_rate_limiter() -> Optional[InMemoryRateLimiter]:
+    """
+    Process-wide token bucket for backend queries, or None if unlimited.
+
+    Shared by every search worker and batch job; cache hits don't use it.
+    """
+    global _search_rate_limiter
+    rate = get_settings().search_requests_per_second
+    if not rate:
+        return None
+    with _search_rate_limiter_lock:
+        if _search_rate_limiter is None:
+            _search_rate_limiter = InMemoryRateLimiter(
+                requests_per_second=rate,
+                check_every_n_seconds=0.05,
+                max_bucket_size=max(1.0, rate)
+            )
+        return _search_rate_limiter
@@ -0,0 +1,221 @@
+"""Persistent SQLite cache for web search results."""
+
+import hashlib
+import json
+import sqlite3
+import threading
+import time
+from concurrent.futures import Future
+from pathlib import Path
+from typing import Any, Callable, Dict, List, Optional
+
+from ..config import get_settings
+
+CACHE_MODES = ("read_through", "refresh", "offline", "off")
+
+
+class SearchCacheMiss(LookupError):
+    """Raised in offline mode when a query has no cached results."""
+
+
+def normalize_query(query: str) -> str:
+    """Case- and whitespace-insensitive form of a search query."""
+    return " ".join(query.casefold().split())
+
+
+def cache_key(query: str, params: Dict[str, Any]) -> str:
+    """Stable key for a normalized query plus its search parameters."""
+    payload = json.dumps([normalize_query(query), params], sort_keys=True)
+    return hashlib.sha256(payload.encode("utf-8")).hexdigest()
+
+
+class SearchCache:
+    """
+    Search results stored in SQLite, keyed on the normalized query and
+    search parameters.
+
+    Modes:
+        read_through  serve fresh entries, fetch and store on miss or expiry
+        refresh       always fetch and overwrite the stored entry
+        offline       serve any stored entry regardless of age, never fetch
+        off           bypass the cache entirely
+
+    The cache holds at most `max_entries` rows; expired rows are evicted
+    first, then the least recently used. Concurrent fetches of the same
+    query share one search: later callers wait for the one in flight.
+    """
+
+    def __init__(
+        self,
+        path: Path,
+        mode: str = "read_through",
+        ttl_seconds: float = 86400,
+        max_entries: int = 5000
+    ):
+        if mode not in CACHE_MODES:
+            raise ValueError(f"Unknown search cache mode {mode!r}, expected one of {CACHE_MODES}")
+        self.path = Path(path)
+        self.mode = mode
+        self.ttl_seconds = ttl_seconds
+        self.max_entries = max_entries
+        self.stats = {"hits": 0, "misses": 0, "expired": 0, "fetches": 0, "evictions": 0,
+                      "joined": 0}
+        self._lock = threading.Lock()
+        self._in_flight: Dict[str, Future] = {}
+        self._conn: Optional[sqlite3.Connection] = None
+
+    def _connection(self) -> sqlite3.Connection:
+        # Opened lazily so that mode "off" never touches the disk.
+        if self._conn is None:
+            self.path.parent.mkdir(parents=True, exist_ok=True)
+            # Searches run on worker threads; access is serialized by self._lock.
+            self._conn = sqlite3.connect(str(self.path), check_same_thread=False)
+            self._conn.execute("PRAGMA journal_mode = WAL")
+            self._conn.execute("""
+                CREATE TABLE IF NOT EXISTS search_cache (
+                    key TEXT PRIMARY KEY,
+                    query TEXT NOT NULL,
+                    params TEXT NOT NULL,
+                    results TEXT NOT NULL,
+                    created_at REAL NOT NULL,
+                    accessed_at REAL NOT NULL
+                )
+            """)
+            self._conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_search_cache_accessed ON search_cache (accessed_at)"
+            )
+            self._conn.commit()
+        return self._conn
+
+    def close(self):
+        with self._lock:
+            if self._conn is not None:
+                self._conn.close()
+                self._conn = None
+
+    def get(self, query: str, params: Dict[str, Any], max_age: Optional[float] = None):
+        """Cached results, or None if missing or older than `max_age` seconds."""
+        key = cache_key(query, params)
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            row = conn.execute(
+                "SELECT results, created_at FROM search_cache WHERE key = ?", (key,)
+            ).fetchone()
+            if row is None:
+                return None
+            if max_age is not None and now - row[1] > max_age:
+                self.stats["expired"] += 1
+                return None
+            conn.execute("UPDATE search_cache SET accessed_at = ? WHERE key = ?", (now, key))
+            conn.commit()
+        return json.loads(row[0])
+
+    def put(self, query: str, params: Dict[str, Any], results: List[Dict[str, Any]]):
+        """Store results for a query, evicting old entries beyond `max_entries`."""
+        now = time.time()
+        with self._lock:
+            conn = self._connection()
+            conn.execute(
+                "INSERT OR REPLACE INTO search_cache VALUES (?, ?, ?, ?, ?, ?)",
+                (cache_key(query, params), normalize_query(query),
+                 json.dumps(params, sort_keys=True), json.dumps(results), now, now)
+            )
+            self._evict(conn, now)
+            conn.commit()
+
+    def _evict(self, conn: sqlite3.Connection, now: float):
+        excess = conn.execute("SELECT COUNT(*) FROM search_cache").fetchone()[0] - self.max_entries
+        if excess <= 0:
+            return
+        removed = conn.execute(
+            "DELETE FROM search_cache WHERE created_at < ?", (now - self.ttl_seconds,)
+        ).rowcount
+        if removed < excess:
+            removed += conn.execute(
+                "DELETE FROM search_cache WHERE key IN "
+                "(SELECT key FROM search_cache ORDER BY accessed_at LIMIT ?)",
+                (excess - removed,)
+            ).rowcount
+        self.stats["evictions"] += removed
+
+    def fetch(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        search: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Return results for `query`, calling `search()` as the mode allows."""
+        if self.mode == "off":
+            self.stats["fetches"] += 1
+            return search()
+
+        if self.mode != "refresh":
+            max_age = None if self.mode == "offline" else self.ttl_seconds
+            cached = self.get(query, params, max_age=max_age)
+            if cached is not None:
+                self.stats["hits"] += 1
+                return cached
+            self.stats["misses"] += 1
+            if self.mode == "offline":
+                raise SearchCacheMiss(f"No cached results for {query!r} (offline mode)")
+
+        return self._fetch_once(query, params, search)
+
+    def _fetch_once(
+        self,
+        query: str,
+        params: Dict[str, Any],
+        search: Callable[[], List[Dict[str, Any]]]
+    ) -> List[Dict[str, Any]]:
+        """Call `search()` and store its results, unless the same query is already in flight."""
+        key = cache_key(query, params)
+        with self._lock:
+            pending = self._in_flight.get(key)
+            if pending is None:
+                pending = self._in_flight[key] = Future()
+                owner = True
+            else:
+                self.stats["joined"] += 1
+                owner = False
+        if not owner:
+            return pending.result()
+
+        try:
+            self.stats["fetches"] += 1
+            results = search()
+            self.put(query, params, results)
+        except BaseException as e:
+            pending.set_exception(e)
+            raise
+        else:
+            pending.set_result(results)
+            return results
+        finally:
+            with self._lock:
+                del self._in_flight[key]
+
+    def clear(self):
+        with self._lock:
+            conn = self._connection()
+            conn.execute("DELETE FROM search_cache")
+            conn.commit()
+
+
+_search_cache: Optional[SearchCache] = None
+_search_cache_lock = threading.Lock()
+
+
+def get_search_cache() -> SearchCache:
+    """Process-wide search cache configured from settings."""
+    global _search_cache
+    with _search_cache_lock:
+        if _search_cache is None:
+            settings = get_settings()
+            _search_cache = SearchCache(
+                settings.search_cache_path,
+                mode=settings.search_cache_mode,
+                ttl_seconds=settings.search_cache_ttl,
+                max_entries=settings.search_cache_max_entries
+            )
+        return _search_cache
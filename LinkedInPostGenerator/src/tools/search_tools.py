@@ -0,0 +1,276 @@
+"""Web search tool for gathering information about AI trends and topics."""
+
+import contextvars
+import json
+import math
+import threading
+from concurrent.futures import ThreadPoolExecutor, wait
+from typing import List, Dict, Any, Optional, Tuple
+from crewai.tools import tool
+
+from ..config import get_settings
+from .dedupe import NearDuplicateIndex, canonicalize_url, simhash
+from .search_backends import SearchBackend, get_search_backend, get_search_rate_limiter
+from .search_cache import get_search_cache
+from ..telemetry import record_search
+
+
+@tool("web_search")
+def web_search(query: str, max_results: int = 10) -> str:
+    """
+    Search the web for current AI trends, software development topics,
+    and IT industry news. Returns relevant articles, blog posts, and discussions.
+    Use this tool to gather up-to-date information before writing content.
+
+    Args:
+        query: The search query string
+        max_results: Maximum number of search results to return (default: 10)
+
+    Returns:
+        JSON string containing search results with title, snippet, and URL
+    """
+    try:
+        results = _text_search(get_search_backend(), query, max_results)
+
+        if not results:
+            return json.dumps({
+                "status": "no_results",
+                "query": query,
+                "results": []
+            })
+
+        # Format results for better consumption
+        formatted_results = []
+        for idx, result in enumerate(results, 1):
+            formatted_results.append({
+                "rank": idx,
+                "title": result.get("title", ""),
+                "snippet": result.get("body", ""),
+                "url": result.get("href", ""),
+            })
+
+        return json.dumps({
+            "status": "success",
+            "query": query,
+            "total_results": len(formatted_results),
+            "results": formatted_results
+        }, indent=2)
+
+    except Exception as e:
+        return json.dumps({
+            "status": "error",
+            "query": query,
+            "error": str(e),
+            "results": []
+        })
+
+
+@tool("multi_query_search")
+def multi_query_search(topic: str, queries_per_topic: int = 5, results_per_query: int = 5) -> str:
+    """
+    Perform multiple searches with different query formulations to get
+    comprehensive coverage of a topic. Automatically generates diverse
+    search queries and aggregates results.
+
+    Args:
+        topic: The main topic to research
+        queries_per_topic: Number of diverse queries to generate (default: 5)
+        results_per_query: Results to fetch per query (default: 5)
+
+    Returns:
+        JSON string containing aggregated search results from multiple queries.
+        Queries run concurrently; if some of them fail or time out, the
+        status is "partial" and the successful results are still returned.
+        Results for the same page (after URL canonicalization) or with
+        near-identical title and snippet are collapsed into one.
+    """
+    queries = generate_diverse_queries(topic, queries_per_topic)
+    results_by_query, errors = _run_queries(queries, results_per_query)
+
+    if len(errors) == len(queries):
+        return json.dumps({
+            "status": "error",
+            "topic": topic,
+            "error": "; ".join(f"{e['query']}: {e['error']}" for e in errors),
+            "errors": errors,
+            "results": []
+        })
+
+    all_results, collapsed = _merge_results(results_by_query)
+
+    response = {
+        "status": "partial" if errors else "success",
+        "topic": topic,
+        "queries_used": queries,
+        "total_unique_results": len(all_results),
+        "duplicates_collapsed": collapsed,
+        "results": all_results
+    }
+    if errors:
+        response["errors"] = errors
+    return json.dumps(response, indent=2)
+
+
+def generate_diverse_queries(topic: str, count: int) -> List[str]:
+    """Generate diverse search queries for a topic."""
+    queries = [
+        f"{topic} latest trends 2026",
+        f"{topic} breakthrough innovations",
+        f"{topic} industry impact",
+        f"{topic} best practices",
+        f"{topic} future predictions",
+        f"what's new in {topic}",
+        f"{topic} case studies",
+        f"{topic} expert insights"
+    ]
+    return queries[:count]
+
+
+_search_executor: Optional[ThreadPoolExecutor] = None
+_search_executor_lock = threading.Lock()
+
+
+def get_search_executor() -> ThreadPoolExecutor:
+    """
+    Process-wide pool for search queries, sized by SEARCH_MAX_WORKERS.
+
+    Shared by every multi-query search, prefetch and batch job, so the
+    number of concurrent backend requests stays bounded.
+    """
+    global _search_executor
+    with _search_executor_lock:
+        if _search_executor is None:
+            _search_executor = ThreadPoolExecutor(
+                max_workers=max(1, get_settings().search_max_workers),
+                thread_name_prefix="search"
+            )
+        return _search_executor
+
+
+def _run_queries(
+    queries: List[str], results_per_query: int
+) -> Tuple[List[Tuple[str, List[Dict[str, Any]]]], List[Dict[str, str]]]:
+    """Run `queries` concurrently; returns per-query results and per-query errors."""
+    settings = get_settings()
+    workers = max(1, min(settings.search_max_workers, len(queries)))
+
+    # One backend session shared by all workers; its timeout bounds each request.
+    backend = get_search_backend()
+    pool = get_search_executor()
+    # Each query runs in a copy of the caller's context so telemetry
+    # still attributes its search calls to the calling phase.
+    futures = [
+        pool.submit(contextvars.copy_context().run, _text_search, backend, query, results_per_query)
+        for query in queries
+    ]
+    try:
+        # Queries queued behind busy workers start late, so the overall wait
+        # allows one timeout per round of workers. It is one deadline for the
+        # whole batch, not one per query.
+        wait_budget = settings.search_timeout * math.ceil(len(queries) / workers)
+        wait(futures, timeout=wait_budget)
+    finally:
+        # Drop whatever has not started, so the shared pool isn't left busy.
+        for future in futures:
+            future.cancel()
+
+    results_by_query = []
+    errors = []
+    for query, future in zip(queries, futures):
+        if not future.done() or future.cancelled():
+            errors.append({"query": query, "error": f"timed out after {settings.search_timeout}s"})
+        elif future.exception() is not None:
+            errors.append({"query": query, "error": str(future.exception())})
+        else:
+            results_by_query.append((query, future.result()))
+
+    return results_by_query, errors
+
+
+def prefetch_topic_search(topic: str, queries_per_topic: int = 5, results_per_query: int = 5) -> int:
+    """
+    Run the queries multi_query_search would run for `topic` with its
+    default arguments, so the results are in the search cache by the time
+    the research agent asks for them. Returns the number of queries that
+    succeeded; failures are left for the agent's own call to report.
+    """
+    if get_search_cache().mode != "read_through":
+        return 0
+    results_by_query, _ = _run_queries(generate_diverse_queries(topic, queries_per_topic),
+                                       results_per_query)
+    return len(results_by_query)
+
+
+def _merge_results(
+    results_by_query: List[Tuple[str, List[Dict[str, Any]]]]
+) -> Tuple[List[Dict[str, Any]], Dict[str, int]]:
+    """
+    Merge per-query results, dropping repeats of a canonical URL and near
+    duplicates of title+snippet.
+
+    Candidates are visited rank by rank across queries, so the kept copy of
+    a duplicate is the highest-ranked one; the output stays in query order
+    so it doesn't depend on completion order.
+    """
+    seen_urls = set()
+    near_duplicates = NearDuplicateIndex()
+    kept = {}
+    collapsed = {"url": 0, "near_duplicate": 0}
+    depth = max((len(results) for _, results in results_by_query), default=0)
+    for rank in range(depth):
+        for q, (_, results) in enumerate(results_by_query):
+            if rank >= len(results):
+                continue
+            result = results[rank]
+            # The canonical form is only the dedup key; the kept result
+            # keeps the URL the search engine returned
+            url = canonicalize_url(result.get("href", ""))
+            if not url:
+                continue
+            if url in seen_urls:
+                collapsed["url"] += 1
+                continue
+            seen_urls.add(url)
+            signature = simhash(f"{result.get('title', '')} {result.get('body', '')}")
+            if signature is not None and not near_duplicates.add_if_new(signature):
+                collapsed["near_duplicate"] += 1
+                continue
+            kept[(q, rank)] = result["href"]
+
+    merged = []
+    for q, (query, results) in enumerate(results_by_query):
+        for rank, result in enumerate(results):
+            if (q, rank) in kept:
+                merged.append({
+                    "query": query,
+                    "title": result.get("title", ""),
+                    "snippet": result.get("body", ""),
+                    "url": kept[(q, rank)]
+                })
+    return merged, collapsed
+
+
+def _text_search(backend: SearchBackend, query: str, max_results: int) -> List[Dict[str, Any]]:
+    """Run one text search on the shared backend, through the search cache."""
+    params = {"backend": backend.name, "max_results": max_results}
+    searched = False
+
+    def search() -> List[Dict[str, Any]]:
+        nonlocal searched
+        searched = True
+        limiter = get_search_rate_limiter()
+        if limiter is not None:
+            limiter.acquire()
+        return backend.text(query, max_results)
+
+    # Only lookups that returned results, or reached the backend, count:
+    # an offline cache miss or an error before searching is neither a
+    # cache hit nor a search
+    try:
+        results = get_search_cache().fetch(query, params, search)
+    except Exception:
+        if searched:
+            record_search(cache_hit=False)
+        raise
+    record_search(cache_hit=not searched)
+    return results
@@ -13,10 +13,25 @@ from .console import (
     print_info,
     print_post_draft,
     print_critique,
+    TokenStream,
     print_workflow_tree,
     print_iteration_summary,
     save_output,
-    print_final_output
+    print_final_output,
+    print_phase_stats,
+    print_post_history,
+    print_summary,
+    RichSink
+)
+from .sinks import (
+    OUTPUT_FORMATS,
+    OutputSink,
+    NullSink,
+    JsonLinesSink,
+    bind_event_context,
+    create_output_sink,
+    set_output_sink,
+    get_output_sink
 )
 
 __all__ = [
@@ -32,8 +47,21 @@ __all__ = [
     "print_info",
     "print_post_draft",
     "print_critique",
+    "TokenStream",
     "print_workflow_tree",
     "print_iteration_summary",
     "save_output",
-    "print_final_output"
+    "print_final_output",
+    "print_phase_stats",
+    "print_post_history",
+    "print_summary",
+    "RichSink",
+    "OUTPUT_FORMATS",
+    "OutputSink",
+    "NullSink",
+    "JsonLinesSink",
+    "bind_event_context",
+    "create_output_sink",
+    "set_output_sink",
+    "get_output_sink"
 ]
@@ -9,14 +9,76 @@ from rich.table import Table
 from rich.tree import Tree
 from rich import box
 from datetime import datetime
+import os
+import threading
+import time
+
+from .sinks import OutputSink, get_output_sink
 
 
 console = Console()
 
+WORKFLOW_STEPS = [
+    ("Research", "[R]"),
+    ("Analysis", "[A]"),
+    ("Writing", "[W]"),
+    ("Critique", "[C]"),
+    ("Editing", "[E]"),
+    ("Final", "[F]")
+]
 
-def print_header():
-    """Print application header."""
-    header = """
+
+class TokenStream:
+    """
+    Renders streamed LLM tokens as they arrive.
+
+    Tokens are written as plain text straight to the console's file, in
+    batches at most every `flush_interval` seconds, so the callback that
+    receives them returns almost immediately and never slows the stream.
+    """
+
+    def __init__(self, title: str, flush_interval: float = 0.05):
+        self.title = title
+        self.flush_interval = flush_interval
+        self._buffer = []
+        self._last_flush = 0.0
+
+    def open(self):
+        console.print()
+        console.rule(f"[bold green][STREAM] {self.title}[/bold green]", style="green")
+        self._last_flush = time.perf_counter()
+
+    def write(self, token: str):
+        self._buffer.append(token)
+        now = time.perf_counter()
+        if now - self._last_flush >= self.flush_interval:
+            self.flush()
+            self._last_flush = now
+
+    def flush(self):
+        if self._buffer:
+            console.file.write("".join(self._buffer))
+            console.file.flush()
+            self._buffer.clear()
+
+    def close(self):
+        self.flush()
+        console.print()
+        console.rule(style="green")
+
+
+class RichSink(OutputSink):
+    """The interactive terminal output: panels, markdown, trees and tables."""
+
+    _MESSAGE_STYLES = {
+        "success": ("[OK]", "green"),
+        "error": ("[ERROR]", "red"),
+        "warning": ("[WARN]", "yellow"),
+        "info": ("[INFO]", "blue"),
+    }
+
+    def header(self):
+        header = """
     ===========================================================
 
         LinkedIn AI Post Generator Agent
@@ -24,123 +86,238 @@ def print_header():
 
     ===========================================================
     """
-    console.print(header, style="bold cyan")
+        console.print(header, style="bold cyan")
+
+    def section(self, title: str, emoji: str = ">"):
+        console.print(f"\n{emoji} [bold blue]{title}[/bold blue]")
+        console.print("-" * 60, style="dim")
+
+    def step(self, step_number: int, total_steps: int, description: str):
+        console.print(
+            f"\n[bold yellow]Step {step_number}/{total_steps}:[/bold yellow] {description}"
+        )
+
+    def agent_thinking(self, agent_name: str, thought: str):
+        console.print(
+            Panel(
+                thought,
+                title=f"[*] {agent_name} is thinking...",
+                border_style="yellow",
+                box=box.ROUNDED
+            )
+        )
+
+    def agent_action(self, agent_name: str, action: str):
+        console.print(f"  -> [cyan]{agent_name}:[/cyan] {action}")
+
+    def message(self, level: str, message: str):
+        tag, color = self._MESSAGE_STYLES[level]
+        console.print(f"{tag} [{color}]{message}[/{color}]")
+
+    def post_draft(self, draft: str, title: str):
+        console.print(
+            Panel(
+                Markdown(draft),
+                title=f"[DRAFT] {title}",
+                border_style="green",
+                box=box.ROUNDED
+            )
+        )
+
+    def critique(self, critique: str):
+        console.print(
+            Panel(
+                critique,
+                title="[CRITIQUE] Content Critique",
+                border_style="magenta",
+                box=box.ROUNDED
+            )
+        )
+
+    def workflow(self, current_step: str):
+        tree = Tree("[bold]Workflow Progress[/bold]")
+
+        # Position of the current step, found once; an unknown step marks
+        # the whole workflow as done.
+        current = current_step.lower()
+        current_index = next(
+            (i for i, (step, _) in enumerate(WORKFLOW_STEPS) if step.lower() in current),
+            len(WORKFLOW_STEPS)
+        )
+        for i, (step, emoji) in enumerate(WORKFLOW_STEPS):
+            if i == current_index:
+                tree.add(f"{emoji} [bold yellow]{step}[/bold yellow] <- Current")
+            elif i < current_index:
+                tree.add(f"{emoji} [green]{step}[/green] [OK]")
+            else:
+                tree.add(f"{emoji} [dim]{step}[/dim]")
+
+        console.print(tree)
+
+    def iteration(self, iteration: int, max_iterations: int):
+        console.print(
+            Panel(
+                f"Iteration {iteration} of {max_iterations}",
+                title="[REFINEMENT] Refinement Cycle",
+                border_style="blue"
+            )
+        )
+
+    def final_output(self, post: str, metadata: dict):
+        console.print("\n")
+        console.print("=" * 70, style="bold green")
+        console.print(
+            Panel(
+                Markdown(post),
+                title="[FINAL] Final LinkedIn Post",
+                border_style="bold green",
+                box=box.ROUNDED
+            )
+        )
+
+        # Print metadata table
+        table = Table(title="Generation Metadata", box=box.SIMPLE)
+        table.add_column("Property", style="cyan")
+        table.add_column("Value", style="green")
+
+        for key, value in metadata.items():
+            table.add_row(key, str(value))
+
+        console.print(table)
+        console.print("=" * 70, style="bold green")
+
+    def phase_stats(self, stats: dict, runs: int):
+        table = Table(title=f"Phase Statistics ({runs} runs)", box=box.SIMPLE)
+        for column in ("Phase", "N", "p50 s", "p95 s", "max s", "TTFT p50", "Prompt tok",
+                       "Output tok", "LLM calls", "Searches", "Cache hit", "Cost $"):
+            table.add_column(column, style="cyan" if column == "Phase" else "green",
+                             justify="left" if column == "Phase" else "right")
+
+        for phase, row in stats.items():
+            table.add_row(
+                phase,
+                str(row["count"]),
+                f"{row['p50_seconds']:.1f}",
+                f"{row['p95_seconds']:.1f}",
+                f"{row['max_seconds']:.1f}",
+                "-" if row["p50_first_token_seconds"] is None else f"{row['p50_first_token_seconds']:.2f}",
+                f"{row['mean_prompt_tokens']:,.0f}",
+                f"{row['mean_completion_tokens']:,.0f}",
+                f"{row['mean_llm_calls']:.1f}",
+                f"{row['mean_search_calls']:.1f}",
+                f"{row['llm_cache_hit_rate']:.0%}",
+                f"{row['mean_cost_usd']:.4f}",
+            )
+
+        console.print(table)
+
+    def post_history(self, posts: list):
+        table = Table(title=f"Archived Posts ({len(posts)})", box=box.SIMPLE)
+        table.add_column("Run ID", style="cyan")
+        table.add_column("Created", style="green")
+        table.add_column("Topic", style="green")
+        table.add_column("Score", style="green", justify="right")
+        table.add_column("Iter", style="green", justify="right")
+        table.add_column("File", style="dim")
+
+        for post in posts:
+            table.add_row(
+                post["run_id"],
+                post["created_at"].replace("T", " "),
+                post["topic"],
+                "-" if post["final_score"] is None else f"{post['final_score']:g}",
+                "-" if post["iterations"] is None else str(post["iterations"]),
+                post["filename"] or "-",
+            )
+
+        console.print(table)
+
+    def summary(self, title: str, data: dict):
+        self.section(title)
+        for key, value in data.items():
+            console.print(f"  {key}: {value}")
+
+    def token_stream(self, title: str):
+        return TokenStream(title)
+
+
+# The functions below hand each event to the active output sink (see
+# set_output_sink); with the default rich sink they print as they always have.
+
+def print_header():
+    """Print application header."""
+    get_output_sink().header()
 
 
 def print_section(title: str, emoji: str = ">"):
     """Print a section header."""
-    console.print(f"\n{emoji} [bold blue]{title}[/bold blue]")
-    console.print("-" * 60, style="dim")
+    get_output_sink().section(title, emoji)
 
 
 def print_step(step_number: int, total_steps: int, description: str):
     """Print a step indicator."""
-    console.print(
-        f"\n[bold yellow]Step {step_number}/{total_steps}:[/bold yellow] {description}"
-    )
+    get_output_sink().step(step_number, total_steps, description)
 
 
 def print_agent_thinking(agent_name: str, thought: str):
     """Print agent's thinking process."""
-    console.print(
-        Panel(
-            thought,
-            title=f"[*] {agent_name} is thinking...",
-            border_style="yellow",
-            box=box.ROUNDED
-        )
-    )
+    get_output_sink().agent_thinking(agent_name, thought)
 
 
 def print_agent_action(agent_name: str, action: str):
     """Print agent's action."""
-    console.print(f"  -> [cyan]{agent_name}:[/cyan] {action}")
+    get_output_sink().agent_action(agent_name, action)
 
 
 def print_success(message: str):
     """Print success message."""
-    console.print(f"[OK] [green]{message}[/green]")
+    get_output_sink().message("success", message)
 
 
 def print_error(message: str):
     """Print error message."""
-    console.print(f"[ERROR] [red]{message}[/red]")
+    get_output_sink().message("error", message)
 
 
 def print_warning(message: str):
     """Print warning message."""
-    console.print(f"[WARN] [yellow]{message}[/yellow]")
+    get_output_sink().message("warning", message)
 
 
 def print_info(message: str):
     """Print info message."""
-    console.print(f"[INFO] [blue]{message}[/blue]")
+    get_output_sink().message("info", message)
 
 
 def print_post_draft(draft: str, title: str = "LinkedIn Post Draft"):
     """Print a LinkedIn post draft in a nice panel."""
-    console.print(
-        Panel(
-            Markdown(draft),
-            title=f"[DRAFT] {title}",
-            border_style="green",
-            box=box.ROUNDED
-        )
-    )
+    get_output_sink().post_draft(draft, title)
 
 
 def print_critique(critique: str):
     """Print critique in a panel."""
-    console.print(
-        Panel(
-            critique,
-            title="[CRITIQUE] Content Critique",
-            border_style="magenta",
-            box=box.ROUNDED
-        )
-    )
+    get_output_sink().critique(critique)
 
 
 def print_workflow_tree(current_step: str):
     """Print workflow progress tree."""
-    tree = Tree("[bold]Workflow Progress[/bold]")
-
-    steps = [
-        ("Research", "[R]"),
-        ("Analysis", "[A]"),
-        ("Writing", "[W]"),
-        ("Critique", "[C]"),
-        ("Editing", "[E]"),
-        ("Final", "[F]")
-    ]
-
-    for step, emoji in steps:
-        if step.lower() in current_step.lower():
-            tree.add(f"{emoji} [bold yellow]{step}[/bold yellow] <- Current")
-        elif steps.index((step, emoji)) < steps.index(next((s, e) for s, e in steps if s.lower() in current_step.lower())):
-            tree.add(f"{emoji} [green]{step}[/green] [OK]")
-        else:
-            tree.add(f"{emoji} [dim]{step}[/dim]")
-
-    console.print(tree)
+    get_output_sink().workflow(current_step)
 
 
 def print_iteration_summary(iteration: int, max_iterations: int):
     """Print iteration summary."""
-    console.print(
-        Panel(
-            f"Iteration {iteration} of {max_iterations}",
-            title="[REFINEMENT] Refinement Cycle",
-            border_style="blue"
-        )
-    )
+    get_output_sink().iteration(iteration, max_iterations)
 
 
 def save_output(content: str, filename: str):
     """Save content to file and notify user."""
+    # Written to a temporary file and renamed, so a crash never leaves a
+    # truncated file behind
+    tmp = f"{filename}.{os.getpid()}.{threading.get_ident()}.tmp"
     try:
-        with open(filename, 'w', encoding='utf-8') as f:
+        with open(tmp, 'w', encoding='utf-8') as f:
             f.write(content)
+        os.replace(tmp, filename)
         print_success(f"Saved to: {filename}")
         return True
     except Exception as e:
@@ -150,24 +327,19 @@ def save_output(content: str, filename: str):
 
 def print_final_output(post: str, metadata: dict):
     """Print the final output with metadata."""
-    console.print("\n")
-    console.print("=" * 70, style="bold green")
-    console.print(
-        Panel(
-            Markdown(post),
-            title="[FINAL] Final LinkedIn Post",
-            border_style="bold green",
-            box=box.ROUNDED
-        )
-    )
+    get_output_sink().final_output(post, metadata)
+
+
+def print_phase_stats(stats: dict, runs: int):
+    """Print per-phase latency, token and cost statistics across runs."""
+    get_output_sink().phase_stats(stats, runs)
+
 
-    # Print metadata table
-    table = Table(title="Generation Metadata", box=box.SIMPLE)
-    table.add_column("Property", style="cyan")
-    table.add_column("Value", style="green")
+def print_post_history(posts: list):
+    """Print archived posts as a table."""
+    get_output_sink().post_history(posts)
 
-    for key, value in metadata.items():
-        table.add_row(key, str(value))
 
-    console.print(table)
-    console.print("=" * 70, style="bold green")
+def print_summary(title: str, data: dict):
+    """Print a titled set of key/value results."""
+    get_output_sink().summary(title, data)
@@ -0,0 +1,203 @@
+"""Output sinks: where progress events and results from a run are sent."""
+
+import json
+import sys
+import threading
+from contextvars import ContextVar
+from datetime import datetime
+from pathlib import Path
+from typing import Any, Dict, IO, List, Optional
+
+OUTPUT_FORMATS = ("rich", "jsonl", "null")
+
+
+class NullStream:
+    """Token stream that discards everything."""
+
+    def open(self):
+        pass
+
+    def write(self, token: str):
+        pass
+
+    def close(self):
+        pass
+
+
+class OutputSink:
+    """
+    Receives every progress event and result of a run.
+
+    The base class ignores everything, so it doubles as the null sink and
+    subclasses only override the events they render.
+    """
+
+    def header(self):
+        pass
+
+    def section(self, title: str, emoji: str = ">"):
+        pass
+
+    def step(self, step_number: int, total_steps: int, description: str):
+        pass
+
+    def agent_thinking(self, agent_name: str, thought: str):
+        pass
+
+    def agent_action(self, agent_name: str, action: str):
+        pass
+
+    def message(self, level: str, message: str):
+        """level is one of success, error, warning, info."""
+
+    def post_draft(self, draft: str, title: str):
+        pass
+
+    def critique(self, critique: str):
+        pass
+
+    def workflow(self, current_step: str):
+        pass
+
+    def iteration(self, iteration: int, max_iterations: int):
+        pass
+
+    def final_output(self, post: str, metadata: Dict[str, Any]):
+        pass
+
+    def phase_stats(self, stats: Dict[str, Dict[str, Any]], runs: int):
+        pass
+
+    def post_history(self, posts: List[Dict[str, Any]]):
+        pass
+
+    def summary(self, title: str, data: Dict[str, Any]):
+        pass
+
+    def token_stream(self, title: str):
+        return NullStream()
+
+
+NullSink = OutputSink
+
+
+# Extra fields (e.g. run_id) added to every JSON event emitted in this
+# context; generator phases run in copies of it, so their events carry them.
+_event_context: ContextVar[Dict[str, Any]] = ContextVar("event_context", default={})
+
+
+def bind_event_context(**fields: Any):
+    """Add `fields` to every JSON event emitted from the current context."""
+    _event_context.set({**_event_context.get(), **fields})
+
+
+class _JsonTokenStream(NullStream):
+    def __init__(self, sink: "JsonLinesSink", title: str):
+        self.sink = sink
+        self.title = title
+        self.tokens = 0
+
+    def write(self, token: str):
+        self.tokens += 1
+
+    def close(self):
+        self.sink.emit("stream", title=self.title, tokens=self.tokens)
+
+
+class JsonLinesSink(OutputSink):
+    """
+    One JSON object per event, for logs and services. Drafts, critiques
+    and the final post are included in full; streamed tokens are only
+    counted.
+    """
+
+    def __init__(self, file: Optional[IO[str]] = None):
+        self.file = file or sys.stdout
+        self._lock = threading.Lock()
+
+    def emit(self, event: str, **fields: Any):
+        record = {"ts": datetime.now().isoformat(timespec="milliseconds"), "event": event,
+                  **_event_context.get(), **fields}
+        line = json.dumps(record, default=str)
+        with self._lock:
+            self.file.write(line + "\n")
+            self.file.flush()
+
+    def section(self, title: str, emoji: str = ">"):
+        self.emit("section", title=title)
+
+    def step(self, step_number: int, total_steps: int, description: str):
+        self.emit("step", step=step_number, total=total_steps, description=description)
+
+    def agent_thinking(self, agent_name: str, thought: str):
+        self.emit("thinking", agent=agent_name, text=thought)
+
+    def agent_action(self, agent_name: str, action: str):
+        self.emit("action", agent=agent_name, message=action)
+
+    def message(self, level: str, message: str):
+        self.emit(level, message=message)
+
+    def post_draft(self, draft: str, title: str):
+        self.emit("draft", title=title, text=draft)
+
+    def critique(self, critique: str):
+        self.emit("critique", text=critique)
+
+    def workflow(self, current_step: str):
+        self.emit("workflow", step=current_step)
+
+    def iteration(self, iteration: int, max_iterations: int):
+        self.emit("iteration", iteration=iteration, max_iterations=max_iterations)
+
+    def final_output(self, post: str, metadata: Dict[str, Any]):
+        self.emit("final", post=post, metadata=metadata)
+
+    def phase_stats(self, stats: Dict[str, Dict[str, Any]], runs: int):
+        self.emit("phase_stats", runs=runs, phases=stats)
+
+    def post_history(self, posts: List[Dict[str, Any]]):
+        self.emit("post_history", posts=posts)
+
+    def summary(self, title: str, data: Dict[str, Any]):
+        self.emit("summary", title=title, **data)
+
+    def token_stream(self, title: str):
+        return _JsonTokenStream(self, title)
+
+
+_sink: Optional[OutputSink] = None
+_sink_lock = threading.Lock()
+
+
+def create_output_sink(kind: str, path: Optional[Path] = None) -> OutputSink:
+    """
+    Build the sink for an output format: "rich" (the interactive console),
+    "jsonl" (events to `path`, or stdout) or "null".
+    """
+    if kind == "rich":
+        from .console import RichSink
+        return RichSink()
+    if kind == "jsonl":
+        return JsonLinesSink(open(path, "a", encoding="utf-8") if path else None)
+    if kind == "null":
+        return NullSink()
+    raise ValueError(f"Unknown output format {kind!r}, expected one of {OUTPUT_FORMATS}")
+
+
+def set_output_sink(sink: OutputSink):
+    """Send all further output of this process to `sink`."""
+    global _sink
+    with _sink_lock:
+        _sink = sink
+
+
+def get_output_sink() -> OutputSink:
+    """The process-wide sink; the rich console unless set_output_sink() was called."""
+    global _sink
+    if _sink is None:
+        with _sink_lock:
+            if _sink is None:
+                from .console import RichSink
+                _sink = RichSink()
+    return _sink
@@ -0,0 +1,60 @@
+"""Regression tests for token-budgeted compaction (src/compaction.py)."""
+
+from src.compaction import compact, estimate_tokens
+
+TOPIC = "AI agents in software development"
+
+
+def _paragraph(sentences: int) -> str:
+    return " ".join(
+        f"Finding {n} shows that AI agents now review {n * 10}% of pull requests in large teams."
+        for n in range(1, sentences + 1)
+    )
+
+
+def test_fits_budget_unchanged():
+    text = "AI agents write code.\n\nThey also review it."
+    result = compact(text, TOPIC, token_budget=100)
+    assert result.text == text
+    assert result.passages_kept == 2
+
+
+def test_single_oversized_paragraph_is_trimmed_not_dropped():
+    text = _paragraph(30)
+    assert estimate_tokens(text) > 200
+
+    result = compact(text, TOPIC, token_budget=60)
+
+    assert result.text
+    assert result.tokens_after <= 60
+    assert result.text.startswith("Finding 1 shows")
+
+
+def test_single_oversized_sentence_is_truncated():
+    text = " ".join(["agents"] * 500)
+
+    result = compact(text, TOPIC, token_budget=20)
+
+    assert result.text
+    assert result.tokens_after <= 20
+
+
+def test_heading_keeps_its_bullets():
+    bullets = "\n".join(f"- {_paragraph(8)}" for _ in range(3))
+    text = f"## Findings\n{bullets}"
+
+    result = compact(text, TOPIC, token_budget=80)
+
+    assert result.text.strip() != "## Findings"
+    assert "AI agents now review" in result.text
+    assert result.tokens_after <= 80
+
+
+def test_whole_passages_are_preferred_over_fragments():
+    relevant = "AI agents in software development cut review time by 30%."
+    text = f"{relevant}\n\n{_paragraph(30)}"
+
+    result = compact(text, TOPIC, token_budget=40)
+
+    assert result.text.startswith(relevant)
+    assert result.tokens_after <= 40
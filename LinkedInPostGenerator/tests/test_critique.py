@@ -0,0 +1,81 @@
+"""Regression tests for critic score parsing (src/critique.py)."""
+
+import pytest
+
+from src.critique import parse_candidate_scores, parse_critique
+
+JSON_CRITIQUE = """The hook is strong but the ending is weak. Score: 6/10 for the hook.
+
+```json
+{"overall": 7.5, "criteria": {"hook": 6, "value": 8, "length": 11}, "ready_to_publish": true}
+```
+"""
+
+
+def test_json_block_wins_over_free_text():
+    score = parse_critique(JSON_CRITIQUE)
+
+    assert score.source == "json"
+    assert score.overall == 7.5
+    assert score.criteria == {"hook": 6.0, "value": 8.0}   # 11 is out of range
+    assert score.ready_to_publish is True
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("Solid post overall. 9/10", 9.0),
+    ("Score - 9", 9.0),
+    ("I'd give it 8.5 out of 10.", 8.5),
+    ("**Overall:** **8**/10", 8.0),
+    ("Rating: **8**/10", 8.0),
+    ("Overall score: 6.5/10, hook 9/10", 6.5),
+])
+def test_free_text_scores(text, expected):
+    score = parse_critique(text)
+
+    assert score.source == "text"
+    assert score.overall == expected
+
+
+@pytest.mark.parametrize("text", [
+    "",
+    "Great post, ship it.",
+    "Uses 3 of 5 hashtags and 12 emojis.",
+    "```json\n{\"overall\": \"high\"}\n```",
+])
+def test_unparseable_critique(text):
+    score = parse_critique(text)
+
+    assert score.overall is None
+    assert score.source == "none"
+
+
+def test_candidate_scores_from_json():
+    text = """### Candidate 1
+Weak hook.
+
+### Candidate 2
+Strong.
+
+```json
+{"candidates": [{"candidate": 2, "overall": 9}, {"candidate": 1, "overall": 5}, {"candidate": 7, "overall": 10}]}
+```
+"""
+    scores = parse_candidate_scores(text, 2)
+
+    assert [s.overall for s in scores] == [5.0, 9.0]
+    assert all(s.source == "json" for s in scores)
+
+
+def test_candidate_scores_from_sections():
+    text = """### Candidate 1
+Decent angle. Score: 6
+
+**Candidate 2 - bold take**
+Great. **8**/10
+
+### Candidate 3
+No verdict here.
+"""
+    scores = parse_candidate_scores(text, 3)
+
+    assert [s.overall for s in scores] == [6.0, 8.0, None]
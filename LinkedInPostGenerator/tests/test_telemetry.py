@@ -0,0 +1,17 @@
+"""Regression tests for telemetry statistics (src/telemetry.py)."""
+
+from src.telemetry import percentile
+
+
+def test_percentile_is_nearest_rank():
+    values = [float(v) for v in range(1, 11)]
+
+    assert percentile(values, 0.5) == 5.0
+    assert percentile(values, 0.9) == 9.0
+    assert percentile(values, 0.95) == 10.0
+    assert percentile(values, 1.0) == 10.0
+    assert percentile(values, 0.0) == 1.0
+
+
+def test_percentile_of_single_value():
+    assert percentile([3.0], 0.99) == 3.0
@@ -1,7 +1,22 @@
 #!/usr/bin/env python3
-"""Verify that all dependencies are installed correctly."""
+"""
+Verify that all dependencies are installed correctly.
 
+With --profile-startup, also report how long the CLI and the generator
+take to import, broken down by package, so slow imports are easy to spot.
+"""
+
+import subprocess
 import sys
+from pathlib import Path
+
+# Modules whose import cost --profile-startup reports: the CLI itself (all
+# that `examples`, `info` and `setup` need) and the generator that
+# `generate` and `batch` load on demand
+STARTUP_TARGETS = [
+    ("main", "CLI startup"),
+    ("src.crew_orchestrator", "Post generator"),
+]
 
 def check_import(module_name, package_name=None):
     """Check if a module can be imported."""
@@ -16,6 +31,52 @@ def check_import(module_name, package_name=None):
         print(f"❌ {package_name} - NOT installed")
         return False
 
+
+def import_costs(module_name):
+    """
+    Import `module_name` in a fresh interpreter with `-X importtime`.
+
+    Returns the total import time and the time spent per top-level package
+    (both in milliseconds, largest first), or None and the error if the
+    import failed.
+    """
+    result = subprocess.run(
+        [sys.executable, "-X", "importtime", "-c", f"import {module_name}"],
+        cwd=Path(__file__).parent,
+        capture_output=True,
+        text=True
+    )
+    if result.returncode != 0:
+        lines = result.stderr.strip().splitlines()
+        return None, lines[-1] if lines else f"exit code {result.returncode}"
+
+    # Lines look like "import time:       412 |       1630 |   crewai.agent"
+    packages = {}
+    for line in result.stderr.splitlines():
+        parts = line[len("import time:"):].split("|")
+        if not line.startswith("import time:") or len(parts) != 3 or not parts[0].strip().isdigit():
+            continue
+        package = parts[2].strip().split(".")[0]
+        packages[package] = packages.get(package, 0) + int(parts[0]) / 1000
+    total = sum(packages.values())
+    return total, sorted(packages.items(), key=lambda item: item[1], reverse=True)
+
+
+def print_startup_profile(top=10):
+    """Print the import cost of each startup target."""
+    print("Import cost (python -X importtime)...")
+    print("-" * 60)
+    for module_name, description in STARTUP_TARGETS:
+        total, packages = import_costs(module_name)
+        if total is None:
+            print(f"❌ {description} ({module_name}) - import failed: {packages}")
+            continue
+        print(f"{description} ({module_name}): {total:.0f} ms")
+        for package, ms in packages[:top]:
+            print(f"    {package:<28} {ms:8.1f} ms  {ms / total:6.1%}")
+    print("-" * 60)
+    print()
+
 print("=" * 60)
 print("LinkedIn Post Generator - Setup Verification")
 print("=" * 60)
@@ -37,7 +98,6 @@ all_good &= check_import("duckduckgo_search", "duckduckgo-search")
 all_good &= check_import("dotenv", "python-dotenv")
 all_good &= check_import("pydantic")
 all_good &= check_import("langchain")
-all_good &= check_import("langchain_anthropic", "langchain-anthropic")
 
 print("-" * 60)
 print()
@@ -56,4 +116,7 @@ else:
     print("  pip install -r requirements.txt")
 
 print()
+if "--profile-startup" in sys.argv[1:]:
+    print_startup_profile()
+
 print("=" * 60)
@@ -0,0 +1,261 @@
+"""
+Customer store — SQLite-backed customer records for get_customer_info_tool.
+
+Customers are indexed on id (primary key) and on a normalized name
+(case-folded, whitespace-collapsed), so exact, case-insensitive and prefix
+lookups are index seeks instead of scans.  A bounded LRU keeps hot lookups
+off the database entirely.
+
+    python customer_store.py generate --count 2000000
+    python customer_store.py bench --lookups 50000
+"""
+
+import argparse
+import os
+import random
+import sqlite3
+import statistics
+import threading
+import time
+from collections import OrderedDict
+
+from percentiles import percentile
+
+DB_PATH = os.path.join(os.path.dirname(__file__), "customers.db")
+
+COLUMNS = ("id", "name", "email", "credit_card", "loyalty_status")
+
+DEMO_CUSTOMERS = [
+    (1, "Krishna", "krishna_001@abc.com", "4111-1111-1111-1111", "Gold"),     # Visa test card ✓ Luhn valid
+    (2, "Alice",   "alice_002@abc.com",   "5500-0000-0000-0004", "Silver"),   # Mastercard test card ✓ Luhn valid
+    (3, "Bob",     "bob2009@xyz.com",     "6011-1111-1111-1117", "Bronze"),   # Discover test card ✓ Luhn valid
+]
+
+
+def normalize_name(name: str) -> str:
+    """Case-insensitive, whitespace-insensitive key for name lookups."""
+    return " ".join(name.casefold().split())
+
+
+class CustomerStore:
+    """
+    Lookup API over the `customers` table.
+
+    Results are dicts with the COLUMNS keys.  Name lookups return lists,
+    since names are not unique.
+    """
+
+    def __init__(self, db_path: str = DB_PATH, cache_size: int = 4096):
+        # Tools may be called from the agent's worker threads.
+        self.conn = sqlite3.connect(db_path, check_same_thread=False)
+        self._lock = threading.Lock()
+        self._cache = OrderedDict()
+        self.cache_size = cache_size
+        self.cache_hits = 0
+        self.cache_misses = 0
+        self._create_schema()
+
+    def _create_schema(self):
+        with self._lock:
+            self.conn.execute("""
+                CREATE TABLE IF NOT EXISTS customers (
+                    id INTEGER PRIMARY KEY,
+                    name TEXT NOT NULL,
+                    name_norm TEXT NOT NULL,
+                    email TEXT,
+                    credit_card TEXT,
+                    loyalty_status TEXT
+                )
+            """)
+            self.conn.execute(
+                "CREATE INDEX IF NOT EXISTS idx_customers_name_norm ON customers (name_norm)"
+            )
+            self.conn.commit()
+
+    def close(self):
+        self.conn.close()
+
+    # -- writes ---------------------------------------------------------------
+
+    def add_many(self, customers, replace: bool = False):
+        """Insert (id, name, email, credit_card, loyalty_status) tuples."""
+        verb = "INSERT OR REPLACE" if replace else "INSERT OR IGNORE"
+        with self._lock:
+            self.conn.executemany(
+                f"{verb} INTO customers VALUES (?, ?, ?, ?, ?, ?)",
+                ((c[0], c[1], normalize_name(c[1]), *c[2:]) for c in customers),
+            )
+            self.conn.commit()
+            self._cache.clear()
+
+    def seed_demo(self):
+        """Make sure the three demo customers exist."""
+        self.add_many(DEMO_CUSTOMERS)
+
+    # -- reads ----------------------------------------------------------------
+
+    def _cached(self, key, query: str, params: tuple) -> list[dict]:
+        with self._lock:
+            rows = self._cache.get(key)
+            if rows is not None:
+                self._cache.move_to_end(key)
+                self.cache_hits += 1
+            else:
+                self.cache_misses += 1
+                rows = tuple(self.conn.execute(query, params).fetchall())
+                self._cache[key] = rows
+                if len(self._cache) > self.cache_size:
+                    self._cache.popitem(last=False)
+        return [dict(zip(COLUMNS, row)) for row in rows]
+
+    def get_by_id(self, customer_id: int):
+        rows = self._cached(
+            ("id", customer_id),
+            "SELECT id, name, email, credit_card, loyalty_status FROM customers WHERE id = ?",
+            (customer_id,),
+        )
+        return rows[0] if rows else None
+
+    def find_by_name(self, name: str, limit: int = 10) -> list[dict]:
+        """Exact, case-insensitive name match."""
+        return self._cached(
+            ("name", normalize_name(name), limit),
+            "SELECT id, name, email, credit_card, loyalty_status FROM customers "
+            "WHERE name_norm = ? ORDER BY id LIMIT ?",
+            (normalize_name(name), limit),
+        )
+
+    def search_prefix(self, prefix: str, limit: int = 10) -> list[dict]:
+        """Case-insensitive prefix match, as a range seek on the name index."""
+        norm = normalize_name(prefix)
+        if not norm:
+            return []
+        return self._cached(
+            ("prefix", norm, limit),
+            "SELECT id, name, email, credit_card, loyalty_status FROM customers "
+            "WHERE name_norm >= ? AND name_norm < ? ORDER BY name_norm, id LIMIT ?",
+            (norm, norm + "\U0010ffff", limit),
+        )
+
+    def lookup(self, name: str, limit: int = 10) -> list[dict]:
+        """Exact name matches if there are any, otherwise prefix matches."""
+        return self.find_by_name(name, limit) or self.search_prefix(name, limit)
+
+    def count(self) -> int:
+        with self._lock:
+            return self.conn.execute("SELECT COUNT(*) FROM customers").fetchone()[0]
+
+
+# ---------------------------------------------------------------------------
+# Generator & benchmark
+# ---------------------------------------------------------------------------
+
+FIRST_NAMES = (
+    "Aarav Aditi Alice Amir Ana Ben Bob Carlos Chen Chloe David Diya Elena Emma "
+    "Fatima Felix Grace Hana Hugo Ines Isaac Jack Julia Kai Krishna Lara Leo Lina "
+    "Maya Mei Noah Nora Omar Olivia Priya Quinn Rahul Rosa Sam Sara Tariq Tom Uma "
+    "Victor Wei Xavier Yara Yusuf Zara Zoe"
+).split()
+LAST_NAMES = (
+    "Ahmed Brown Chen Costa Das Diaz Evans Fischer Garcia Gupta Hansen Ito Jones "
+    "Khan Kim Kumar Lee Lopez Martin Meyer Mori Nguyen Novak Okafor Patel Perez "
+    "Rossi Sato Schmidt Sharma Silva Singh Smith Suzuki Tanaka Taylor Wang Wilson "
+    "Wong Yamada"
+).split()
+LOYALTY = ("Bronze", "Silver", "Gold", "Platinum")
+
+
+def _test_card(rng: random.Random) -> str:
+    """A random Luhn-valid 16-digit Visa-range number, dash grouped."""
+    digits = [4] + [rng.randrange(10) for _ in range(14)]
+    total = 0
+    for i, d in enumerate(reversed(digits)):
+        if i % 2 == 0:
+            d *= 2
+            if d > 9:
+                d -= 9
+        total += d
+    digits.append((10 - total % 10) % 10)
+    s = "".join(map(str, digits))
+    return "-".join(s[i:i + 4] for i in range(0, 16, 4))
+
+
+def generate(count: int, db_path: str = DB_PATH, seed: int = 42, batch: int = 50_000):
+    """Fill the store with `count` synthetic customers (ids after the demo ones)."""
+    rng = random.Random(seed)
+    store = CustomerStore(db_path)
+    store.conn.execute("PRAGMA journal_mode = WAL")
+    store.conn.execute("PRAGMA synchronous = OFF")
+    store.seed_demo()
+    # Bulk load without the secondary index, then build it once.
+    store.conn.execute("DROP INDEX IF EXISTS idx_customers_name_norm")
+
+    start_id = len(DEMO_CUSTOMERS) + 1
+    start = time.perf_counter()
+    for offset in range(0, count, batch):
+        rows = []
+        for cid in range(start_id + offset, start_id + min(offset + batch, count)):
+            first, last = rng.choice(FIRST_NAMES), rng.choice(LAST_NAMES)
+            rows.append((cid, f"{first} {last}", f"{first.lower()}.{last.lower()}{cid}@example.com",
+                         _test_card(rng), rng.choice(LOYALTY)))
+        store.add_many(rows, replace=True)
+    store._create_schema()
+    print(f"Generated {count:,} customers in {time.perf_counter() - start:.1f}s "
+          f"({store.count():,} total) at {db_path}")
+    store.close()
+
+
+def _percentiles(samples: list[float]) -> str:
+    samples = sorted(samples)
+    return (f"p50={statistics.median(samples) * 1e6:7.1f}us  "
+            f"p99={percentile(samples, 0.99) * 1e6:7.1f}us  "
+            f"max={samples[-1] * 1e6:8.1f}us")
+
+
+def bench(lookups: int, db_path: str = DB_PATH, seed: int = 7):
+    """Report lookup latency by id, exact name and prefix, cold and hot."""
+    rng = random.Random(seed)
+    store = CustomerStore(db_path)
+    total = store.count()
+    print(f"Customers: {total:,}   lookups per scenario: {lookups:,}\n")
+
+    names = [f"{rng.choice(FIRST_NAMES)} {rng.choice(LAST_NAMES)}" for _ in range(lookups)]
+    scenarios = {
+        "id":          [(store.get_by_id, rng.randrange(1, total + 1)) for _ in range(lookups)],
+        "exact name":  [(store.find_by_name, n.upper() if i % 2 else n) for i, n in enumerate(names)],
+        "prefix":      [(store.search_prefix, n[:3].lower()) for n in names],
+    }
+    for label, calls in scenarios.items():
+        for mode in ("cold", "hot"):
+            store._cache.clear()
+            if mode == "hot":
+                # Zipf-ish traffic: a small set of customers gets most lookups.
+                hot = calls[:200]
+                calls = [hot[min(int(rng.paretovariate(1.2)) - 1, len(hot) - 1)] for _ in calls]
+            samples = []
+            for fn, arg in calls:
+                t0 = time.perf_counter()
+                fn(arg)
+                samples.append(time.perf_counter() - t0)
+            print(f"{label:<11} {mode:<5} {_percentiles(samples)}")
+    store.close()
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Customer store generator and benchmark")
+    parser.add_argument("--db", default=DB_PATH)
+    sub = parser.add_subparsers(dest="command", required=True)
+    gen = sub.add_parser("generate", help="fill the store with synthetic customers")
+    gen.add_argument("--count", type=int, default=1_000_000)
+    b = sub.add_parser("bench", help="measure lookup latency")
+    b.add_argument("--lookups", type=int, default=20_000)
+    args = parser.parse_args()
+
+    if args.command == "generate":
+        generate(args.count, args.db)
+    else:
+        bench(args.lookups, args.db)
+
+
+if __name__ == "__main__":
+    main()
@@ -1,44 +1,33 @@
 from langchain.tools import tool
 from langchain.agents import create_agent
-from langchain.agents.middleware import PIIMiddleware
 from langchain_openai import ChatOpenAI
 from dotenv import load_dotenv
+
+from customer_store import CustomerStore
+from pii_middleware import CompiledPIIMiddleware
+from pii_scanner import GUARDRAIL_RULES
+
 load_dotenv()
 
 
 llm = ChatOpenAI(model="gpt-5.4", temperature=0)
 # llm = ChatGroq(model="openai/gpt-oss-20b", temperature=0)
 
+customer_store = CustomerStore()
+customer_store.seed_demo()
+
+
 @tool
 def get_customer_info_tool(customer_name: str) -> str:
     """
     Fetches customer information based on a given customer name.
-    This is a placeholder function that simulates retrieving customer data.
-    In a real implementation, this would query a database or external API.
+    Names are matched case-insensitively; if there is no exact match,
+    customers whose name starts with the given text are returned.
     """
-    # Simulated customer data   
-    customers = {
-        "Krishna": {
-            "email": "krishna_001@abc.com",
-            "credit_card": "4111-1111-1111-1111",   # Visa test card ✓ Luhn valid
-            "name": "Krishna",
-            "loyalty_status": "Gold"
-        },
-        "Alice": {
-            "email": "alice_002@abc.com",
-            "credit_card": "5500-0000-0000-0004",   # Mastercard test card ✓ Luhn valid
-            "name": "Alice",
-            "loyalty_status": "Silver"
-        },
-        "Bob": {
-            "email": "bob2009@xyz.com",
-            "credit_card": "6011-1111-1111-1117",   # Discover test card ✓ Luhn valid
-            "name": "Bob",
-            "loyalty_status": "Bronze"
-        },
-    }
-
-    return customers.get(customer_name, "Customer not found.")
+    matches = customer_store.lookup(customer_name, limit=5)
+    if not matches:
+        return "Customer not found."
+    return matches[0] if len(matches) == 1 else matches
 
 
 # ── Agent setup ───────────────────────────────────────────────────────────────
@@ -59,20 +48,9 @@ agent = create_agent(
     """,
     model=llm,
     tools=[get_customer_info_tool],
-    middleware= [       # Mask credit cards in user input
-        PIIMiddleware(
-            "credit_card",
-            strategy="mask",
-            apply_to_tool_results=True
-        ),
-        # Redact emails in user input before sending to model
-        PIIMiddleware(
-            "email",
-            strategy="redact",
-            apply_to_tool_results=True,  
-            apply_to_output=True
-        ),
-    ]
+    # One middleware, one scan per message: credit cards masked and emails
+    # redacted in input and tool results, emails also redacted in the output.
+    middleware=[CompiledPIIMiddleware(GUARDRAIL_RULES)]
 )
 
 # When user provides PII, it will be handled according to the strategy
@@ -85,3 +63,9 @@ result = agent.invoke({
 
 # print(result)
 print(result["messages"][-1].content)
+
+# Streaming alternative — PII is redacted as tokens arrive, even when a card
+# number is split across chunks:
+# from pii_stream import stream_redacted
+# for text in stream_redacted(agent, {"messages": [{"role": "user", "content": "..."}]}):
+#     print(text, end="", flush=True)
@@ -0,0 +1,8 @@
+"""Latency percentiles shared by the guardrail benchmarks."""
+
+import math
+
+
+def percentile(sorted_values: list[float], q: float) -> float:
+    """Nearest-rank percentile of an already sorted, non-empty list."""
+    return sorted_values[max(0, math.ceil(q * len(sorted_values)) - 1)]
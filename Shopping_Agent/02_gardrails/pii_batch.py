@@ -0,0 +1,192 @@
+"""
+Batch PII redaction for historical transcripts and exports (JSONL).
+
+Records are streamed from the input files, redacted in a process pool with
+the same card/email rules the guardrails agent uses, and written back in
+input order.  At most `2 * workers` blocks are in flight, so memory stays
+bounded however large the input is.
+
+    python pii_batch.py transcripts/*.jsonl -o redacted.jsonl --workers 8
+"""
+
+import argparse
+import json
+import os
+import sys
+import time
+from collections import Counter, deque
+from concurrent.futures import ProcessPoolExecutor
+
+from pii_scanner import GUARDRAIL_RULES, PIIScanner
+
+_scanner = None   # per-worker, built once by _init_worker
+_fields = None
+
+
+def _init_worker(strategies: dict, fields):
+    global _scanner, _fields
+    _scanner = PIIScanner(strategies)
+    _fields = frozenset(fields) if fields else None
+
+
+def _redact_value(value, counts: Counter, in_field: bool):
+    if isinstance(value, str):
+        if not in_field:
+            return value
+        redacted, matches = _scanner.sanitize(value)
+        counts.update(m.type for m in matches)
+        return redacted
+    if isinstance(value, int) and not isinstance(value, bool) and in_field:
+        # Card numbers exported as bare JSON numbers.
+        redacted, matches = _scanner.sanitize(str(value))
+        if matches:
+            counts.update(m.type for m in matches)
+            return redacted
+        return value
+    if isinstance(value, dict):
+        return {
+            k: _redact_value(v, counts, in_field or (_fields is not None and k in _fields))
+            for k, v in value.items()
+        }
+    if isinstance(value, list):
+        return [_redact_value(v, counts, in_field) for v in value]
+    return value
+
+
+def redact_line(line: str, counts: Counter, errors: Counter = None) -> str:
+    """
+    Redact one JSONL record (a line without its trailing newline).
+
+    PII matches are added to `counts` by type; a line that is not valid JSON
+    is redacted as plain text and counted in `errors` instead. A record
+    without PII is returned exactly as it was read.
+    """
+    # Fast path: without escapes, JSON string contents appear verbatim in the
+    # raw line and are delimited by quotes, so a clean raw line means clean
+    # strings and the record can be copied through without parsing.
+    if "\\" not in line and not _scanner.find(line):
+        return line
+    try:
+        record = json.loads(line)
+    except ValueError:
+        if errors is not None:
+            errors["invalid_json"] += 1
+        redacted, matches = _scanner.sanitize(line)
+        counts.update(m.type for m in matches)
+        return redacted
+    found = Counter()
+    redacted = _redact_value(record, found, in_field=_fields is None)
+    if not found:
+        # Only escapes, no PII: keep the original encoding and formatting.
+        return line
+    counts.update(found)
+    return json.dumps(redacted, ensure_ascii=False)
+
+
+def _redact_block(block: str) -> tuple[str, int, Counter, Counter]:
+    """
+    Redact a block of whole JSONL lines; returns (text, records, counts,
+    errors). Blank lines are copied through so the output stays
+    line-aligned with the input.
+    """
+    counts = Counter()
+    errors = Counter()
+    lines = block.split("\n")
+    if block.endswith("\n"):
+        lines.pop()
+    out = [redact_line(line, counts, errors) if line.strip() else line for line in lines]
+    records = sum(1 for line in lines if line.strip())
+    return "".join(line + "\n" for line in out), records, counts, errors
+
+
+def iter_blocks(paths: list[str], block_size: int):
+    """
+    Stream the input files as blocks of roughly `block_size` characters,
+    each ending on a line boundary.  Shipping one string per block to the
+    workers is far cheaper than pickling a list of individual records.
+    """
+    for path in paths:
+        with open(path, encoding="utf-8") as f:
+            while True:
+                block = f.read(block_size)
+                if not block:
+                    break
+                if not block.endswith("\n"):
+                    block += f.readline()
+                yield block
+
+
+def redact_files(paths: list[str], out, workers: int = None, block_size: int = 1 << 20,
+                 rules=GUARDRAIL_RULES, fields=None) -> dict:
+    """
+    Redact every record in `paths` into the text stream `out`, in order.
+
+    Every PII type in `rules` is applied regardless of surface — stored
+    transcripts mix user input, tool results and model output.
+    Returns a summary with records/s, match counts per PII type and the
+    number of lines that were not valid JSON.
+    """
+    workers = workers or os.cpu_count() or 1
+    strategies = {r.pii_type: r.strategy for r in rules}
+    counts = Counter()
+    errors = Counter()
+    records = 0
+    start = time.perf_counter()
+
+    with ProcessPoolExecutor(workers, initializer=_init_worker,
+                             initargs=(strategies, fields)) as pool:
+        in_flight = deque()
+
+        def drain_one():
+            nonlocal records
+            text, block_records, block_counts, block_errors = in_flight.popleft().result()
+            out.write(text)
+            records += block_records
+            counts.update(block_counts)
+            errors.update(block_errors)
+
+        for block in iter_blocks(paths, block_size):
+            in_flight.append(pool.submit(_redact_block, block))
+            if len(in_flight) >= 2 * workers:
+                drain_one()
+        while in_flight:
+            drain_one()
+
+    elapsed = time.perf_counter() - start
+    return {
+        "records": records,
+        "seconds": round(elapsed, 2),
+        "records_per_second": round(records / elapsed) if elapsed else 0,
+        "matches": dict(counts),
+        "invalid_json": errors["invalid_json"],
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Redact cards and emails in JSONL files")
+    parser.add_argument("inputs", nargs="+", help="JSONL files to redact")
+    parser.add_argument("-o", "--output", help="output JSONL file (default: stdout)")
+    parser.add_argument("--workers", type=int, default=None, help="processes (default: all cores)")
+    parser.add_argument("--block-kb", type=int, default=1024, help="input characters per task, in KB")
+    parser.add_argument("--field", action="append", dest="fields",
+                        help="only redact values under this key (repeatable; default: every string)")
+    args = parser.parse_args()
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        summary = redact_files(args.inputs, out, args.workers, args.block_kb * 1024,
+                               fields=args.fields)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+    print(f"Records:   {summary['records']:,} in {summary['seconds']}s "
+          f"({summary['records_per_second']:,} records/s)", file=sys.stderr)
+    for pii_type, count in sorted(summary["matches"].items()):
+        print(f"  {pii_type:<12} {count:,}", file=sys.stderr)
+    if summary["invalid_json"]:
+        print(f"Invalid JSON lines (redacted as text): {summary['invalid_json']:,}", file=sys.stderr)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,406 @@
+"""
+PII benchmarks — single-pass PIIScanner vs the stacked setup guardrails.py
+used to run (one PIIMiddleware, i.e. one full regex pass, per PII type).
+
+  throughput  MB/s over a large synthetic support-chat text
+  corpus      precision/recall per PII type, throughput and latency per
+              message size on a generated, labeled corpus (valid/invalid
+              Luhn cards in several formats, including mixed, partial and
+              tab/newline separators, emails, and hard negatives such as
+              order numbers, versions, IPs and phone numbers)
+
+    python pii_benchmark.py throughput --size-mb 8 --repeat 5
+    python pii_benchmark.py corpus --messages 5000 --write-corpus corpus.jsonl
+    python pii_benchmark.py corpus --corpus corpus.jsonl --gate compiled --min-recall 0.999
+
+With --gate, the exit status is non-zero when the gated configuration
+falls below --min-precision / --min-recall for any PII type, so it can be
+run before shipping a change to redaction.
+"""
+
+import argparse
+import json
+import random
+import re
+import statistics
+import sys
+import time
+from collections import Counter
+
+from percentiles import percentile
+from pii_scanner import (
+    GUARDRAIL_RULES,
+    PIIDetectionError,
+    PIIMatch,
+    PIIScanner,
+    _replacement,
+    luhn_valid,
+)
+
+SURFACES = ("input", "tool_results", "output")
+
+WORDS = (
+    "customer order shipped refund loyalty status gold silver bronze account "
+    "please confirm the details below thanks for reaching out our team will "
+    "follow up version release ticket number invoice total amount due"
+).split()
+
+CARDS = ("4111-1111-1111-1111", "5500 0000 0000 0004", "6011111111111117",
+         "4111 1111-1111 1111", "41111111 11111111")
+EMAILS = ("krishna_001@abc.com", "alice_002@abc.com", "bob2009@xyz.com")
+
+
+def generate_text(size_bytes: int, pii_rate: float = 0.002, seed: int = 7) -> str:
+    """Support-chat style prose; `pii_rate` is the fraction of tokens that are PII."""
+    rng = random.Random(seed)
+    parts, size = [], 0
+    while size < size_bytes:
+        roll = rng.random()
+        if roll < pii_rate / 2:
+            token = rng.choice(CARDS)
+        elif roll < pii_rate:
+            token = rng.choice(EMAILS)
+        elif roll < pii_rate + 0.02:
+            token = str(rng.randrange(10_000, 10_000_000))   # order numbers
+        else:
+            token = rng.choice(WORDS)
+        parts.append(token)
+        size += len(token) + 1
+    return " ".join(parts)
+
+
+# ---------------------------------------------------------------------------
+# Stacked baseline — the per-type detectors of langchain's PIIMiddleware
+# ---------------------------------------------------------------------------
+
+class RegexDetector:
+    """One PII type, one full regex pass, like a single PIIMiddleware."""
+
+    PATTERNS = {
+        "email": (r"\b[A-Za-z0-9._%+-]+@[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b", None),
+        "credit_card": (r"\b\d{4}[\s-]?\d{4}[\s-]?\d{4}[\s-]?\d{4}\b", luhn_valid),
+    }
+
+    def __init__(self, pii_type: str, strategy: str):
+        pattern, self.validator = self.PATTERNS[pii_type]
+        self.pattern = re.compile(pattern)
+        self.pii_type = pii_type
+        self.strategy = strategy
+
+    def find(self, text: str) -> list[tuple[str, int, int]]:
+        return [
+            (self.pii_type, m.start(), m.end()) for m in self.pattern.finditer(text)
+            if self.validator is None or self.validator(m.group())
+        ]
+
+    def sanitize(self, text: str):
+        matches = self.find(text)
+        if not matches:
+            return text, []
+        if self.strategy == "block":
+            raise PIIDetectionError(
+                self.pii_type, [PIIMatch(t, text[s:e], s, e) for t, s, e in matches]
+            )
+        parts, last = [], 0
+        for _, start, end in matches:
+            parts.append(text[last:start])
+            parts.append(_replacement(self.pii_type, self.strategy, text[start:end]))
+            last = end
+        parts.append(text[last:])
+        return "".join(parts), matches
+
+
+def stacked_detectors(rules) -> list[list]:
+    """One detector per (rule, surface) — how stacked PIIMiddleware's behave."""
+    return [
+        [RegexDetector(r.pii_type, r.strategy) for r in rules if getattr(r, f"apply_to_{s}")]
+        for s in SURFACES
+    ]
+
+
+def compiled_detectors(rules) -> list[list]:
+    """One combined scanner per surface."""
+    return [[PIIScanner.from_rules(rules, s)] for s in SURFACES]
+
+
+# ---------------------------------------------------------------------------
+# Runner
+# ---------------------------------------------------------------------------
+
+def run_pipeline(per_surface: list[list], text: str) -> int:
+    """Push `text` through every surface; return total matches."""
+    found = 0
+    for detectors in per_surface:
+        current = text
+        for detector in detectors:
+            current, matches = detector.sanitize(current)
+            found += len(matches)
+    return found
+
+
+def bench(name: str, per_surface, text: str, repeat: int) -> float:
+    best = float("inf")
+    found = 0
+    for _ in range(repeat):
+        start = time.perf_counter()
+        found = run_pipeline(per_surface, text)
+        best = min(best, time.perf_counter() - start)
+    passes = sum(len(s) for s in per_surface)
+    mb_per_s = len(text.encode()) / best / 1e6
+    print(f"{name:<10} passes={passes}  best={best * 1000:8.1f} ms  "
+          f"{mb_per_s:7.1f} MB/s  matches={found}")
+    return mb_per_s
+
+
+def run_throughput(args):
+    text = generate_text(int(args.size_mb * 1e6), args.pii_rate)
+    print(f"Corpus: {len(text.encode()) / 1e6:.1f} MB, best of {args.repeat}\n")
+
+    stacked = bench("stacked", stacked_detectors(GUARDRAIL_RULES), text, args.repeat)
+    compiled = bench("compiled", compiled_detectors(GUARDRAIL_RULES), text, args.repeat)
+    print(f"\nSpeed-up: {compiled / stacked:.2f}x")
+
+
+# ---------------------------------------------------------------------------
+# Labeled corpus
+# ---------------------------------------------------------------------------
+
+# (issuer prefix, length, grouping)
+CARD_FORMATS = (
+    ("4", 16, (4, 4, 4, 4)),
+    ("51", 16, (4, 4, 4, 4)),
+    ("6011", 16, (4, 4, 4, 4)),
+    ("37", 15, (4, 6, 5)),
+    ("36", 14, (4, 6, 4)),
+    ("4", 13, None),
+    ("4", 19, (4, 4, 4, 4, 3)),
+)
+SEPARATORS = ("-", " ", "")
+# langchain's 4-4-4-4 pattern lets each separator be any whitespace, a dash
+# or nothing, independently ("4111 1111-1111 1111", "41111111 11111111").
+MIXED_SEPARATORS = ("-", " ", "", "\t", "\n")
+
+EMAIL_LOCALS = ("krishna_001", "alice.smith", "bob2009", "first.last+orders", "x-y", "ops")
+EMAIL_DOMAINS = ("abc.com", "xyz.com", "mail.example.co.uk", "d-omain.io", "Example.ORG")
+
+SIZE_BUCKETS = (256, 1024, 4096, 16384)
+
+
+def _luhn_check_digit(body: str) -> str:
+    total = 0
+    for i, c in enumerate(reversed(body)):
+        d = int(c)
+        if i % 2 == 0:
+            d = d * 2 - 9 if d > 4 else d * 2
+        total += d
+    return str((10 - total % 10) % 10)
+
+
+def _card(rng: random.Random, valid: bool) -> str:
+    prefix, length, groups = rng.choice(CARD_FORMATS)
+    body = prefix + "".join(str(rng.randrange(10)) for _ in range(length - len(prefix) - 1))
+    check = _luhn_check_digit(body)
+    if not valid:
+        check = str((int(check) + rng.randrange(1, 10)) % 10)
+    digits = body + check
+    if not groups:
+        return digits
+    parts, pos = [], 0
+    for g in groups:
+        parts.append(digits[pos:pos + g])
+        pos += g
+    if groups == (4, 4, 4, 4) and rng.random() < 0.5:
+        seps = [rng.choice(MIXED_SEPARATORS) for _ in parts[1:]]
+        return parts[0] + "".join(sep + part for sep, part in zip(seps, parts[1:]))
+    return rng.choice(SEPARATORS).join(parts)
+
+
+def _email(rng: random.Random) -> str:
+    return f"{rng.choice(EMAIL_LOCALS)}@{rng.choice(EMAIL_DOMAINS)}"
+
+
+def _hard_negative(rng: random.Random) -> str:
+    kind = rng.randrange(9)
+    if kind == 0:
+        return f"ORD-{rng.randrange(10**7, 10**8)}"
+    if kind == 1:
+        return f"#{rng.randrange(10**9, 10**10)}"
+    if kind == 2:
+        return str(rng.randrange(10**11, 10**12))                       # tracking number
+    if kind == 3:
+        return f"v{rng.randrange(10)}.{rng.randrange(30)}.{rng.randrange(100)}"
+    if kind == 4:
+        return f"{rng.randrange(1, 4)}.{rng.randrange(10)}.0-rc.{rng.randrange(1, 9)}"
+    if kind == 5:
+        return ".".join(str(rng.randrange(256)) for _ in range(4))       # IPv4
+    if kind == 6:
+        return f"+1 555-{rng.randrange(100, 1000)}-{rng.randrange(1000, 10000)}"
+    if kind == 7:
+        return rng.choice(("@support", "user@localhost", "name (at) example.com", "a@b"))
+    return f"2026-{rng.randrange(1, 13):02d}-{rng.randrange(1, 29):02d}"
+
+
+def generate_corpus(messages: int, seed: int = 11) -> list[dict]:
+    """Messages with labeled PII spans: {"text": ..., "spans": [[type, start, end], ...]}."""
+    rng = random.Random(seed)
+    corpus = []
+    for _ in range(messages):
+        target = rng.choice(SIZE_BUCKETS) * rng.uniform(0.3, 1.0)
+        text, spans = "", []
+        while len(text) < target:
+            roll = rng.random()
+            if roll < 0.04:
+                label, token = "credit_card", _card(rng, valid=True)
+            elif roll < 0.06:
+                label, token = None, _card(rng, valid=False)
+            elif roll < 0.10:
+                label, token = "email", _email(rng)
+            elif roll < 0.16:
+                label, token = None, _hard_negative(rng)
+            else:
+                label, token = None, rng.choice(WORDS)
+            lead, trail = rng.choice((("", ""), ("(", ")"), ("", ","), ("", "."), ('"', '"')))
+            text += (" " if text else "") + lead
+            if label:
+                spans.append([label, len(text), len(text) + len(token)])
+            text += token + trail
+        corpus.append({"text": text, "spans": spans})
+    return corpus
+
+
+class StackedConfig:
+    """The old middleware stack: one regex pass per PII type."""
+
+    def __init__(self, rules):
+        self.detectors = [RegexDetector(r.pii_type, r.strategy) for r in rules]
+
+    def find(self, text: str):
+        return sorted((m for d in self.detectors for m in d.find(text)), key=lambda m: m[1])
+
+    def sanitize(self, text: str):
+        for detector in self.detectors:
+            text, _ = detector.sanitize(text)
+        return text
+
+
+class CompiledConfig:
+    """PIIScanner with every rule in one pass."""
+
+    def __init__(self, rules):
+        self.scanner = PIIScanner({r.pii_type: r.strategy for r in rules})
+
+    def find(self, text: str):
+        return [(m.type, m.start, m.end) for m in self.scanner.find(text)]
+
+    def sanitize(self, text: str):
+        return self.scanner.sanitize(text)[0]
+
+
+DETECTOR_CONFIGS = {
+    "stacked": StackedConfig,
+    "compiled": CompiledConfig,
+}
+
+
+def evaluate(config, corpus: list[dict]) -> dict:
+    """Precision/recall per PII type, MB/s, and per-message latency by size."""
+    tp, fp, fn = Counter(), Counter(), Counter()
+    for msg in corpus:
+        truth = {tuple(s) for s in msg["spans"]}
+        found = set(config.find(msg["text"]))
+        for label, *_ in found & truth:
+            tp[label] += 1
+        for label, *_ in found - truth:
+            fp[label] += 1
+        for label, *_ in truth - found:
+            fn[label] += 1
+
+    latencies = {bucket: [] for bucket in SIZE_BUCKETS}
+    start = time.perf_counter()
+    for msg in corpus:
+        t0 = time.perf_counter()
+        config.sanitize(msg["text"])
+        elapsed = time.perf_counter() - t0
+        bucket = next((b for b in SIZE_BUCKETS if len(msg["text"]) <= b), SIZE_BUCKETS[-1])
+        latencies[bucket].append(elapsed)
+    total = time.perf_counter() - start
+
+    accuracy = {}
+    for label in sorted(set(tp) | set(fp) | set(fn)):
+        p_den, r_den = tp[label] + fp[label], tp[label] + fn[label]
+        accuracy[label] = {
+            "precision": tp[label] / p_den if p_den else 1.0,
+            "recall": tp[label] / r_den if r_den else 1.0,
+            "tp": tp[label], "fp": fp[label], "fn": fn[label],
+        }
+    size = sum(len(m["text"].encode()) for m in corpus)
+    return {
+        "accuracy": accuracy,
+        "mb_per_s": size / total / 1e6 if total else 0.0,
+        "latency_us": {
+            b: (statistics.median(v) * 1e6, percentile(sorted(v), 0.99) * 1e6)
+            for b, v in latencies.items() if v
+        },
+    }
+
+
+def run_corpus(args) -> int:
+    if args.corpus:
+        with open(args.corpus, encoding="utf-8") as f:
+            corpus = [json.loads(line) for line in f if line.strip()]
+    else:
+        corpus = generate_corpus(args.messages)
+    if args.write_corpus:
+        with open(args.write_corpus, "w", encoding="utf-8") as f:
+            for msg in corpus:
+                f.write(json.dumps(msg) + "\n")
+    labels = Counter(s[0] for m in corpus for s in m["spans"])
+    print(f"Corpus: {len(corpus):,} messages, "
+          f"{sum(len(m['text'].encode()) for m in corpus) / 1e6:.1f} MB, "
+          f"labels {dict(labels)}")
+
+    failed = False
+    for name, factory in DETECTOR_CONFIGS.items():
+        result = evaluate(factory(GUARDRAIL_RULES), corpus)
+        print(f"\n== {name}  ({result['mb_per_s']:.1f} MB/s)")
+        for label, acc in result["accuracy"].items():
+            print(f"  {label:<12} precision={acc['precision']:.4f}  recall={acc['recall']:.4f}  "
+                  f"(tp={acc['tp']} fp={acc['fp']} fn={acc['fn']})")
+            if name == args.gate and (acc["precision"] < args.min_precision
+                                      or acc["recall"] < args.min_recall):
+                failed = True
+        for bucket, (p50, p99) in result["latency_us"].items():
+            print(f"  <= {bucket:>5} B   p50={p50:8.1f}us  p99={p99:8.1f}us")
+
+    if args.gate:
+        print(f"\nGate ({args.gate}): {'FAILED' if failed else 'passed'}")
+    return 1 if failed else 0
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.strip().splitlines()[0])
+    sub = parser.add_subparsers(dest="command", required=True)
+
+    tp = sub.add_parser("throughput", help="MB/s on one large synthetic text")
+    tp.add_argument("--size-mb", type=float, default=4.0)
+    tp.add_argument("--pii-rate", type=float, default=0.002,
+                    help="fraction of tokens that are cards/emails")
+    tp.add_argument("--repeat", type=int, default=5)
+
+    cp = sub.add_parser("corpus", help="accuracy and latency on a labeled corpus")
+    cp.add_argument("--messages", type=int, default=5000)
+    cp.add_argument("--corpus", help="read the labeled corpus from this JSONL file")
+    cp.add_argument("--write-corpus", help="save the labeled corpus to this JSONL file")
+    cp.add_argument("--gate", choices=sorted(DETECTOR_CONFIGS), help="configuration to gate on")
+    cp.add_argument("--min-precision", type=float, default=0.99)
+    cp.add_argument("--min-recall", type=float, default=0.99)
+
+    args = parser.parse_args()
+    if args.command == "throughput":
+        run_throughput(args)
+    else:
+        sys.exit(run_corpus(args))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,157 @@
+"""
+Single-pass PII middleware — replaces a stack of per-type PIIMiddleware
+instances with one middleware that scans each message once for every
+configured PII type.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any
+
+from langchain.agents.middleware import AgentMiddleware, AgentState
+from langchain_core.messages import AIMessage, HumanMessage, ToolMessage
+from langgraph.runtime import Runtime
+
+from pii_scanner import PIIRule, PIIScanner
+
+_MISSING = object()
+
+
+def _digest(content: str) -> bytes:
+    return hashlib.blake2b(content.encode(), digest_size=16).digest()
+
+
+class _BoundedLRU:
+    """Tiny thread-safe LRU map used for the seen-ids set and the memo."""
+
+    def __init__(self, maxsize: int):
+        self.maxsize = maxsize
+        self._data = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            if key not in self._data:
+                return default
+            self._data.move_to_end(key)
+            return self._data[key]
+
+    def put(self, key, value):
+        with self._lock:
+            self._data[key] = value
+            self._data.move_to_end(key)
+            if len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+
+    def __contains__(self, key) -> bool:
+        return self.get(key, _MISSING) is not _MISSING
+
+
+class CompiledPIIMiddleware(AgentMiddleware):
+    """
+    Applies a list of PIIRule's in one pass per message.
+
+    Mirrors langchain's PIIMiddleware hooks:
+      - before_model: the latest user message (input) and the tool results
+        produced since the last AI message (tool_results)
+      - after_model:  the latest AI message (output)
+
+    Work is incremental across turns: a message whose id and content hash
+    match the sanitized version already produced is skipped outright (if
+    the update was not applied, or the message was replaced under the same
+    id, the hash differs and it is scanned again), and sanitization results
+    are memoized by content hash, so identical tool results are only
+    scanned once. Scanning cost per model call is proportional to the new
+    text.
+    """
+
+    def __init__(self, rules: list[PIIRule], memo_size: int = 1024, max_tracked: int = 10_000):
+        super().__init__()
+        self.rules = list(rules)
+        self._input = PIIScanner.from_rules(self.rules, "input")
+        self._output = PIIScanner.from_rules(self.rules, "output")
+        self._tool_results = PIIScanner.from_rules(self.rules, "tool_results")
+        self._sanitized_ids = _BoundedLRU(max_tracked)
+        self._memo = _BoundedLRU(memo_size)
+        self.stats = {"scanned_chars": 0, "memo_hits": 0, "skipped_messages": 0}
+
+    @property
+    def name(self) -> str:
+        return f"{self.__class__.__name__}[{','.join(r.pii_type for r in self.rules)}]"
+
+    def _sanitize_text(self, surface: str, scanner: PIIScanner, content: str):
+        """Sanitized text, or None if `content` holds no PII. Memoized by hash."""
+        key = (surface, _digest(content))
+        cached = self._memo.get(key, _MISSING)
+        if cached is not _MISSING:
+            self.stats["memo_hits"] += 1
+            return cached
+        self.stats["scanned_chars"] += len(content)
+        new_content, matches = scanner.sanitize(content)
+        result = new_content if matches else None
+        self._memo.put(key, result)
+        return result
+
+    def _sanitize_message(self, surface: str, scanner: PIIScanner, message):
+        """Return a sanitized copy of `message`, or None if there is nothing to change."""
+        content = str(message.content) if message.content else ""
+        if message.id is not None and (surface, message.id, _digest(content)) in self._sanitized_ids:
+            self.stats["skipped_messages"] += 1
+            return None
+        new_content = self._sanitize_text(surface, scanner, content) if content else None
+        if message.id is not None:
+            # Keyed on the content the message has once the update is applied.
+            sanitized = content if new_content is None else new_content
+            self._sanitized_ids.put((surface, message.id, _digest(sanitized)), True)
+        if new_content is None:
+            return None
+        return message.model_copy(update={"content": new_content})
+
+    def before_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        messages = state["messages"]
+        if not messages or not (self._input or self._tool_results):
+            return None
+
+        new_messages = list(messages)
+        modified = False
+
+        if self._input:
+            for i in range(len(messages) - 1, -1, -1):
+                if isinstance(messages[i], HumanMessage):
+                    updated = self._sanitize_message("input", self._input, messages[i])
+                    if updated is not None:
+                        new_messages[i] = updated
+                        modified = True
+                    break
+
+        if self._tool_results:
+            last_ai_idx = None
+            for i in range(len(messages) - 1, -1, -1):
+                if isinstance(messages[i], AIMessage):
+                    last_ai_idx = i
+                    break
+            if last_ai_idx is not None:
+                for i in range(last_ai_idx + 1, len(messages)):
+                    if isinstance(messages[i], ToolMessage):
+                        updated = self._sanitize_message("tool_results", self._tool_results, messages[i])
+                        if updated is not None:
+                            new_messages[i] = updated
+                            modified = True
+
+        return {"messages": new_messages} if modified else None
+
+    def after_model(self, state: AgentState, runtime: Runtime) -> dict[str, Any] | None:
+        messages = state["messages"]
+        if not messages or not self._output:
+            return None
+
+        for i in range(len(messages) - 1, -1, -1):
+            if isinstance(messages[i], AIMessage):
+                updated = self._sanitize_message("output", self._output, messages[i])
+                if updated is None:
+                    return None
+                new_messages = list(messages)
+                new_messages[i] = updated
+                return {"messages": new_messages}
+        return None
@@ -0,0 +1,261 @@
+"""
+PII scanner — detects every configured PII type in a single regex pass and
+applies a per-type strategy (mask / redact / hash / block).
+
+The replacement formats match the ones produced by langchain's
+PIIMiddleware, so swapping the stacked middlewares for one scanner does not
+change what the agent (or the customer) sees.  Card detection is a superset
+of langchain's: it accepts everything langchain's pattern does (four groups
+of four, each separator an optional space, tab, newline or dash, mixed
+freely), plus 13–19 contiguous digits and the 4-4-4-4-3 and Amex/Diners
+4-6-5 / 4-6-4 groupings.  Every candidate is Luhn-validated.
+"""
+
+import hashlib
+import re
+from dataclasses import dataclass
+from typing import NamedTuple, Optional
+
+# ---------------------------------------------------------------------------
+# Detectors
+# ---------------------------------------------------------------------------
+#
+# A scan walks the text once with a single character-class regex that stops
+# only at "@" and at runs of digits/separators.  Everything else is skipped
+# at C speed; candidates are then resolved into emails (expand around the
+# "@") or credit cards (regex + Luhn inside the digit run).  An alternation
+# of the full per-type patterns would instead be tried at every word
+# boundary and ends up slower than running the types one after another.
+
+PII_TYPES = ("email", "credit_card")
+
+EMAIL_LOCAL_CHARS = frozenset("ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789._%+-")
+_EMAIL_DOMAIN = re.compile(r"[A-Za-z0-9.-]+\.[A-Za-z]{2,}\b")
+_EMAIL_LOCAL_RUN_AT = re.compile(r"[A-Za-z0-9._%+-]*@")
+
+# 13–19 contiguous digits; the printed groupings with one consistent
+# space/dash separator: 4-4-4-4-3 and Amex/Diners 4-6-5 / 4-6-4; and
+# langchain's four groups of four, each separator an optional whitespace
+# character or dash ("4111 1111-1111 1111", "41111111 11111111").
+# Requiring real groupings keeps adjacent order numbers from being glued
+# into a card that passes Luhn by chance.
+_CREDIT_CARD = re.compile(
+    r"(?:[0-9]{13,19}"
+    r"|[0-9]{4}([ -])(?:[0-9]{4}\1[0-9]{4}\1[0-9]{4}\1[0-9]{3}|[0-9]{6}\1[0-9]{4,5})"
+    r"|[0-9]{4}[\s-]?[0-9]{4}[\s-]?[0-9]{4}[\s-]?[0-9]{4}"
+    r")\b"
+)
+CARD_MIN_DIGITS = 13
+CARD_MAX_DIGITS = 19
+
+_DOUBLED = {str(d): (2 * d if d < 5 else 2 * d - 9) for d in range(10)}
+
+
+def luhn_valid(number: str) -> bool:
+    """Return True if the digits in `number` pass the Luhn checksum."""
+    digits = "".join(number.split()).replace("-", "")
+    if not (digits.isascii() and digits.isdigit()):
+        return False
+    if not CARD_MIN_DIGITS <= len(digits) <= CARD_MAX_DIGITS:
+        return False
+    total = sum(map(int, digits[-1::-2])) + sum(_DOUBLED[c] for c in digits[-2::-2])
+    return total % 10 == 0
+
+
+def _is_word_char(c: str) -> bool:
+    return c.isalnum() or c == "_"
+
+
+def _email_at(text: str, at: int, lo: int) -> Optional[tuple[int, int]]:
+    """Expand the "@" at `at` into an email span, not reaching back past `lo`."""
+    start = at
+    while start > lo and text[start - 1] in EMAIL_LOCAL_CHARS:
+        start -= 1
+    while start < at and not _is_word_char(text[start]):
+        start += 1
+    if start == at:
+        return None
+    domain = _EMAIL_DOMAIN.match(text, at + 1)
+    if domain is None:
+        return None
+    return start, domain.end()
+
+
+def _cards_in_run(text: str, start: int, end: int, check_email: bool) -> list[tuple[int, int]]:
+    """Return the (start, end) of every valid card inside the digit run text[start:end]."""
+    spans = []
+    pos = start
+    while end - pos >= CARD_MIN_DIGITS:
+        m = _CREDIT_CARD.match(text, pos)
+        if (
+            m is not None
+            and not (pos > 0 and _is_word_char(text[pos - 1]))
+            and luhn_valid(m.group())
+        ):
+            # Digits that are really the local part of an email belong to it.
+            local = _EMAIL_LOCAL_RUN_AT.match(text, m.end()) if check_email else None
+            if local is None or not _EMAIL_DOMAIN.match(text, local.end()):
+                spans.append(m.span())
+                pos = m.end()
+                continue
+        # Next candidate starts after the next separator.
+        while pos < end and text[pos].isdigit():
+            pos += 1
+        while pos < end and not text[pos].isdigit():
+            pos += 1
+    return spans
+
+
+STRATEGIES = ("mask", "redact", "hash", "block")
+
+
+class PIIMatch(NamedTuple):
+    type: str
+    value: str
+    start: int
+    end: int
+
+
+class PIIDetectionError(Exception):
+    """Raised by the `block` strategy when PII is found."""
+
+    def __init__(self, pii_type: str, matches: list[PIIMatch]):
+        self.pii_type = pii_type
+        self.matches = matches
+        super().__init__(f"Detected {len(matches)} instance(s) of {pii_type} in content")
+
+
+# ---------------------------------------------------------------------------
+# Rules
+# ---------------------------------------------------------------------------
+
+@dataclass(frozen=True)
+class PIIRule:
+    """Which PII type to look for, what to do with it, and where."""
+
+    pii_type: str
+    strategy: str = "redact"
+    apply_to_input: bool = True
+    apply_to_output: bool = False
+    apply_to_tool_results: bool = False
+
+    def __post_init__(self):
+        if self.pii_type not in PII_TYPES:
+            raise ValueError(f"Unknown PII type: {self.pii_type!r}")
+        if self.strategy not in STRATEGIES:
+            raise ValueError(f"Unknown strategy: {self.strategy!r}")
+
+
+# The configuration guardrails.py runs with: cards masked in input and tool
+# results, emails redacted everywhere including the model's final answer.
+GUARDRAIL_RULES = (
+    PIIRule("credit_card", strategy="mask", apply_to_tool_results=True),
+    PIIRule("email", strategy="redact", apply_to_tool_results=True, apply_to_output=True),
+)
+
+
+# ---------------------------------------------------------------------------
+# Replacement formats
+# ---------------------------------------------------------------------------
+
+def _mask(pii_type: str, value: str) -> str:
+    if pii_type == "email":
+        local, _, domain = value.partition("@")
+        tld = domain.rsplit(".", 1)[-1] if "." in domain else ""
+        return f"{local}@****.{tld}" if tld else f"{local}@****"
+    if pii_type == "credit_card":
+        last4 = "".join(c for c in value if c.isdigit())[-4:]
+        sep = "-" if "-" in value else " " if " " in value else ""
+        if sep:
+            return f"****{sep}****{sep}****{sep}{last4}"
+        return f"************{last4}"
+    return f"****{value[-4:]}" if len(value) > 4 else "****"
+
+
+def _replacement(pii_type: str, strategy: str, value: str) -> str:
+    if strategy == "mask":
+        return _mask(pii_type, value)
+    if strategy == "hash":
+        digest = hashlib.sha256(value.encode()).hexdigest()[:8]
+        return f"<{pii_type}_hash:{digest}>"
+    return f"[REDACTED_{pii_type.upper()}]"
+
+
+# ---------------------------------------------------------------------------
+# Scanner
+# ---------------------------------------------------------------------------
+
+class PIIScanner:
+    """
+    Walks a text exactly once no matter how many PII types are enabled.
+
+    `strategies` maps pii_type -> strategy, e.g. {"credit_card": "mask"}.
+    """
+
+    def __init__(self, strategies: dict[str, str]):
+        for pii_type, strategy in strategies.items():
+            PIIRule(pii_type, strategy)  # validates both names
+        self.strategies = dict(strategies)
+        self._email = "email" in self.strategies
+        self._cards = "credit_card" in self.strategies
+        if self._cards:
+            trigger = "[@0-9]" if self._email else "[0-9]"
+            self.pattern = re.compile(trigger + r"[0-9\s-]*")
+        elif self._email:
+            self.pattern = re.compile("@")
+        else:
+            self.pattern = None
+
+    @classmethod
+    def from_rules(cls, rules, surface: str) -> "PIIScanner":
+        """Build the scanner for one surface: "input", "output" or "tool_results"."""
+        return cls({r.pii_type: r.strategy for r in rules if getattr(r, f"apply_to_{surface}")})
+
+    def __bool__(self) -> bool:
+        return self.pattern is not None
+
+    def find(self, text: str, pos: int = 0) -> list[PIIMatch]:
+        """Return every validated PII match starting at or after `pos`, in order."""
+        if self.pattern is None or not text:
+            return []
+        matches = []
+        lo = pos
+        for m in self.pattern.finditer(text, pos):
+            start, end = m.span()
+            if start < lo:
+                continue  # inside the previous match, e.g. an email domain
+            if text[start] == "@":
+                if self._email:
+                    span = _email_at(text, start, lo)
+                    if span is not None:
+                        matches.append(PIIMatch("email", text[span[0]:span[1]], *span))
+                        lo = span[1]
+                        continue
+                start += 1  # digits right after a stray "@" may still be a card
+            if self._cards and end - start >= CARD_MIN_DIGITS:
+                for card_start, card_end in _cards_in_run(text, start, end, self._email):
+                    matches.append(PIIMatch("credit_card", text[card_start:card_end], card_start, card_end))
+                    lo = card_end
+        return matches
+
+    def apply(self, text: str, matches: list[PIIMatch], offset: int = 0) -> str:
+        """Rewrite `text` with `matches` (positions shifted by `offset`) replaced."""
+        if not matches:
+            return text
+        for pii_type in {m.type for m in matches}:
+            if self.strategies[pii_type] == "block":
+                raise PIIDetectionError(pii_type, [m for m in matches if m.type == pii_type])
+        parts = []
+        last = 0
+        for m in matches:
+            start, end = m.start - offset, m.end - offset
+            parts.append(text[last:start])
+            parts.append(_replacement(m.type, self.strategies[m.type], m.value))
+            last = end
+        parts.append(text[last:])
+        return "".join(parts)
+
+    def sanitize(self, text: str) -> tuple[str, list[PIIMatch]]:
+        """Detect and replace all configured PII in one pass over `text`."""
+        matches = self.find(text)
+        return self.apply(text, matches), matches
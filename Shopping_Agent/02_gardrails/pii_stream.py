@@ -0,0 +1,190 @@
+"""
+Streaming PII redaction — wraps token streams from the guardrails agent so
+PII split across chunks (e.g. "4111-11" + "11-1111-1111") never leaks.
+
+Each chunk is appended to a small buffer.  Only the trailing run of
+characters that could still grow into a card or an email is held back;
+everything before it is redacted and released immediately.  The hold is
+bounded by `max_hold`, so per-chunk work (and added latency) is bounded too.
+
+    python pii_stream.py --chunk-size 4      # latency report on a synthetic stream
+"""
+
+import argparse
+import statistics
+import time
+from dataclasses import dataclass, field
+
+from percentiles import percentile
+from pii_scanner import EMAIL_LOCAL_CHARS, GUARDRAIL_RULES, PIIScanner
+
+# Longest printed card: 19 digits + 4 separators.
+CARD_MAX_SPAN = 23
+# Digits and the separators a card may be printed with (see _CREDIT_CARD)
+CARD_RUN_CHARS = frozenset("0123456789 -\t\n\r\f\v")
+EMAIL_RUN_CHARS = EMAIL_LOCAL_CHARS | {"@"}
+
+
+@dataclass
+class StreamStats:
+    """Per-chunk cost of the redactor, in seconds and characters."""
+
+    chunks: int = 0
+    chars_in: int = 0
+    chars_out: int = 0
+    max_held: int = 0
+    latencies: list[float] = field(default_factory=list)
+
+    def summary(self) -> dict:
+        lat = sorted(self.latencies) or [0.0]
+        return {
+            "chunks": self.chunks,
+            "chars_in": self.chars_in,
+            "chars_out": self.chars_out,
+            "max_held_chars": self.max_held,
+            "p50_us": round(statistics.median(lat) * 1e6, 1),
+            "p99_us": round(percentile(lat, 0.99) * 1e6, 1),
+            "max_us": round(lat[-1] * 1e6, 1),
+        }
+
+
+class StreamingRedactor:
+    """
+    Incrementally redacts a text stream with a PIIScanner.
+
+        redactor = StreamingRedactor(scanner)
+        for chunk in chunks:
+            emit(redactor.feed(chunk))
+        emit(redactor.flush())
+    """
+
+    def __init__(self, scanner: PIIScanner, max_hold: int = 256):
+        self.scanner = scanner
+        self.max_hold = max_hold
+        self.stats = StreamStats()
+        self._pending = ""
+        self._context = ""   # last released character, for word-boundary checks
+
+    def _run_start(self, text: str, base: int, end: int) -> int:
+        """Start of the card/email character runs that end at `end`."""
+        start = end
+        if "credit_card" in self.scanner.strategies:
+            i, lo = end, max(base, end - CARD_MAX_SPAN)
+            while i > lo and text[i - 1] in CARD_RUN_CHARS:
+                i -= 1
+            while i < end and not text[i].isdigit():
+                i += 1
+            start = min(start, i)
+        if "email" in self.scanner.strategies:
+            i, lo = end, max(base, end - self.max_hold)
+            while i > lo and text[i - 1] in EMAIL_RUN_CHARS:
+                i -= 1
+            start = min(start, i)
+        return start
+
+    def _hold_point(self, text: str, base: int, matches) -> int:
+        """
+        Index from which text must be held back: the trailing run that could
+        still grow into PII, widened to cover any match or candidate run that
+        touches it, since those may still change once more text arrives.
+        """
+        hold = len(text)
+        while True:
+            new = self._run_start(text, base, hold)
+            for m in matches:
+                if m.end > new:
+                    new = min(new, m.start)
+                    break
+            if new == hold:
+                return hold
+            hold = new
+
+    def _release(self, final: bool) -> str:
+        text = self._context + self._pending
+        base = len(self._context)
+        matches = self.scanner.find(text, base)
+        if final:
+            hold = len(text)
+        else:
+            hold = self._hold_point(text, base, matches)
+            matches = [m for m in matches if m.end <= hold]
+
+        out = self.scanner.apply(text[base:hold], matches, offset=base)
+        if hold > base:
+            self._context = text[hold - 1]
+        self._pending = text[hold:]
+        self.stats.chars_out += len(out)
+        self.stats.max_held = max(self.stats.max_held, len(self._pending))
+        return out
+
+    def feed(self, chunk: str) -> str:
+        """Add a chunk; return the text that is now safe to show."""
+        start = time.perf_counter()
+        self._pending += chunk
+        self.stats.chunks += 1
+        self.stats.chars_in += len(chunk)
+        out = self._release(final=False)
+        self.stats.latencies.append(time.perf_counter() - start)
+        return out
+
+    def flush(self) -> str:
+        """End of stream: redact and return whatever is still held back."""
+        return self._release(final=True)
+
+
+def _chunk_text(chunk) -> str:
+    content = chunk.content
+    if isinstance(content, str):
+        return content
+    return "".join(
+        block.get("text", "") if isinstance(block, dict) else str(block)
+        for block in content
+    )
+
+
+def stream_redacted(agent, inputs: dict, rules=GUARDRAIL_RULES, max_hold: int = 256):
+    """
+    Stream the agent's answer token by token with every PII type in `rules`
+    redacted, whichever surface the rule was configured for.
+    """
+    scanner = PIIScanner({r.pii_type: r.strategy for r in rules})
+    redactor, message_id = None, None
+    for chunk, _metadata in agent.stream(inputs, stream_mode="messages"):
+        if getattr(chunk, "type", None) != "AIMessageChunk":
+            continue
+        if chunk.id != message_id:
+            if redactor is not None:
+                yield redactor.flush()
+            redactor, message_id = StreamingRedactor(scanner, max_hold), chunk.id
+        text = _chunk_text(chunk)
+        if text:
+            out = redactor.feed(text)
+            if out:
+                yield out
+    if redactor is not None:
+        yield redactor.flush()
+
+
+def main():
+    from pii_benchmark import generate_text
+
+    parser = argparse.ArgumentParser(description="Per-chunk latency of StreamingRedactor")
+    parser.add_argument("--size-kb", type=int, default=256)
+    parser.add_argument("--chunk-size", type=int, default=4, help="characters per simulated token")
+    parser.add_argument("--pii-rate", type=float, default=0.01)
+    args = parser.parse_args()
+
+    text = generate_text(args.size_kb * 1000, args.pii_rate)
+    scanner = PIIScanner({r.pii_type: r.strategy for r in GUARDRAIL_RULES})
+    redactor = StreamingRedactor(scanner)
+    streamed = "".join(
+        redactor.feed(text[i:i + args.chunk_size]) for i in range(0, len(text), args.chunk_size)
+    ) + redactor.flush()
+
+    assert streamed == scanner.sanitize(text)[0], "streamed output differs from whole-text redaction"
+    for key, value in redactor.stats.summary().items():
+        print(f"{key:<15} {value}")
+
+
+if __name__ == "__main__":
+    main()
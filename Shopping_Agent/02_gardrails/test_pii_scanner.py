@@ -0,0 +1,84 @@
+"""Regression tests for single-pass PII detection (pii_scanner.py)."""
+
+import pytest
+
+from pii_scanner import PIIScanner, luhn_valid
+
+CARDS = PIIScanner({"credit_card": "mask"})
+
+
+@pytest.mark.parametrize("card", [
+    "4111111111111111",
+    "4111-1111-1111-1111",
+    "4111 1111 1111 1111",
+    # langchain's pattern allows each separator independently
+    "4111-11111111-1111",
+    "4111 1111-1111 1111",
+    "41111111 11111111",
+    "4111\t1111\t1111\t1111",
+    "4111\n1111\n1111\n1111",
+    # Amex 4-6-5
+    "3782 822463 10005",
+])
+def test_separator_variants_are_masked(card):
+    text, matches = CARDS.sanitize(f"card {card} on file")
+
+    assert [m.value for m in matches] == [card]
+    assert card not in text
+    assert text.startswith("card ****")
+    assert text.endswith(f"{card[-4:]} on file")
+
+
+@pytest.mark.parametrize("text", [
+    "4111 1111 1111 1112",          # fails Luhn
+    "order 1234 5678 9012 3456",
+    "ORD-12345678 and #1234567890",
+    "v1.2.3 from 10.0.0.1",
+    "call +1 555-123-4567",
+    "x4111111111111111",            # glued to a word
+])
+def test_card_negatives_are_left_alone(text):
+    assert CARDS.sanitize(text) == (text, [])
+
+
+def test_luhn():
+    assert luhn_valid("4111 1111 1111 1111")
+    assert luhn_valid("4111\t1111-1111 1111")
+    assert not luhn_valid("4111 1111 1111 1112")
+    assert not luhn_valid("411111111111")           # too short
+    assert not luhn_valid("4111 1111 1111 111x")
+
+
+EMAILS = PIIScanner({"email": "redact"})
+
+
+@pytest.mark.parametrize("email", [
+    "krishna_001@abc.com",
+    "first.last+orders@mail.example.co.uk",
+    "x-y@d-omain.io",
+    "Bob@Example.ORG",
+])
+def test_email_positives(email):
+    text, matches = EMAILS.sanitize(f"mail ({email}), thanks")
+
+    assert [m.value for m in matches] == [email]
+    assert text == "mail ([REDACTED_EMAIL]), thanks"
+
+
+@pytest.mark.parametrize("text", [
+    "@support",
+    "user@localhost",
+    "name (at) example.com",
+    "a@b",
+])
+def test_email_negatives(text):
+    assert EMAILS.sanitize(text) == (text, [])
+
+
+def test_one_pass_covers_both_types():
+    scanner = PIIScanner({"credit_card": "mask", "email": "redact"})
+
+    text, matches = scanner.sanitize("a@b.com 4111111111111111")
+
+    assert text == "[REDACTED_EMAIL] ************1111"
+    assert [m.type for m in matches] == ["email", "credit_card"]
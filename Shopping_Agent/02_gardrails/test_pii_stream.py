@@ -0,0 +1,53 @@
+"""Streaming redaction must match whole-text redaction (pii_stream.py)."""
+
+import random
+
+import pytest
+
+from pii_scanner import PIIScanner
+from pii_stream import StreamingRedactor
+
+STRATEGIES = {"credit_card": "mask", "email": "redact"}
+
+TEXT = (
+    "Hi, I'm krishna_001@abc.com. My card is 4111-1111-1111-1111, the backup is "
+    "5500 0000 0000 0004 and the old one 4111 1111-1111 1111.\n"
+    "Amex 3782 822463 10005, tab card 4111\t1111\t1111\t1111, "
+    "order 1234 5678 9012 3456 (not a card), ticket #1234567890, v1.2.3. "
+    "Reach first.last+orders@mail.example.co.uk or ops@xyz.com. 41111111 11111111"
+)
+
+
+def _stream(text: str, sizes) -> str:
+    redactor = StreamingRedactor(PIIScanner(STRATEGIES))
+    out, pos = [], 0
+    for size in sizes:
+        out.append(redactor.feed(text[pos:pos + size]))
+        pos += size
+    out.append(redactor.feed(text[pos:]))
+    out.append(redactor.flush())
+    return "".join(out)
+
+
+@pytest.mark.parametrize("seed", range(50))
+def test_random_chunk_boundaries_match_whole_text(seed):
+    rng = random.Random(seed)
+    sizes = [rng.randint(1, 12) for _ in range(len(TEXT))]
+
+    assert _stream(TEXT, sizes) == PIIScanner(STRATEGIES).sanitize(TEXT)[0]
+
+
+@pytest.mark.parametrize("size", [1, 2, 3, 7])
+def test_fixed_chunk_sizes_match_whole_text(size):
+    sizes = [size] * (len(TEXT) // size)
+
+    assert _stream(TEXT, sizes) == PIIScanner(STRATEGIES).sanitize(TEXT)[0]
+
+
+def test_card_split_across_chunks_never_leaks():
+    redactor = StreamingRedactor(PIIScanner(STRATEGIES))
+
+    released = redactor.feed("card 4111-11") + redactor.feed("11-1111-1111 ok")
+
+    assert "4111" not in released
+    assert (released + redactor.flush()) == "card ****-****-****-1111 ok"